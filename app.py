@@ -4,18 +4,34 @@ Main Streamlit Application
 """
 
 import streamlit as st
-import json
+import pandas as pd
+import asyncio
+import copy
+import hashlib
+import orjson
 import os
+import re
+import time
 import logging
+import threading
+import traceback
+from collections import OrderedDict
 from pathlib import Path
 from dotenv import load_dotenv
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from datetime import datetime
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
 
 # Import custom modules
+# The Gemini and Asana SDKs are slow to import, so their wrappers are loaded
+# on first use inside get_gemini_analyzer() / get_asana_client()
 from src.pdf_processor import PDFProcessor
-from src.gemini_analyzer import GeminiAnalyzer
-from src.asana_client import AsanaTaskCreator
+
+if TYPE_CHECKING:
+    from src.gemini_analyzer import GeminiAnalyzer, TranscriptAnalysis
+    from src.asana_client import AsanaTaskCreator
 
 # Load environment variables
 load_dotenv()
@@ -54,447 +70,587 @@ def init_session_state():
         st.session_state.meeting_title = 'Meeting'
     if 'recording_link' not in st.session_state:
         st.session_state.recording_link = ''
+    if 'last_pdf_hash' not in st.session_state:
+        st.session_state.last_pdf_hash = None
+    if 'batch_jobs' not in st.session_state:
+        st.session_state.batch_jobs = []
+    if 'pending_quick_tasks' not in st.session_state:
+        st.session_state.pending_quick_tasks = []
+    if 'quick_task_batches' not in st.session_state:
+        st.session_state.quick_task_batches = []
+    if 'extraction' not in st.session_state:
+        st.session_state.extraction = None  # (content hash, Future) of a running PDF extraction
 
 init_session_state()
 
-def load_customers() -> Dict:
-    """Load customer configuration from JSON file"""
-    try:
-        with open('customers.json', 'r') as f:
-            data = json.load(f)
-            return data.get('customers', {})
-    except FileNotFoundError:
-        st.error("customers.json file not found. Please create it from the template.")
-        return {}
-    except json.JSONDecodeError:
-        st.error("Invalid JSON in customers.json file.")
-        return {}
+CONFIG_PATH = 'config.json'
 
-def load_departments() -> Dict:
-    """Load department configuration from JSON file"""
-    try:
-        with open('departments.json', 'r') as f:
-            data = json.load(f)
-            return data.get('departments', {})
-    except FileNotFoundError:
-        st.error("departments.json file not found. Please create it from the template.")
-        return {}
-    except json.JSONDecodeError:
-        st.error("Invalid JSON in departments.json file.")
-        return {}
+# Label for the current selection in the Quick Task panel, by meeting type
+CONTEXT_LABELS = {
+    'sales_call': "📊 Customer",
+    'internal_meeting': "🏢 Department",
+    'existing_customer': "🔄 Existing",
+}
+DEFAULT_CONTEXT_LABEL = "📁 Project"
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Inference tiers offered for transcript analysis; Flex routes it through the Batch API
+FLEX_TIER = "Flex"
+INFERENCE_TIERS = ("Standard", FLEX_TIER)
+
+# Finished transcript analyses and quick task interpretations kept for reruns
+# and repeat input
+ANALYSIS_STORE_MAX_ENTRIES = 64
+QUICK_TASK_STORE_MAX_ENTRIES = 32
+RESULT_STORE_TTL_SECONDS = 3600
+
+# How often the extraction status fragment checks on a background PDF extraction
+EXTRACTION_POLL_SECONDS = 1.0
+
+# PDF extractions run at once in this process; PyMuPDF calls still take turns
+# page by page, while the pure-Python fallbacks run side by side
+EXTRACTION_MAX_WORKERS = 4
+
+# ActionItem fields kept in session state and passed on to Asana
+ACTION_ITEM_FIELDS = {'title', 'description', 'priority', 'timestamp', 'is_question'}
+
+# Batch job states that won't change any more
+BATCH_DONE_STATES = ('JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED', 'JOB_STATE_CANCELLED', 'JOB_STATE_EXPIRED')
+
+@st.cache_data(ttl=300)
+def _read_config(path: str, mtime: float) -> Dict:
+    """
+    Read and parse the app config file
+    
+    The file's modification time is part of the cache key, so edits to the
+    config are picked up on the next rerun without a restart.
+    """
+    return orjson.loads(Path(path).read_bytes())
 
-def load_projects() -> Dict:
-    """Load projects configuration from JSON file"""
+def load_config() -> Dict:
+    """Load the combined customers/departments/projects/existing customers configuration"""
     try:
-        with open('projects.json', 'r') as f:
-            data = json.load(f)
-            return data.get('projects', {})
+        return _read_config(CONFIG_PATH, os.path.getmtime(CONFIG_PATH))
     except FileNotFoundError:
-        st.error("projects.json file not found. Please create it from the template.")
+        st.error(f"{CONFIG_PATH} file not found. Please create it from the template.")
         return {}
-    except json.JSONDecodeError:
-        st.error("Invalid JSON in projects.json file.")
+    except orjson.JSONDecodeError:
+        st.error(f"Invalid JSON in {CONFIG_PATH} file.")
         return {}
 
-def load_existing_customers() -> Dict:
-    """Load existing customers configuration from JSON file"""
+def env_flag(name: str) -> bool:
+    """Whether an optional on/off environment variable is switched on"""
+    return os.getenv(name, '').lower() in ('1', 'true', 'yes')
+
+@st.cache_resource(show_spinner=False)
+def get_asana_client() -> "AsanaTaskCreator":
+    """Get the shared Asana client, created once per server process"""
+    from src.asana_client import AsanaTaskCreator
+    return AsanaTaskCreator()
+
+@st.cache_resource(show_spinner=False)
+def get_gemini_analyzer() -> "GeminiAnalyzer":
+    """
+    Get the shared Gemini analyzer, created once per server process
+    
+    Set GEMINI_SEMANTIC_CACHE=true to also reuse analyses of near-identical
+    transcripts; identical ones are already served by analyze_transcript_cached.
+    Set GEMINI_CONTEXT_CACHE=true to serve the fixed part of transcript prompts
+    from explicit Gemini context caches.
+    """
+    from src.gemini_analyzer import GeminiAnalyzer
+    semantic_cache = None
+    if env_flag('GEMINI_SEMANTIC_CACHE'):
+        from src.llm_cache import SemanticCache
+        semantic_cache = SemanticCache()
+    return GeminiAnalyzer(semantic_cache=semantic_cache, context_caching=env_flag('GEMINI_CONTEXT_CACHE'))
+
+def file_hash(data) -> str:
+    """
+    Short content hash used to key cached work on uploaded files
+    
+    Accepts bytes or a seekable file object; file objects are hashed in
+    chunks and rewound afterwards.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    digest = hashlib.blake2b(digest_size=16)
+    data.seek(0)
+    for chunk in iter(lambda: data.read(65536), b''):
+        digest.update(chunk)
+    data.seek(0)
+    return digest.hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def extract_pdf_cached(content_hash: str, _pdf_file) -> Tuple[str, str]:
+    """
+    Extract text from a PDF, memoized on the file content hash
+    
+    Reruns with the same upload are served from the cache instead of
+    parsing the PDF again. The file (bytes or file object) is left
+    unhashed by Streamlit; content_hash stands in for it in the cache key.
+    """
+    return PDFProcessor().extract_text(_pdf_file)
+
+@st.cache_resource(show_spinner=False)
+def get_extraction_executor() -> ThreadPoolExecutor:
+    """
+    Threads for PDF extractions that outlive a single rerun, shared across sessions
+    
+    Bounded by EXTRACTION_MAX_WORKERS so a burst of uploads queues rather
+    than starting a thread per PDF.
+    """
+    return ThreadPoolExecutor(max_workers=EXTRACTION_MAX_WORKERS, thread_name_prefix="pdf-extraction")
+
+@st.cache_resource(show_spinner=False)
+def get_warm_up_executor() -> ThreadPoolExecutor:
+    """Thread for warming up API clients, kept apart so it never queues behind an extraction"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="warm-up")
+
+def warm_up_gemini() -> None:
+    """
+    Create the shared Gemini analyzer ahead of its first use
+    
+    Runs alongside PDF extraction so client setup is hidden behind the
+    parse. A failed warm-up is ignored here; it resurfaces when the
+    analyzer is actually used.
+    """
     try:
-        with open('existing_customers.json', 'r') as f:
-            data = json.load(f)
-            return data.get('existing_customers', {})
-    except FileNotFoundError:
-        st.error("existing_customers.json file not found. Please create it from the template.")
-        return {}
-    except json.JSONDecodeError:
-        st.error("Invalid JSON in existing_customers.json file.")
-        return {}
+        get_gemini_analyzer()
+    except Exception as e:
+        logger.warning(f"Gemini warm-up failed: {e}")
 
-def check_api_keys() -> tuple:
-    """Check if required API keys are configured"""
-    asana_token = os.getenv('ASANA_ACCESS_TOKEN')
-    gemini_key = os.getenv('GEMINI_API_KEY')
+def transcript_hash(text: str) -> str:
+    """Short content hash used to key cached transcript analyses"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+@st.cache_resource(show_spinner=False)
+def get_result_store(kind: str) -> Tuple["OrderedDict[Tuple[str, ...], Tuple[float, Any]]", threading.Lock]:
+    """
+    Stored results of one kind and the lock guarding them, shared across sessions
     
-    missing_keys = []
-    if not asana_token:
-        missing_keys.append("ASANA_ACCESS_TOKEN")
-    if not gemini_key:
-        missing_keys.append("GEMINI_API_KEY")
+    Entries map a key to (time stored, result). Used instead of st.cache_data
+    where some results must not be kept (failed or fallback ones) or where
+    computing a result draws on the page, since element calls made in a
+    cached function are replayed on every hit.
+    """
+    return OrderedDict(), threading.Lock()
+
+def stored_result(kind: str, key: Tuple[str, ...]) -> Optional[Any]:
+    """Copy of the result stored under key in the last RESULT_STORE_TTL_SECONDS, if any"""
+    entries, lock = get_result_store(kind)
+    with lock:
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > RESULT_STORE_TTL_SECONDS:
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+def store_result(kind: str, key: Tuple[str, ...], result: Any, max_entries: int) -> None:
+    """Keep a result, dropping the least recently used ones past max_entries"""
+    entries, lock = get_result_store(kind)
+    with lock:
+        entries[key] = (time.monotonic(), copy.deepcopy(result))
+        entries.move_to_end(key)
+        while len(entries) > max_entries:
+            entries.popitem(last=False)
+
+def analyze_transcript_cached(text_hash: str,
+                              customer: str,
+                              meeting_type: str,
+                              recording_link: str,
+                              department: str,
+                              project: str,
+                              context: str,
+                              transcript: str) -> "TranscriptAnalysis":
+    """
+    Analyze a transcript with Gemini, reusing a stored result for the same transcript hash and settings
     
-    return len(missing_keys) == 0, missing_keys
+    A fresh analysis lists action items on the page as they stream in; a
+    stored one is returned without touching the page.
+    """
+    key = (text_hash, customer, meeting_type, recording_link, department, project, context)
+    analysis = stored_result("analyses", key)
+    if analysis is not None:
+        return analysis
+    
+    analyzer = get_gemini_analyzer()
+    
+    # List action items as each one completes in the stream, then clear the list once parsed
+    live_output = st.empty()
+    live_output.caption("Receiving analysis from Gemini...")
+    titles = []
+    
+    def show_item(item):
+        titles.append(item.title)
+        live_output.markdown(
+            f"Receiving analysis from Gemini... {len(titles)} action item(s) so far:\n\n"
+            + "\n".join(f"- {title}" for title in titles)
+        )
+    
+    def restart():
+        titles.clear()
+        live_output.caption("Gemini is taking another pass at the transcript...")
+    
+    analysis = analyzer.analyze_transcript_live(
+        transcript,
+        customer,
+        context,
+        meeting_type=meeting_type,
+        recording_link=recording_link,
+        department=department,
+        project=project,
+        on_action_item=show_item,
+        on_restart=restart,
+        on_retry=lambda attempt, delay, error: st.toast(
+            f"Gemini is busy, retrying in {delay:.0f}s (attempt {attempt})", icon="⏳"
+        )
+    )
+    live_output.empty()
+    
+    # Don't store failed analyses so the user can retry
+    if not analysis.action_items and analysis.summary.startswith("Error"):
+        raise RuntimeError(analysis.summary)
+    
+    store_result("analyses", key, analysis, ANALYSIS_STORE_MAX_ENTRIES)
+    return analysis
 
-def main():
-    """Main application logic"""
+@st.cache_data(show_spinner=False, max_entries=16)
+def analyze_image_cached(image_hash: str,
+                         mime_type: str,
+                         customer: str,
+                         meeting_type: str,
+                         context: str,
+                         _image_bytes: bytes) -> str:
+    """Extract tasks from an image with Gemini, memoized on the image hash and settings"""
+    image_file = BytesIO(_image_bytes)
+    image_file.type = mime_type  # Read by the analyzer to build the inline_data mime type
+    return get_gemini_analyzer().analyze_image_for_tasks(image_file, customer, meeting_type, context)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def analyze_pdf_cached(text_hash: str,
+                       customer: str,
+                       meeting_type: str,
+                       context: str,
+                       _pdf_text: str) -> str:
+    """Extract tasks from PDF text with Gemini, memoized on the text hash and settings"""
+    return get_gemini_analyzer().analyze_pdf_for_tasks(_pdf_text, customer, meeting_type, context)
+
+def interpret_quick_tasks_cached(task_input: str,
+                                 context_name: str,
+                                 context_type: str) -> List[Dict[str, str]]:
+    """
+    Interpret quick task text with Gemini, reusing a stored result for the same text and context
     
-    # Header
-    st.title("📄 Asana Opus")
-    st.subheader("AI-Powered Meeting Transcript to Task Converter")
+    Results holding a plain fallback task (Gemini failed for some of the
+    input) aren't stored, so the next attempt asks Gemini again.
+    """
+    key = (task_input, context_name, context_type)
+    tasks = stored_result("quick_tasks", key)
+    if tasks is not None:
+        return tasks
     
-    # Check API keys
-    keys_valid, missing_keys = check_api_keys()
-    if not keys_valid:
-        st.error(f"Missing API keys in .env file: {', '.join(missing_keys)}")
-        st.info("Please copy .env.example to .env and add your API keys.")
-        st.stop()
+    fallbacks = []
+    tasks = get_gemini_analyzer().interpret_quick_tasks(
+        task_input, context_name, context_type, on_fallback=fallbacks.append
+    )
+    if not fallbacks:
+        store_result("quick_tasks", key, tasks, QUICK_TASK_STORE_MAX_ENTRIES)
+    return tasks
+
+async def _probe_asana() -> Tuple[str, bool, Optional[str]]:
+    """Check the Asana connection, returning (name, ok, error)"""
+    try:
+        asana_client = await asyncio.to_thread(get_asana_client)
+        return "Asana", await asyncio.to_thread(asana_client.test_connection), None
+    except Exception as e:
+        return "Asana", False, str(e)
+
+async def _probe_gemini() -> Tuple[str, bool, Optional[str]]:
+    """Check the Gemini connection, returning (name, ok, error)"""
+    try:
+        gemini_client = await asyncio.to_thread(get_gemini_analyzer)
+        return "Gemini", await asyncio.to_thread(gemini_client.test_connection), None
+    except Exception as e:
+        return "Gemini", False, str(e)
+
+def run_concurrently(*coros) -> List:
+    """Run coroutines concurrently from the script thread and return their results in order"""
+    async def _gather():
+        return await asyncio.gather(*coros)
+    return asyncio.run(_gather())
+
+def run_connection_probes() -> List[Tuple[str, bool, Optional[str]]]:
+    """Run the Asana and Gemini connection checks concurrently"""
+    return run_concurrently(_probe_asana(), _probe_gemini())
+
+def analysis_context(config: Dict, meeting_type: str, selected_customer: str) -> Tuple[str, str, str]:
+    """
+    Department, project and configured context for analyzing a transcript
     
-    # Load customers, departments, projects, and existing customers
-    customers = load_customers()
-    departments = load_departments()
-    projects = load_projects()
-    existing_customers = load_existing_customers()
-    if not customers or not departments:
-        st.stop()
+    Department is passed for internal meetings, project for project meetings,
+    and the selection's configured context for every meeting type.
     
-    # Sidebar configuration
-    with st.sidebar:
-        st.header("Configuration")
-        
-        # Meeting type selection
-        meeting_type = st.radio(
-            "Meeting Type",
-            ["Sales Call", "Internal Meeting", "Project Meeting", "Existing Customer"],
-            help="Select the type of meeting transcript"
+    Returns:
+        Tuple of (department, project, additional_context)
+    """
+    if meeting_type == "internal_meeting":
+        department, project, section = selected_customer, "", 'departments'
+    elif meeting_type == "project_meeting":
+        department, project, section = "", selected_customer, 'projects'
+    elif meeting_type == "existing_customer":
+        department, project, section = "", "", 'existing_customers'
+    elif meeting_type == "sales_call":
+        department, project, section = "", "", 'customers'
+    else:
+        return "", "", ""
+    
+    additional_context = config.get(section, {}).get(selected_customer, {}).get('context', '')
+    return department, project, additional_context
+
+def action_items_from_analysis(analysis: "TranscriptAnalysis") -> List[Dict]:
+    """Action item dicts, as kept in session state, from a transcript analysis"""
+    action_items = [item.model_dump(include=ACTION_ITEM_FIELDS) for item in analysis.action_items]
+    for item in action_items:
+        item['priority'] = item['priority'] or 'medium'
+    return action_items
+
+def queue_transcript_batch(config: Dict, selected_customer: str, recording_link: str, label: str) -> bool:
+    """
+    Queue the extracted transcript for analysis on the Gemini Batch API
+    
+    Returns:
+        True if the job was queued
+    """
+    try:
+        department, project, additional_context = analysis_context(
+            config, st.session_state.meeting_type, selected_customer
         )
-        st.session_state.meeting_type = meeting_type.lower().replace(" ", "_")
-        
-        # Customer/Department/Project selection based on meeting type
-        if st.session_state.meeting_type == "sales_call":
-            customer_names = list(customers.keys())
-            selected_customer = st.selectbox(
-                "Select Customer",
-                customer_names,
-                help="Choose the customer for task creation"
-            )
-            
-            if selected_customer:
-                customer_info = customers[selected_customer]
-                project_id = customer_info.get('asana_project_id', '')
-                
-                if project_id == 'YOUR_ASANA_PROJECT_ID_HERE':
-                    st.warning("Please configure the Asana project ID in customers.json")
-                else:
-                    st.success(f"Customer: {selected_customer} | Project ID: {project_id[:8]}...")
-                    
-        elif st.session_state.meeting_type == "internal_meeting":
-            # Internal meeting - select department
-            department_names = list(departments.keys())
-            selected_department = st.selectbox(
-                "Select Department",
-                department_names,
-                help="Choose the department for task creation"
-            )
-            
-            if selected_department:
-                department_info = departments[selected_department]
-                project_id = department_info.get('asana_project_id', '')
-                selected_customer = selected_department  # Use department name as customer for consistency
-                
-                if project_id.startswith('YOUR_'):
-                    st.warning(f"Please configure the Asana project ID for {selected_department} in departments.json")
-                else:
-                    st.success(f"Department: {selected_department} | Project ID: {project_id[:8]}...")
-                    
-        elif st.session_state.meeting_type == "project_meeting":
-            # Project meeting - select project
-            project_names = list(projects.keys())
-            selected_project = st.selectbox(
-                "Select Project",
-                project_names,
-                help="Choose the project for task creation"
-            )
+        job_name = get_gemini_analyzer().submit_transcript_batch([{
+            'transcript': st.session_state.extracted_text,
+            'customer_name': selected_customer,
+            'additional_context': additional_context if additional_context else f"Meeting transcript for {selected_customer}",
+            'meeting_type': st.session_state.meeting_type,
+            'department': department,
+            'project': project
+        }])
+        st.session_state.batch_jobs.append({
+            'name': job_name,
+            'label': f"{label} - {selected_customer}",
+            'recording_link': recording_link,
+            'state': 'JOB_STATE_PENDING',
+            'analysis': None
+        })
+        st.success("✅ Queued for batch analysis")
+        return True
+    except Exception as e:
+        st.error(f"Error queueing batch analysis: {str(e)}")
+        return False
+
+def render_batch_jobs():
+    """
+    List queued batch analyses, polling the ones still running
+    
+    Finished jobs keep their analysis in session state and can be loaded
+    into the action item list like an interactive analysis.
+    """
+    if not st.session_state.batch_jobs:
+        return
+    
+    with st.expander(f"🗂️ Batch analyses ({len(st.session_state.batch_jobs)})", expanded=True):
+        for index, job in enumerate(st.session_state.batch_jobs):
+            if job['analysis'] is None and job['state'] not in BATCH_DONE_STATES:
+                try:
+                    job['state'], analyses = get_gemini_analyzer().get_transcript_batch(job['name'])
+                    if analyses:
+                        job['analysis'] = analyses[0]
+                except Exception as e:
+                    logger.warning(f"Could not poll batch job {job['name']}: {e}")
             
-            if selected_project:
-                project_info = projects[selected_project]
-                project_id = project_info.get('asana_project_id', '')
-                selected_customer = selected_project  # Use project name as customer for consistency
-                
-                if project_id.startswith('YOUR_'):
-                    st.warning(f"Please configure the Asana project ID for {selected_project} in projects.json")
-                else:
-                    st.success(f"Project: {selected_project} | Project ID: {project_id[:8]}...")
-                    
-        else:  # existing_customer
-            # Existing customer - select from existing customers
-            existing_customer_names = list(existing_customers.keys())
-            selected_existing_customer = st.selectbox(
-                "Select Existing Customer",
-                existing_customer_names,
-                help="Choose the existing customer for escalation/task creation"
-            )
+            state_label = job['state'].replace('JOB_STATE_', '').title()
+            st.write(f"**{job['label']}** - {state_label}")
             
-            if selected_existing_customer:
-                existing_customer_info = existing_customers[selected_existing_customer]
-                project_id = existing_customer_info.get('asana_project_id', '')
-                selected_customer = selected_existing_customer  # Use existing customer name for consistency
-                
-                if project_id == 'YOUR_ASANA_PROJECT_ID_HERE':
-                    st.warning(f"Please configure the Asana project ID for {selected_existing_customer} in existing_customers.json")
-                else:
-                    st.success(f"Existing Customer: {selected_existing_customer} | Project ID: {project_id[:8]}...")
-        
-        st.divider()
-        
-        # Processing options
-        st.subheader("Options")
-        auto_process = st.checkbox(
-            "Auto-process on upload",
-            value=True,
-            help="Automatically analyze transcript when uploaded"
-        )
-        
-        show_extracted_text = st.checkbox(
-            "Show extracted text",
-            value=False,
-            help="Display the raw extracted text from PDF"
-        )
+            if job['analysis'] is not None and st.button("Load results", key=f"load_batch_{index}"):
+                st.session_state.action_items = action_items_from_analysis(job['analysis'])
+                st.session_state.meeting_title = job['analysis'].meeting_title
+                st.session_state.recording_link = job['recording_link']
+                st.session_state.processing_status = 'analyzed'
+                st.rerun()
+
+def create_quick_task_batch_results(submissions: List[Dict], task_lists: List[List[Dict]]) -> List[Dict]:
+    """
+    Create the Asana tasks interpreted by a finished quick task batch
+    
+    Args:
+        submissions: Queued entries, in the order they were submitted
+        task_lists: Interpreted tasks per entry, from get_quick_task_batch()
         
-        st.divider()
+    Returns:
+        All created task details
+    """
+    asana_client = get_asana_client()
+    created_tasks = []
+    for submission, tasks in zip(submissions, task_lists):
+        if not tasks:
+            logger.warning(f"No tasks interpreted for queued entry: {submission['task_input'][:50]}")
+            continue
+        created_tasks.extend(asana_client.create_tasks(
+            dedupe_action_items(tasks),
+            submission['project_id'],
+            section_name=submission['section_name'],
+            meeting_context=f"Quick Task - {submission['context_name']}"
+        ))
+    return created_tasks
+
+def render_quick_task_batches():
+    """
+    Show queued quick task entries and their batch jobs
+    
+    Running jobs are polled on each rerun; when one succeeds its tasks are
+    created in Asana straight away.
+    """
+    pending = st.session_state.pending_quick_tasks
+    batches = st.session_state.quick_task_batches
+    if not pending and not batches:
+        return
+    
+    with st.expander("🗂️ Quick task batches", expanded=True):
+        if pending:
+            st.write(f"{len(pending)} queued entr(ies) not yet submitted")
+            if st.button("Submit queued quick tasks", key="submit_quick_task_batch"):
+                try:
+                    job_name = get_gemini_analyzer().submit_quick_task_batch(pending)
+                    batches.append({
+                        'name': job_name,
+                        'submissions': list(pending),
+                        'state': 'JOB_STATE_PENDING',
+                        'created': None
+                    })
+                    pending.clear()
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"Error submitting quick task batch: {str(e)}")
         
-        # Connection test
-        if st.button("Test Connections"):
-            with st.spinner("Testing connections..."):
+        for job in batches:
+            if job['created'] is None and job['state'] not in BATCH_DONE_STATES:
                 try:
-                    # Test Asana
-                    asana_client = AsanaTaskCreator()
-                    if asana_client.test_connection():
-                        st.success("✅ Asana connection successful")
-                    else:
-                        st.error("❌ Asana connection failed")
-                    
-                    # Test Gemini
-                    gemini_client = GeminiAnalyzer()
-                    st.success("✅ Gemini API key configured")
-                    
+                    job['state'], task_lists = get_gemini_analyzer().get_quick_task_batch(job['name'])
+                    if task_lists is not None:
+                        job['created'] = []  # Marks the results as handled even if creation fails
+                        job['created'] = create_quick_task_batch_results(job['submissions'], task_lists)
                 except Exception as e:
-                    st.error(f"Connection test failed: {str(e)}")
+                    logger.warning(f"Could not process quick task batch {job['name']}: {e}")
+            
+            state_label = job['state'].replace('JOB_STATE_', '').title()
+            st.write(f"**{len(job['submissions'])} entr(ies)** - {state_label}")
+            if job['created']:
+                st.markdown(created_tasks_markdown(job['created']))
+
+def dedupe_action_items(action_items: List[Dict]) -> List[Dict]:
+    """
+    Drop action items whose titles match once case and whitespace are normalized
     
-    # Main content area
-    col1, col2 = st.columns([1, 1])
+    The first occurrence keeps its position; when duplicates disagree, the
+    one with the longest description is kept.
     
-    with col1:
-        st.header("1️⃣ Upload Transcript")
-        
-        # File uploader
-        uploaded_file = st.file_uploader(
-            "Choose a PDF file",
-            type=['pdf'],
-            help="Upload a meeting transcript PDF from Grain, Gong, or similar tools"
-        )
-        
-        # Recording link input
-        recording_link = st.text_input(
-            "Recording Link",
-            placeholder="https://grain.com/share/recording/...",
-            help="Paste the link to the meeting recording (Grain, Gong, Zoom, etc.)"
-        )
+    Args:
+        action_items: Action item dicts with at least a 'title' key
         
-        if uploaded_file is not None:
-            # Display file info
-            file_size_mb = uploaded_file.size / (1024 * 1024)
-            st.info(f"📎 {uploaded_file.name} ({file_size_mb:.2f} MB)")
-            
-            # Validate recording link
-            if not recording_link:
-                st.warning("⚠️ Please provide a recording link for reference")
-            
-            # Process button or auto-process
-            if auto_process or st.button("Process Transcript", type="primary"):
-                st.session_state.processing_status = 'processing'
-                
-                # Process the PDF
-                with st.spinner("Extracting text from PDF..."):
-                    try:
-                        # Read file content
-                        file_content = uploaded_file.read()
-                        
-                        # Create PDFProcessor instance
-                        pdf_processor = PDFProcessor()
-                        is_valid, error_msg = pdf_processor.validate_file(file_content, uploaded_file.name)
-                        
-                        if not is_valid:
-                            st.error(f"Invalid file: {error_msg}")
-                            st.session_state.processing_status = 'error'
-                        else:
-                            extracted_text, method = pdf_processor.extract_text(file_content)
-                            
-                            if extracted_text:
-                                st.session_state.extracted_text = extracted_text
-                                st.success(f"✅ Text extracted successfully using {method}")
-                                
-                                if show_extracted_text:
-                                    with st.expander("View Extracted Text"):
-                                        st.text(extracted_text[:2000] + "..." if len(extracted_text) > 2000 else extracted_text)
-                            else:
-                                st.error("Failed to extract text from PDF")
-                                st.session_state.processing_status = 'error'
-                    
-                    except Exception as e:
-                        import traceback
-                        error_details = traceback.format_exc()
-                        logger.error(f"PDF processing error: {error_details}")
-                        st.error(f"Error processing PDF: {str(e)}")
-                        st.session_state.processing_status = 'error'
+    Returns:
+        Deduplicated list of action items
+    """
+    unique: Dict[bytes, Dict] = {}
+    for item in action_items:
+        normalized = WHITESPACE_RE.sub(' ', item.get('title', '')).strip().lower()
+        fingerprint = hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest()
+        kept = unique.get(fingerprint)
+        if kept is None:
+            unique[fingerprint] = item
+        elif len(item.get('description', '')) > len(kept.get('description', '')):
+            unique[fingerprint] = item
     
-    with col2:
-        st.header("2️⃣ AI Analysis")
-        
-        if st.session_state.extracted_text:
-            if st.button("Analyze with AI", type="primary") or (auto_process and st.session_state.processing_status == 'processing'):
-                with st.spinner("Analyzing transcript with Gemini AI..."):
-                    try:
-                        # Store recording link in session state
-                        st.session_state.recording_link = recording_link
-                        
-                        # Analyze transcript
-                        analyzer = GeminiAnalyzer()
-                        # Pass department for internal meetings, project for project meetings, context for existing customers and sales calls
-                        if st.session_state.meeting_type == "internal_meeting":
-                            department = selected_customer
-                            project = ""
-                            # Get department-specific context from departments.json
-                            department_info = departments.get(selected_customer, {})
-                            additional_context = department_info.get('context', '')
-                        elif st.session_state.meeting_type == "project_meeting":
-                            department = ""
-                            project = selected_customer
-                            # Get project-specific context from projects.json
-                            project_info = projects.get(selected_customer, {})
-                            additional_context = project_info.get('context', '')
-                        elif st.session_state.meeting_type == "existing_customer":
-                            department = ""
-                            project = ""
-                            # Get customer-specific context from existing_customers.json
-                            existing_customer_info = existing_customers.get(selected_customer, {})
-                            additional_context = existing_customer_info.get('context', '')
-                        elif st.session_state.meeting_type == "sales_call":
-                            department = ""
-                            project = ""
-                            # Get customer-specific context from customers.json for sales calls
-                            customer_info = customers.get(selected_customer, {})
-                            additional_context = customer_info.get('context', '')
-                        else:
-                            department = ""
-                            project = ""
-                            additional_context = ""
-                        
-                        analysis = analyzer.analyze_transcript(
-                            st.session_state.extracted_text,
-                            selected_customer,
-                            additional_context if additional_context else f"Meeting transcript for {selected_customer}",
-                            meeting_type=st.session_state.meeting_type,
-                            recording_link=recording_link,
-                            department=department,
-                            project=project
-                        )
-                        
-                        # Store action items
-                        st.session_state.action_items = [
-                            {
-                                'title': item.title,
-                                'description': item.description,
-                                'priority': item.priority or 'medium',
-                                'timestamp': getattr(item, 'timestamp', None),
-                                'is_question': getattr(item, 'is_question', False)
-                            }
-                            for item in analysis.action_items
-                        ]
-                        
-                        # Display results
-                        st.success(f"✅ Found {len(analysis.action_items)} action items")
-                        
-                        # Show meeting title
-                        if hasattr(analysis, 'meeting_title'):
-                            st.subheader("Meeting Title")
-                            st.write(analysis.meeting_title)
-                            st.session_state.meeting_title = analysis.meeting_title
-                        
-                        # Show summary
-                        if analysis.summary:
-                            st.subheader("Meeting Summary")
-                            st.write(analysis.summary)
-                        
-                        # Show participants
-                        if analysis.participants:
-                            st.subheader("Participants")
-                            st.write(", ".join(analysis.participants))
-                        
-                        # Show key decisions
-                        if analysis.key_decisions:
-                            st.subheader("Key Decisions")
-                            for decision in analysis.key_decisions:
-                                st.write(f"• {decision}")
-                        
-                        st.session_state.processing_status = 'analyzed'
-                        
-                    except Exception as e:
-                        st.error(f"Error analyzing transcript: {str(e)}")
-                        st.session_state.processing_status = 'error'
-        else:
-            st.info("Upload and process a PDF first")
+    if len(unique) < len(action_items):
+        logger.info(f"Skipping {len(action_items) - len(unique)} duplicate action item(s)")
+    return list(unique.values())
+
+def created_tasks_markdown(created_tasks: List[Dict]) -> str:
+    """Bulleted list of created tasks, linked where Asana returned a URL, for one markdown render"""
+    return "\n\n".join(
+        f"• [{task['name']}]({task['permalink_url']})" if task.get('permalink_url') else f"• {task['name']}"
+        for task in created_tasks
+    )
+
+def file_info_line(icon: str, name: str, size: int) -> str:
+    """Format the name and size of an uploaded file for display"""
+    return f"{icon} {name} ({size / 1048576:.2f} MB)"
+
+def text_preview(text: str, limit: int) -> str:
+    """
+    Truncated preview of a long text, kept in session state
     
-    # Action Items Section
-    if st.session_state.action_items:
-        st.divider()
-        st.header("3️⃣ Action Items")
-        
-        # Display action items in a table-like format
-        for i, item in enumerate(st.session_state.action_items, 1):
-            with st.expander(f"{i}. {item['title']}", expanded=True):
-                st.write(f"**Description:** {item['description']}")
-                st.write(f"**Priority:** {item['priority']}")
-        
-        # Create tasks button
-        if st.button("Create Tasks in Asana", type="primary", use_container_width=True):
-            if project_id and not project_id.startswith('YOUR_'):
-                with st.spinner("Creating tasks in Asana..."):
-                    try:
-                        # Get current date for section naming
-                        from datetime import datetime
-                        current_date = datetime.now().strftime("%m/%d")
-                        
-                        # Create section name based on meeting type and title
-                        meeting_title = getattr(st.session_state, 'meeting_title', 'Meeting')
-                        section_name = f"{current_date} - {meeting_title}"
-                        
-                        # Create meeting context for task descriptions
-                        # Create appropriate context based on meeting type
-                        meeting_context = f"{current_date} - {selected_customer}: {meeting_title}"
-                        
-                        # Create tasks with section
-                        asana_client = AsanaTaskCreator()
-                        created_tasks = asana_client.create_tasks(
-                            st.session_state.action_items,
-                            project_id,
-                            section_name=section_name,
-                            meeting_context=meeting_context,
-                            recording_link=st.session_state.recording_link
-                        )
-                        
-                        st.session_state.created_tasks = created_tasks
-                        
-                        if created_tasks:
-                            st.success(f"✅ Successfully created {len(created_tasks)} tasks in Asana!")
-                            
-                            # Show created tasks with links
-                            st.subheader("Created Tasks")
-                            for task in created_tasks:
-                                if task.get('permalink_url'):
-                                    st.markdown(f"• [{task['name']}]({task['permalink_url']})")
-                                else:
-                                    st.write(f"• {task['name']}")
-                        else:
-                            st.error("No tasks were created. Please check the logs.")
-                        
-                    except Exception as e:
-                        st.error(f"Error creating tasks: {str(e)}")
-            else:
-                if st.session_state.meeting_type == "internal_meeting":
-                    st.error("Please configure the Asana project ID for this department in departments.json")
-                elif st.session_state.meeting_type == "project_meeting":
-                    st.error("Please configure the Asana project ID for this project in projects.json")
-                else:
-                    st.error("Please configure the Asana project ID for this customer in customers.json")
+    The preview is rebuilt only when a different text object is passed in,
+    so reruns over the same extracted text reuse the stored slice.
+    """
+    cache_key = f'text_preview_{limit}'
+    cached = st.session_state.get(cache_key)
+    if cached is None or cached[0] is not text:
+        preview = text[:limit] + "..." if len(text) > limit else text
+        st.session_state[cache_key] = (text, preview)
+    return st.session_state[cache_key][1]
+
+def image_thumbnail(uploaded_image, max_size: int = 800) -> bytes:
+    """
+    PNG preview of an uploaded image, built once per upload
     
-    # Quick Task Section
+    Only the preview is sent to the browser; the original bytes are still
+    what gets sent to Gemini.
+    """
+    cached = st.session_state.get('image_thumbnail')
+    if cached is None or cached[0] != uploaded_image.file_id:
+        with Image.open(uploaded_image) as img:
+            thumb = img.convert("RGBA") if img.mode not in ("RGB", "RGBA", "L", "LA") else img.copy()
+        uploaded_image.seek(0)
+        thumb.thumbnail((max_size, max_size))
+        buffer = BytesIO()
+        thumb.save(buffer, format="PNG")
+        st.session_state['image_thumbnail'] = (uploaded_image.file_id, buffer.getvalue())
+    return st.session_state['image_thumbnail'][1]
+
+@st.fragment(run_every=EXTRACTION_POLL_SECONDS)
+def extraction_status():
+    """
+    Show that a background PDF extraction is running
+    
+    Runs as a fragment polling every EXTRACTION_POLL_SECONDS, so only this
+    message reruns while the rest of the page stays rendered. Once the
+    extraction is done a full rerun picks up its result.
+    """
+    extraction = st.session_state.extraction
+    if extraction is None or extraction[1].done():
+        st.rerun()
+    st.info("⏳ Extracting text from PDF...")
+
+@st.fragment
+def quick_task_section(selected_customer: Optional[str],
+                       project_id: Optional[str],
+                       existing_customers: Dict,
+                       current_date: str):
+    """
+    Quick Task Creation section
+    
+    Runs as a fragment: typing, uploads and buttons in here rerun only this
+    section, not the sidebar, transcript columns and config loading.
+    
+    Args:
+        selected_customer: Customer/department/project selected in the sidebar
+        project_id: Asana project ID of the selection
+        existing_customers: Existing customer config, for per-customer context
+        current_date: Date used in quick task section names
+    """
     st.divider()
     st.header("⚡ Quick Task Creation")
     st.info("Create tasks directly from text, upload email screenshots, or upload PDF conversations for automatic task extraction")
@@ -531,27 +687,28 @@ def main():
         
         if uploaded_image is not None:
             # Display the uploaded image
-            st.image(uploaded_image, caption="Uploaded Image", use_column_width=True)
+            st.image(image_thumbnail(uploaded_image), caption="Uploaded Image", use_container_width=True)
             
             # Extract text from image button
             if st.button("🔍 Extract Tasks from Image", type="secondary"):
                 with st.spinner("Analyzing image..."):
                     try:
-                        analyzer = GeminiAnalyzer()
-                        
                         # Get the appropriate context based on meeting type
-                        if st.session_state.meeting_type == "existing_customer" and 'selected_customer' in locals():
+                        if st.session_state.meeting_type == "existing_customer" and selected_customer:
                             existing_customer_info = existing_customers.get(selected_customer, {})
                             customer_context = existing_customer_info.get('context', '')
                         else:
                             customer_context = ""
                         
                         # Analyze the image
-                        image_analysis = analyzer.analyze_image_for_tasks(
-                            uploaded_image,
-                            selected_customer if 'selected_customer' in locals() else "Unknown Customer",
+                        image_bytes = uploaded_image.getvalue()
+                        image_analysis = analyze_image_cached(
+                            file_hash(image_bytes),
+                            uploaded_image.type,
+                            selected_customer or "Unknown Customer",
                             st.session_state.meeting_type,
-                            customer_context
+                            customer_context,
+                            image_bytes
                         )
                         
                         # Store the extracted text in session state
@@ -590,44 +747,37 @@ def main():
         
         if uploaded_pdf is not None:
             # Display PDF info
-            file_size_mb = uploaded_pdf.size / (1024 * 1024)
-            st.info(f"📄 {uploaded_pdf.name} ({file_size_mb:.2f} MB)")
+            st.info(file_info_line("📄", uploaded_pdf.name, uploaded_pdf.size))
             
             # Extract tasks from PDF button
             if st.button("🔍 Extract Tasks from PDF", type="secondary"):
                 with st.spinner("Processing PDF and analyzing conversation..."):
                     try:
-                        # First extract text from PDF
-                        pdf_processor = PDFProcessor()
-                        # Convert UploadedFile to bytes
-                        pdf_bytes = uploaded_pdf.read()
-                        uploaded_pdf.seek(0)  # Reset file pointer
+                        # First extract text from PDF, reading the upload in place
                         # extract_text returns tuple (text, method_used)
-                        pdf_text, extraction_method = pdf_processor.extract_text(pdf_bytes)
+                        pdf_text, extraction_method = extract_pdf_cached(file_hash(uploaded_pdf), uploaded_pdf)
                         
                         if not pdf_text or pdf_text.strip() == "":
                             st.error("Could not extract text from PDF. Please try a different file.")
                         else:
                             # Show extracted text preview
                             with st.expander("📋 View Extracted Text", expanded=False):
-                                st.text_area("PDF Content", pdf_text[:3000] + "..." if len(pdf_text) > 3000 else pdf_text, height=200, disabled=True)
-                            
-                            # Analyze with Gemini
-                            analyzer = GeminiAnalyzer()
+                                st.text_area("PDF Content", text_preview(pdf_text, 3000), height=200, disabled=True)
                             
                             # Get the appropriate context based on meeting type
-                            if st.session_state.meeting_type == "existing_customer" and 'selected_customer' in locals():
+                            if st.session_state.meeting_type == "existing_customer" and selected_customer:
                                 existing_customer_info = existing_customers.get(selected_customer, {})
                                 customer_context = existing_customer_info.get('context', '')
                             else:
                                 customer_context = ""
                             
                             # Analyze the PDF conversation
-                            pdf_analysis = analyzer.analyze_pdf_for_tasks(
-                                pdf_text,
-                                selected_customer if 'selected_customer' in locals() else "Unknown Customer",
+                            pdf_analysis = analyze_pdf_cached(
+                                transcript_hash(pdf_text),
+                                selected_customer or "Unknown Customer",
                                 st.session_state.meeting_type,
-                                customer_context
+                                customer_context,
+                                pdf_text
                             )
                             
                             # Store the extracted tasks in session state
@@ -653,13 +803,54 @@ def main():
                     help="These tasks were extracted from your last PDF upload"
                 )
     
+    # With both an image and a PDF uploaded, analyze them in one concurrent pass
+    if uploaded_image is not None and uploaded_pdf is not None:
+        if st.button("🔍 Extract Tasks from Image and PDF", type="secondary"):
+            with st.spinner("Analyzing image and PDF conversation..."):
+                try:
+                    pdf_text, extraction_method = extract_pdf_cached(file_hash(uploaded_pdf), uploaded_pdf)
+                    
+                    # Get the appropriate context based on meeting type
+                    if st.session_state.meeting_type == "existing_customer" and selected_customer:
+                        existing_customer_info = existing_customers.get(selected_customer, {})
+                        customer_context = existing_customer_info.get('context', '')
+                    else:
+                        customer_context = ""
+                    context_name = selected_customer or "Unknown Customer"
+                    
+                    image_bytes = uploaded_image.getvalue()
+                    jobs = {
+                        'image_extracted_text': asyncio.to_thread(
+                            analyze_image_cached,
+                            file_hash(image_bytes), uploaded_image.type,
+                            context_name, st.session_state.meeting_type, customer_context,
+                            image_bytes
+                        )
+                    }
+                    if pdf_text.strip():
+                        jobs['pdf_extracted_text'] = asyncio.to_thread(
+                            analyze_pdf_cached,
+                            transcript_hash(pdf_text), context_name,
+                            st.session_state.meeting_type, customer_context, pdf_text
+                        )
+                    else:
+                        st.error("Could not extract text from PDF. Please try a different file.")
+                    
+                    results = dict(zip(jobs, run_concurrently(*jobs.values())))
+                    st.session_state.update(results)
+                    quick_task_text_image = results.get('image_extracted_text', quick_task_text_image)
+                    quick_task_text_pdf = results.get('pdf_extracted_text', quick_task_text_pdf)
+                    st.success("✅ Successfully analyzed image and PDF!")
+                except Exception as e:
+                    st.error(f"Error analyzing uploads: {str(e)}")
+    
     # Determine which text to use based on active tab
-    if 'quick_task_text_pdf' in locals() and quick_task_text_pdf:
+    if quick_task_text_pdf:
         quick_task_text = quick_task_text_pdf
-    elif 'quick_task_text_image' in locals() and quick_task_text_image:
+    elif quick_task_text_image:
         quick_task_text = quick_task_text_image
     else:
-        quick_task_text = quick_task_text_input if 'quick_task_text_input' in locals() else ""
+        quick_task_text = quick_task_text_input
     
     # Create columns for info display
     quick_task_col1, quick_task_col2 = st.columns([2, 1])
@@ -667,16 +858,10 @@ def main():
     with quick_task_col2:
         st.write("**Current Selection:**")
         if 'meeting_type' in st.session_state:
-            if st.session_state.meeting_type == "sales_call":
-                st.write(f"📊 Customer: {selected_customer if 'selected_customer' in locals() else 'None'}")
-            elif st.session_state.meeting_type == "internal_meeting":
-                st.write(f"🏢 Department: {selected_customer if 'selected_customer' in locals() else 'None'}")
-            elif st.session_state.meeting_type == "existing_customer":
-                st.write(f"🔄 Existing: {selected_customer if 'selected_customer' in locals() else 'None'}")
-            else:
-                st.write(f"📁 Project: {selected_customer if 'selected_customer' in locals() else 'None'}")
+            label = CONTEXT_LABELS.get(st.session_state.meeting_type, DEFAULT_CONTEXT_LABEL)
+            st.write(f"{label}: {selected_customer or 'None'}")
             
-            if 'project_id' in locals() and project_id and not project_id.startswith('YOUR_'):
+            if project_id and not project_id.startswith('YOUR_'):
                 st.write(f"✅ Ready to create tasks")
             else:
                 st.write(f"⚠️ Configure project ID first")
@@ -684,26 +869,19 @@ def main():
     if st.button("🚀 Create Quick Task(s)", type="secondary", use_container_width=True):
         if not quick_task_text.strip():
             st.warning("Please enter a task description")
-        elif 'project_id' not in locals() or not project_id or project_id.startswith('YOUR_'):
+        elif not project_id or project_id.startswith('YOUR_'):
             st.error("Please select a valid customer/department/project with configured Asana ID")
         else:
             with st.spinner("Processing your request with AI..."):
                 try:
-                    from datetime import datetime
-                    
-                    # Get current date for section
-                    current_date = datetime.now().strftime("%m/%d")
                     section_name = f"Quick Tasks - {current_date}"
                     
-                    # Process with AI
-                    analyzer = GeminiAnalyzer()
-                    
                     # Determine context based on meeting type
                     context_type = st.session_state.meeting_type.replace("_", " ").title()
-                    context_name = selected_customer if 'selected_customer' in locals() else "General"
+                    context_name = selected_customer or "General"
                     
                     # Interpret the quick task(s)
-                    interpreted_tasks = analyzer.interpret_quick_tasks(
+                    interpreted_tasks = interpret_quick_tasks_cached(
                         quick_task_text,
                         context_name,
                         context_type
@@ -711,11 +889,11 @@ def main():
                     
                     if interpreted_tasks:
                         # Create tasks in Asana
-                        asana_client = AsanaTaskCreator()
+                        asana_client = get_asana_client()
                         
                         # Check if section exists, create if not
                         created_tasks = asana_client.create_tasks(
-                            interpreted_tasks,
+                            dedupe_action_items(interpreted_tasks),
                             project_id,
                             section_name=section_name,
                             meeting_context=f"Quick Task - {context_name}"
@@ -726,11 +904,7 @@ def main():
                             
                             # Show created tasks
                             st.subheader("Created Tasks:")
-                            for task in created_tasks:
-                                if task.get('permalink_url'):
-                                    st.markdown(f"• [{task['name']}]({task['permalink_url']})")
-                                else:
-                                    st.write(f"• {task['name']}")
+                            st.markdown(created_tasks_markdown(created_tasks))
                             
                             # Clear the text area for next use by deleting the key
                             if 'quick_task_input' in st.session_state:
@@ -743,21 +917,461 @@ def main():
                 except Exception as e:
                     st.error(f"Error processing quick task: {str(e)}")
     
-    # Status indicator in footer
-    st.divider()
-    status_col1, status_col2, status_col3 = st.columns(3)
+    # Queue the entry for a discounted Batch API run instead of creating it now
+    if st.button("🗂️ Queue Quick Task(s) for Batch", use_container_width=True,
+                 help="Collect entries and interpret them together at half the cost via the Gemini Batch API; "
+                      "tasks are created in Asana once the batch finishes"):
+        if not quick_task_text.strip():
+            st.warning("Please enter a task description")
+        elif not project_id or project_id.startswith('YOUR_'):
+            st.error("Please select a valid customer/department/project with configured Asana ID")
+        else:
+            st.session_state.pending_quick_tasks.append({
+                'task_input': quick_task_text,
+                'context_name': selected_customer or "General",
+                'context_type': st.session_state.meeting_type.replace("_", " ").title(),
+                'project_id': project_id,
+                'section_name': f"Quick Tasks - {current_date}"
+            })
+            st.success(f"✅ Queued ({len(st.session_state.pending_quick_tasks)} entr(ies) waiting for the next batch)")
+    
+    render_quick_task_batches()
+
+@st.cache_resource(show_spinner=False)
+def check_api_keys() -> tuple:
+    """
+    Check if required API keys are configured
+    
+    The environment doesn't change while the server runs, so the result is
+    kept across reruns. Failed checks are cleared by the caller.
+    """
+    asana_token = os.getenv('ASANA_ACCESS_TOKEN')
+    gemini_key = os.getenv('GEMINI_API_KEY')
+    
+    missing_keys = []
+    if not asana_token:
+        missing_keys.append("ASANA_ACCESS_TOKEN")
+    if not gemini_key:
+        missing_keys.append("GEMINI_API_KEY")
+    
+    return len(missing_keys) == 0, missing_keys
+
+def main():
+    """Main application logic"""
+    
+    # Header
+    st.title("📄 Asana Opus")
+    st.subheader("AI-Powered Meeting Transcript to Task Converter")
+    
+    # Check API keys
+    keys_valid, missing_keys = check_api_keys()
+    if not keys_valid:
+        check_api_keys.clear()  # Re-check on the next rerun once .env is fixed
+        st.error(f"Missing API keys in .env file: {', '.join(missing_keys)}")
+        st.info("Please copy .env.example to .env and add your API keys.")
+        st.stop()
+    
+    # Load customers, departments, projects, and existing customers from one config file
+    config = load_config()
+    customers, departments, projects, existing_customers = (
+        config.get(section, {}) for section in ('customers', 'departments', 'projects', 'existing_customers')
+    )
+    if not customers or not departments:
+        st.stop()
+    
+    # Date used in section names and task context, formatted once per rerun
+    current_date = datetime.now().strftime("%m/%d")
+    
+    # Selectbox options, built once per rerun
+    customer_names = tuple(customers)
+    department_names = tuple(departments)
+    project_names = tuple(projects)
+    existing_customer_names = tuple(existing_customers)
+    
+    # Sidebar configuration
+    with st.sidebar:
+        st.header("Configuration")
+        
+        # Meeting type selection
+        meeting_type = st.radio(
+            "Meeting Type",
+            ["Sales Call", "Internal Meeting", "Project Meeting", "Existing Customer"],
+            help="Select the type of meeting transcript"
+        )
+        st.session_state.meeting_type = meeting_type.lower().replace(" ", "_")
+        
+        # Stay None when nothing is selectable for the chosen meeting type
+        selected_customer = None
+        project_id = None
+        
+        # Selections and options apply together on submit, so changing several
+        # of them costs one rerun instead of one per widget
+        with st.form("configuration", border=False):
+            # Customer/Department/Project selection based on meeting type
+            if st.session_state.meeting_type == "sales_call":
+                selected_customer = st.selectbox(
+                    "Select Customer",
+                    customer_names,
+                    help="Choose the customer for task creation"
+                )
+                
+                if selected_customer:
+                    customer_info = customers[selected_customer]
+                    project_id = customer_info.get('asana_project_id', '')
+                    
+                    if project_id == 'YOUR_ASANA_PROJECT_ID_HERE':
+                        st.warning("Please configure the Asana project ID in config.json")
+                    else:
+                        st.success(f"Customer: {selected_customer} | Project ID: {project_id[:8]}...")
+                        
+            elif st.session_state.meeting_type == "internal_meeting":
+                # Internal meeting - select department
+                selected_department = st.selectbox(
+                    "Select Department",
+                    department_names,
+                    help="Choose the department for task creation"
+                )
+                
+                if selected_department:
+                    department_info = departments[selected_department]
+                    project_id = department_info.get('asana_project_id', '')
+                    selected_customer = selected_department  # Use department name as customer for consistency
+                    
+                    if project_id.startswith('YOUR_'):
+                        st.warning(f"Please configure the Asana project ID for {selected_department} in config.json")
+                    else:
+                        st.success(f"Department: {selected_department} | Project ID: {project_id[:8]}...")
+                        
+            elif st.session_state.meeting_type == "project_meeting":
+                # Project meeting - select project
+                selected_project = st.selectbox(
+                    "Select Project",
+                    project_names,
+                    help="Choose the project for task creation"
+                )
+                
+                if selected_project:
+                    project_info = projects[selected_project]
+                    project_id = project_info.get('asana_project_id', '')
+                    selected_customer = selected_project  # Use project name as customer for consistency
+                    
+                    if project_id.startswith('YOUR_'):
+                        st.warning(f"Please configure the Asana project ID for {selected_project} in config.json")
+                    else:
+                        st.success(f"Project: {selected_project} | Project ID: {project_id[:8]}...")
+                        
+            else:  # existing_customer
+                # Existing customer - select from existing customers
+                selected_existing_customer = st.selectbox(
+                    "Select Existing Customer",
+                    existing_customer_names,
+                    help="Choose the existing customer for escalation/task creation"
+                )
+                
+                if selected_existing_customer:
+                    existing_customer_info = existing_customers[selected_existing_customer]
+                    project_id = existing_customer_info.get('asana_project_id', '')
+                    selected_customer = selected_existing_customer  # Use existing customer name for consistency
+                    
+                    if project_id == 'YOUR_ASANA_PROJECT_ID_HERE':
+                        st.warning(f"Please configure the Asana project ID for {selected_existing_customer} in config.json")
+                    else:
+                        st.success(f"Existing Customer: {selected_existing_customer} | Project ID: {project_id[:8]}...")
+            
+            st.divider()
+            
+            # Processing options
+            st.subheader("Options")
+            auto_process = st.checkbox(
+                "Auto-process on upload",
+                value=True,
+                help="Automatically analyze transcript when uploaded"
+            )
+            
+            show_extracted_text = st.checkbox(
+                "Show extracted text",
+                value=False,
+                help="Display the raw extracted text from PDF"
+            )
+            
+            inference_tier = st.selectbox(
+                "Inference tier",
+                INFERENCE_TIERS,
+                key='inference_tier',
+                help="Flex queues transcript analysis on the Gemini Batch API at half the cost; "
+                     "results show up under Batch analyses, usually within minutes. "
+                     "Quick tasks always use Standard."
+            )
+            
+            st.form_submit_button("Apply", use_container_width=True)
+        
+        st.divider()
+        
+        # Connection test
+        if st.button("Test Connections"):
+            with st.spinner("Testing connections..."):
+                # Probe both services at the same time
+                for name, ok, error in run_connection_probes():
+                    if ok:
+                        st.success(f"✅ {name} connection successful")
+                    elif error:
+                        st.error(f"❌ {name} connection failed: {error}")
+                    else:
+                        st.error(f"❌ {name} connection failed")
+    
+    # Main content area
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.header("1️⃣ Upload Transcript")
+        
+        # File uploader
+        uploaded_file = st.file_uploader(
+            "Choose a PDF file",
+            type=['pdf'],
+            help="Upload a meeting transcript PDF from Grain, Gong, or similar tools"
+        )
+        
+        # Recording link input
+        recording_link = st.text_input(
+            "Recording Link",
+            placeholder="https://grain.com/share/recording/...",
+            help="Paste the link to the meeting recording (Grain, Gong, Zoom, etc.)"
+        )
+        
+        if uploaded_file is not None:
+            # Display file info
+            st.info(file_info_line("📎", uploaded_file.name, uploaded_file.size))
+            
+            # Validate recording link
+            if not recording_link:
+                st.warning("⚠️ Please provide a recording link for reference")
+            
+            # Skip auto-processing when this exact file has already been analyzed
+            # or is being extracted; the button re-runs it on demand
+            content_hash = file_hash(uploaded_file)
+            already_analyzed = (
+                content_hash == st.session_state.last_pdf_hash
+                and st.session_state.processing_status in ('analyzed', 'queued')
+            )
+            extraction = st.session_state.extraction
+            if extraction is not None and extraction[0] != content_hash:
+                # A different file was uploaded meanwhile; its result is no longer wanted
+                extraction = st.session_state.extraction = None
+            
+            # Process button or auto-process
+            if (auto_process and not already_analyzed and extraction is None) or st.button("Process Transcript", type="primary"):
+                try:
+                    # Create PDFProcessor instance; the upload is read in place rather than copied
+                    pdf_processor = PDFProcessor()
+                    is_valid, error_msg = pdf_processor.validate_file(uploaded_file, uploaded_file.name)
+                    
+                    if not is_valid:
+                        st.error(f"Invalid file: {error_msg}")
+                        st.session_state.processing_status = 'error'
+                    else:
+                        # Extract in the background so reruns stay responsive; getvalue()
+                        # shares the upload's buffer instead of copying it
+                        extraction = st.session_state.extraction = (
+                            content_hash,
+                            get_extraction_executor().submit(extract_pdf_cached, content_hash, uploaded_file.getvalue())
+                        )
+                        if auto_process:
+                            # Analysis follows right away, so warm up the Gemini client meanwhile
+                            get_warm_up_executor().submit(warm_up_gemini)
+                        st.session_state.extracted_text = None
+                        st.session_state.processing_status = 'extracting'
+                
+                except Exception as e:
+                    logger.error(f"PDF processing error: {traceback.format_exc()}")
+                    st.error(f"Error processing PDF: {str(e)}")
+                    st.session_state.processing_status = 'error'
+            
+            if extraction is not None:
+                _, future = extraction
+                if not future.done():
+                    # Poll from a fragment so the rest of the page keeps rendering meanwhile
+                    extraction_status()
+                else:
+                    st.session_state.extraction = None
+                    try:
+                        extracted_text, method = future.result()
+                        
+                        if extracted_text:
+                            st.session_state.extracted_text = extracted_text
+                            st.session_state.last_pdf_hash = content_hash
+                            st.session_state.processing_status = 'processing'
+                            st.success(f"✅ Text extracted successfully using {method}")
+                            
+                            if show_extracted_text:
+                                with st.expander("View Extracted Text"):
+                                    st.text(text_preview(extracted_text, 2000))
+                        else:
+                            st.error("Failed to extract text from PDF")
+                            st.session_state.processing_status = 'error'
+                    
+                    except Exception as e:
+                        logger.error(f"PDF processing error: {traceback.format_exc()}")
+                        st.error(f"Error processing PDF: {str(e)}")
+                        st.session_state.processing_status = 'error'
     
-    with status_col1:
+    with col2:
+        st.header("2️⃣ AI Analysis")
+        
         if st.session_state.extracted_text:
-            st.metric("Text Extracted", "✅ Yes")
+            analyze_requested = st.button("Analyze with AI", type="primary") or (auto_process and st.session_state.processing_status == 'processing')
+            if analyze_requested and inference_tier == FLEX_TIER:
+                st.session_state.recording_link = recording_link
+                if queue_transcript_batch(
+                    config, selected_customer, recording_link,
+                    uploaded_file.name if uploaded_file else "Transcript"
+                ):
+                    st.session_state.processing_status = 'queued'
+                else:
+                    st.session_state.processing_status = 'error'
+            elif analyze_requested:
+                with st.spinner("Analyzing transcript with Gemini AI..."):
+                    try:
+                        # Store recording link in session state
+                        st.session_state.recording_link = recording_link
+                        
+                        # Analyze transcript
+                        department, project, additional_context = analysis_context(
+                            config, st.session_state.meeting_type, selected_customer
+                        )
+                        
+                        analysis = analyze_transcript_cached(
+                            transcript_hash(st.session_state.extracted_text),
+                            selected_customer,
+                            st.session_state.meeting_type,
+                            recording_link,
+                            department,
+                            project,
+                            additional_context if additional_context else f"Meeting transcript for {selected_customer}",
+                            st.session_state.extracted_text
+                        )
+                        
+                        # Store action items
+                        st.session_state.action_items = action_items_from_analysis(analysis)
+                        
+                        # Display results
+                        st.success(f"✅ Found {len(analysis.action_items)} action items")
+                        
+                        # Show meeting title
+                        if hasattr(analysis, 'meeting_title'):
+                            st.subheader("Meeting Title")
+                            st.write(analysis.meeting_title)
+                            st.session_state.meeting_title = analysis.meeting_title
+                        
+                        # Show summary
+                        if analysis.summary:
+                            st.subheader("Meeting Summary")
+                            st.write(analysis.summary)
+                        
+                        # Show participants
+                        if analysis.participants:
+                            st.subheader("Participants")
+                            st.write(", ".join(analysis.participants))
+                        
+                        # Show key decisions
+                        if analysis.key_decisions:
+                            st.subheader("Key Decisions")
+                            for decision in analysis.key_decisions:
+                                st.write(f"• {decision}")
+                        
+                        st.session_state.processing_status = 'analyzed'
+                        
+                    except Exception as e:
+                        st.error(f"Error analyzing transcript: {str(e)}")
+                        st.session_state.processing_status = 'error'
+            
+            # Batch API: half the cost, results arrive later (the Flex tier always queues)
+            if inference_tier != FLEX_TIER and st.button("Queue for batch", help="Analyze at half the cost via the Gemini Batch API; results usually arrive within minutes, at most 24 hours"):
+                queue_transcript_batch(
+                    config, selected_customer, recording_link,
+                    uploaded_file.name if uploaded_file else "Transcript"
+                )
         else:
-            st.metric("Text Extracted", "❌ No")
+            st.info("Upload and process a PDF first")
+        
+        render_batch_jobs()
+    
+    # Action Items Section
+    if st.session_state.action_items:
+        st.divider()
+        st.header("3️⃣ Action Items")
+        
+        # Display action items as a single table
+        action_items_df = pd.DataFrame(
+            st.session_state.action_items,
+            columns=['title', 'description', 'priority']
+        )
+        st.dataframe(
+            action_items_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "title": st.column_config.TextColumn("Title", width="medium"),
+                "description": st.column_config.TextColumn("Description", width="large"),
+                "priority": st.column_config.TextColumn("Priority", width="small")
+            }
+        )
+        
+        # Create tasks button
+        if st.button("Create Tasks in Asana", type="primary", use_container_width=True):
+            if project_id and not project_id.startswith('YOUR_'):
+                with st.spinner("Creating tasks in Asana..."):
+                    try:
+                        # Create section name based on meeting type and title
+                        meeting_title = getattr(st.session_state, 'meeting_title', 'Meeting')
+                        section_name = f"{current_date} - {meeting_title}"
+                        
+                        # Create meeting context for task descriptions
+                        # Create appropriate context based on meeting type
+                        meeting_context = f"{current_date} - {selected_customer}: {meeting_title}"
+                        
+                        # Create tasks with section
+                        asana_client = get_asana_client()
+                        created_tasks = asana_client.create_tasks(
+                            dedupe_action_items(st.session_state.action_items),
+                            project_id,
+                            section_name=section_name,
+                            meeting_context=meeting_context,
+                            recording_link=st.session_state.recording_link
+                        )
+                        
+                        st.session_state.created_tasks = created_tasks
+                        
+                        if created_tasks:
+                            st.success(f"✅ Successfully created {len(created_tasks)} tasks in Asana!")
+                            
+                            # Show created tasks with links
+                            st.subheader("Created Tasks")
+                            st.markdown(created_tasks_markdown(created_tasks))
+                        else:
+                            st.error("No tasks were created. Please check the logs.")
+                        
+                    except Exception as e:
+                        st.error(f"Error creating tasks: {str(e)}")
+            else:
+                if st.session_state.meeting_type == "internal_meeting":
+                    st.error("Please configure the Asana project ID for this department in config.json")
+                elif st.session_state.meeting_type == "project_meeting":
+                    st.error("Please configure the Asana project ID for this project in config.json")
+                else:
+                    st.error("Please configure the Asana project ID for this customer in config.json")
     
-    with status_col2:
-        st.metric("Action Items", len(st.session_state.action_items))
+    # Quick Task Section
+    quick_task_section(selected_customer, project_id, existing_customers, current_date)
     
-    with status_col3:
-        st.metric("Tasks Created", len(st.session_state.created_tasks))
+    # Status indicator in footer, rendered as a single element
+    st.divider()
+    text_status = "✅ Yes" if st.session_state.extracted_text else "❌ No"
+    st.caption(
+        f"**Text Extracted:** {text_status} | "
+        f"**Action Items:** {len(st.session_state.action_items)} | "
+        f"**Tasks Created:** {len(st.session_state.created_tasks)}"
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
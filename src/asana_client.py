@@ -4,15 +4,60 @@ Handles creation of tasks in Asana from extracted action items
 """
 
 import os
+import time
+import hashlib
+import random
+import asyncio
 import logging
-import json
-from typing import List, Dict, Optional
+import threading
+import traceback
+import orjson
+from typing import List, Dict, Optional, Tuple, Union
 import asana
 from asana.rest import ApiException
+from .sync_runner import run_sync
+
+# Set ASANA_DEBUG to log request payloads and the SDK's HTTP traffic
+ASANA_DEBUG = os.getenv('ASANA_DEBUG', '').lower() in ('1', 'true', 'yes')
 
-# Set up detailed logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG if ASANA_DEBUG else logging.INFO)
+
+# Maximum number of actions Asana accepts in one Batch API request
+ASANA_BATCH_SIZE = 10
+
+# Maximum number of Asana requests in flight at once, to stay within rate limits
+ASANA_MAX_CONCURRENCY = 10
+
+# Asana's per-token rate limit (free plan); batch sub-actions count individually
+ASANA_REQUESTS_PER_MINUTE = 150
+
+# Attempts per request on rate limiting (429) or server errors (5xx), with
+# jittered exponential backoff starting at ASANA_BACKOFF_SECONDS and capped at
+# ASANA_MAX_BACKOFF_SECONDS; a 429's Retry-After header takes precedence
+ASANA_MAX_ATTEMPTS = 5
+ASANA_BACKOFF_SECONDS = 1.0
+ASANA_MAX_BACKOFF_SECONDS = 32.0
+ASANA_BACKOFF_JITTER_SECONDS = 0.5
+
+# Action item priorities mapped to the Asana priority values
+PRIORITY_MAP = {
+    'high': 'high',
+    'medium': 'medium',
+    'low': 'low'
+}
+
+# Line between the meeting context block and the original task description
+DESCRIPTION_SEPARATOR = f"\n{'━' * 30}\n"
+
+# How long user info and workspace project lists are reused across
+# AsanaTaskCreator instances in this process
+USER_INFO_TTL_SECONDS = 3600
+PROJECTS_TTL_SECONDS = 300
+
+# (fetched_at, value) caches keyed by a hash of the access token
+_user_info_cache: Dict[str, Tuple[float, Dict]] = {}
+_projects_cache: Dict[Tuple[str, str], Tuple[float, List[Dict]]] = {}
 
 
 class AsanaTaskCreator:
@@ -28,11 +73,15 @@ class AsanaTaskCreator:
         self.access_token = access_token or os.getenv('ASANA_ACCESS_TOKEN')
         if not self.access_token:
             raise ValueError("Asana access token is required. Set ASANA_ACCESS_TOKEN environment variable.")
+        self._token_key = hashlib.blake2b(self.access_token.encode('utf-8'), digest_size=16).hexdigest()
         
-        # Initialize Asana client with debug mode
+        # Initialize Asana client, tracing HTTP requests only when ASANA_DEBUG is set
         configuration = asana.Configuration()
         configuration.access_token = self.access_token
-        configuration.debug = True  # Enable debug mode to see HTTP requests
+        configuration.debug = ASANA_DEBUG
+        # Keep a pooled keep-alive connection for every concurrent request, so
+        # parallel task creation reuses TLS connections instead of discarding them
+        configuration.connection_pool_maxsize = ASANA_MAX_CONCURRENCY
         self.api_client = asana.ApiClient(configuration)
         
         # Create API instances
@@ -40,20 +89,32 @@ class AsanaTaskCreator:
         self.users_api = asana.UsersApi(self.api_client)
         self.projects_api = asana.ProjectsApi(self.api_client)
         self.sections_api = asana.SectionsApi(self.api_client)
+        self.batch_api = asana.BatchAPIApi(self.api_client)
+        
+        # Token bucket shared by every request this client makes
+        self._rate_tokens = float(ASANA_REQUESTS_PER_MINUTE)
+        self._rate_updated = time.monotonic()
+        self._rate_lock = threading.Lock()
         
         # Get user info
         self.user_info = self._get_user_info()
         logger.info(f"Initialized Asana client for user: {self.user_info.get('name', 'Unknown')}")
     
     def _get_user_info(self) -> Dict:
-        """Get current user information"""
+        """Get current user information, reusing a lookup made in the last USER_INFO_TTL_SECONDS"""
+        cached = _user_info_cache.get(self._token_key)
+        if cached and time.monotonic() - cached[0] < USER_INFO_TTL_SECONDS:
+            return cached[1]
+        
         try:
             me = self.users_api.get_user("me", {})
-            return {
+            user_info = {
                 'gid': me.get('gid', ''),
                 'name': me.get('name', ''),
                 'workspaces': me.get('workspaces', [])
             }
+            _user_info_cache[self._token_key] = (time.monotonic(), user_info)
+            return user_info
         except ApiException as e:
             logger.error(f"Failed to get user info: {e}")
             return {}
@@ -109,11 +170,11 @@ class AsanaTaskCreator:
         Returns:
             Section ID if created successfully, None otherwise
         """
-        logger.info("="*50)
-        logger.info("CREATING SECTION")
-        logger.info(f"Project ID: {project_id} (type: {type(project_id)})")
-        logger.info(f"Section Name: {section_name} (type: {type(section_name)})")
-        logger.info(f"Workspace ID: {workspace_id} (type: {type(workspace_id) if workspace_id else 'None'})")
+        logger.debug("="*50)
+        logger.debug("CREATING SECTION")
+        logger.debug(f"Project ID: {project_id} (type: {type(project_id)})")
+        logger.debug(f"Section Name: {section_name} (type: {type(section_name)})")
+        logger.debug(f"Workspace ID: {workspace_id} (type: {type(workspace_id) if workspace_id else 'None'})")
         
         if not workspace_id and self.user_info.get('workspaces'):
             workspace_id = self.user_info['workspaces'][0]['gid']
@@ -129,14 +190,15 @@ class AsanaTaskCreator:
             # The SDK expects the payload wrapped in opts with 'body' key
             opts = {'body': section_payload}
             
-            logger.info("Payload being sent to create_section_for_project:")
-            logger.info(json.dumps(section_payload, indent=2))
-            logger.info(f"Method call: sections_api.create_section_for_project('{project_id}', opts={opts})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Payload being sent to create_section_for_project:")
+                logger.debug(orjson.dumps(section_payload, option=orjson.OPT_INDENT_2).decode())
+                logger.debug(f"Method call: sections_api.create_section_for_project('{project_id}', opts={opts})")
             
-            created_section = self.sections_api.create_section_for_project(project_id, opts)
+            created_section = self._with_retry(self.sections_api.create_section_for_project, project_id, opts, idempotent=False)
             
             logger.info(f"✅ Created section: {section_name} (ID: {created_section.get('gid', 'Unknown')})") 
-            logger.info(f"Response: {created_section}")
+            logger.debug(f"Response: {created_section}")
             return created_section.get('gid')
             
         except ApiException as e:
@@ -149,7 +211,6 @@ class AsanaTaskCreator:
             return None
         except Exception as e:
             logger.error(f"❌ UNEXPECTED ERROR in create_section: {type(e).__name__}: {str(e)}")
-            import traceback
             logger.error(traceback.format_exc())
             return None
     
@@ -163,6 +224,9 @@ class AsanaTaskCreator:
         """
         Create tasks in Asana from action items
         
+        For callers without a running event loop; async code awaits
+        create_tasks_async() instead.
+        
         Args:
             action_items: List of action items with 'title' and 'description'
             project_id: Asana project ID to create tasks in
@@ -174,6 +238,37 @@ class AsanaTaskCreator:
         Returns:
             List of created task details
         """
+        return run_sync(self.create_tasks_async(
+            action_items,
+            project_id,
+            workspace_id=workspace_id,
+            section_name=section_name,
+            meeting_context=meeting_context,
+            recording_link=recording_link
+        ), "create_tasks", "create_tasks_async")
+    
+    async def create_tasks_async(self,
+                                 action_items: List[Dict[str, str]],
+                                 project_id: str,
+                                 workspace_id: Optional[str] = None,
+                                 section_name: Optional[str] = None,
+                                 meeting_context: Optional[str] = None,
+                                 recording_link: Optional[str] = None) -> List[Dict]:
+        """
+        Create tasks in Asana concurrently
+        
+        Items are sent through the Batch API in groups of ASANA_BATCH_SIZE.
+        The SDK is synchronous, so each request runs in a worker thread and
+        all of them are awaited together with asyncio.gather, with at most
+        ASANA_MAX_CONCURRENCY in flight and no more than
+        ASANA_REQUESTS_PER_MINUTE actions started per minute. Any action the batch rejects
+        (4xx) is retried as a single-task request; actions whose outcome is
+        unknown are reported as failed rather than risk duplicate tasks.
+        Takes the same arguments as create_tasks().
+        
+        Returns:
+            List of created task details, in the same order as action_items
+        """
         if not workspace_id and self.user_info.get('workspaces'):
             workspace_id = self.user_info['workspaces'][0]['gid']
         
@@ -181,70 +276,313 @@ class AsanaTaskCreator:
             logger.error("No workspace ID available")
             return []
         
-        logger.info("="*50)
-        logger.info("STARTING TASK CREATION PROCESS")
-        logger.info(f"Project ID: {project_id}")
-        logger.info(f"Workspace ID: {workspace_id}")
-        logger.info(f"Section Name: {section_name}")
-        logger.info(f"Meeting Context: {meeting_context}")
-        logger.info(f"Number of action items: {len(action_items)}")
+        logger.debug("="*50)
+        logger.debug("STARTING TASK CREATION PROCESS")
+        logger.debug(f"Project ID: {project_id}")
+        logger.debug(f"Workspace ID: {workspace_id}")
+        logger.debug(f"Section Name: {section_name}")
+        logger.debug(f"Meeting Context: {meeting_context}")
+        logger.info(f"Creating {len(action_items)} task(s) in project {project_id}")
         
         # Get or create section if section name is provided
         section_id = None
         if section_name:
             logger.info(f"Attempting to get or create section: {section_name}")
-            section_id = self.get_or_create_section(project_id, section_name, workspace_id)
+            section_id = await asyncio.to_thread(self.get_or_create_section, project_id, section_name, workspace_id)
             if section_id:
                 logger.info(f"✅ Section ready with ID: {section_id}")
             else:
                 logger.error("❌ Failed to get/create section, continuing without section")
         
+        # Work on copies so the caller's items can be passed in again unchanged
+        action_items = [
+            self._add_task_context(item, meeting_context, recording_link)
+            for item in action_items
+        ]
+        
+        # Submit the items through the Batch API, ASANA_BATCH_SIZE actions per request
+        batches = [
+            action_items[i:i + ASANA_BATCH_SIZE]
+            for i in range(0, len(action_items), ASANA_BATCH_SIZE)
+        ]
+        limit = asyncio.Semaphore(ASANA_MAX_CONCURRENCY)
+        batch_results = await asyncio.gather(
+            *[
+                self._run_limited(limit, len(batch), self._create_task_batch, batch, project_id, workspace_id, section_id)
+                for batch in batches
+            ]
+        )
+        results = [task for batch in batch_results for task in batch]
+        
+        # Retry actions the batch rejected as individual requests
+        failed = [i for i, task in enumerate(results) if task is None]
+        if failed:
+            logger.info(f"Retrying {len(failed)} task(s) individually")
+            retried = await asyncio.gather(
+                *[
+                    self._run_limited(limit, 2 if section_id else 1, self._create_single_task, action_items[i], project_id, workspace_id, section_id)
+                    for i in failed
+                ],
+                return_exceptions=True
+            )
+            for i, task in zip(failed, retried):
+                results[i] = task
+        
         created_tasks = []
+        for item, task in zip(action_items, results):
+            if isinstance(task, Exception):
+                logger.error(f"❌ Failed to create task '{item.get('title', 'Unknown')}': {str(task)}")
+            elif task:
+                created_tasks.append(task)
+                logger.info(f"✅ Task created: {task.get('name', 'Unknown')}")
+        
+        logger.info(f"Successfully created {len(created_tasks)} out of {len(action_items)} tasks")
+        return created_tasks
+    
+    def _add_task_context(self,
+                          item: Dict[str, str],
+                          meeting_context: Optional[str] = None,
+                          recording_link: Optional[str] = None) -> Dict[str, str]:
+        """
+        Prefix an action item's title and description with meeting context
+        
+        Args:
+            item: Action item to prefix; it is left unchanged
+            meeting_context: Meeting context to add to the description (optional)
+            recording_link: Link to the meeting recording (optional)
+            
+        Returns:
+            A copy of the item with the prefixed title and description
+        """
+        item = dict(item)
+        
+        # Build enhanced description with context, link, and timestamp
+        original_desc = item.get('description', '')
+        timestamp = item.get('timestamp', None)
+        is_question = item.get('is_question', False)
+        
+        # Format the title for questions
+        title = item.get('title', 'Untitled Task')
+        if is_question and not title.startswith('Customer Question:'):
+            item['title'] = f"Customer Question: {title}"
+        
+        # Build description sections
+        desc_parts = []
+        
+        # Add meeting context
+        if meeting_context:
+            desc_parts.append(f"📅 {meeting_context}")
+        
+        # Add recording link with timestamp
+        if recording_link:
+            if timestamp:
+                desc_parts.append(f"🎥 Recording: {recording_link}")
+                desc_parts.append(f"⏱️ Timestamp: {timestamp}")
+            else:
+                desc_parts.append(f"🎥 Recording: {recording_link}")
+        
+        # Add separator and original description
+        if desc_parts:
+            item['description'] = '\n'.join(desc_parts) + DESCRIPTION_SEPARATOR + original_desc
+        else:
+            item['description'] = original_desc
         
-        for idx, item in enumerate(action_items, 1):
+        return item
+    
+    @staticmethod
+    def _with_retry(func, *args, idempotent: bool = True):
+        """
+        Call an Asana SDK method, retrying rate-limited and server errors
+        
+        Waits for the Retry-After header when Asana sends one, otherwise
+        backs off exponentially with jitter. Other API errors are raised
+        straight away; the last error is raised once ASANA_MAX_ATTEMPTS is
+        reached.
+        
+        Calls that create something (idempotent=False) are only retried when
+        Asana certainly didn't apply them: on 429, or a 503 with Retry-After.
+        Any other server error may come after the request was committed, and
+        resending it would create a duplicate.
+        """
+        for attempt in range(1, ASANA_MAX_ATTEMPTS + 1):
             try:
-                logger.info(f"\nCreating task {idx}/{len(action_items)}: {item.get('title', 'Unknown')}")
-                
-                # Build enhanced description with context, link, and timestamp
-                original_desc = item.get('description', '')
-                timestamp = item.get('timestamp', None)
-                is_question = item.get('is_question', False)
-                
-                # Format the title for questions
-                if is_question and not item['title'].startswith('Customer Question:'):
-                    item['title'] = f"Customer Question: {item['title']}"
-                
-                # Build description sections
-                desc_parts = []
-                
-                # Add meeting context
-                if meeting_context:
-                    desc_parts.append(f"📅 {meeting_context}")
-                
-                # Add recording link with timestamp
-                if recording_link:
-                    if timestamp:
-                        desc_parts.append(f"🎥 Recording: {recording_link}")
-                        desc_parts.append(f"⏱️ Timestamp: {timestamp}")
-                    else:
-                        desc_parts.append(f"🎥 Recording: {recording_link}")
-                
-                # Add separator and original description
-                if desc_parts:
-                    item['description'] = '\n'.join(desc_parts) + f"\n{'━' * 30}\n{original_desc}"
+                return func(*args)
+            except ApiException as e:
+                status = getattr(e, 'status', None) or 0
+                if idempotent:
+                    retryable = status == 429 or status >= 500
                 else:
-                    item['description'] = original_desc
-                
-                task = self._create_single_task(item, project_id, workspace_id, section_id)
-                if task:
-                    created_tasks.append(task)
-                    logger.info(f"✅ Task created: {task.get('name', 'Unknown')}")
-            except Exception as e:
-                logger.error(f"❌ Failed to create task '{item.get('title', 'Unknown')}': {str(e)}")
-                continue
+                    retryable = status == 429 or (status == 503 and AsanaTaskCreator._retry_after(e) is not None)
+                if attempt == ASANA_MAX_ATTEMPTS or not retryable:
+                    raise
+                delay = AsanaTaskCreator._retry_after(e)
+                if delay is None:
+                    delay = min(ASANA_MAX_BACKOFF_SECONDS, ASANA_BACKOFF_SECONDS * 2 ** (attempt - 1))
+                    delay += random.uniform(0, ASANA_BACKOFF_JITTER_SECONDS)
+                logger.warning(f"⚠️ Asana returned {status}, retrying in {delay:.1f}s (attempt {attempt}/{ASANA_MAX_ATTEMPTS})")
+                time.sleep(delay)
+    
+    @staticmethod
+    def _retry_after(error: ApiException) -> Optional[float]:
+        """Seconds requested by an error's Retry-After header, if it has a usable one"""
+        value = (getattr(error, 'headers', None) or {}).get('Retry-After')
+        try:
+            return max(0.0, float(value)) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+    
+    async def _run_limited(self, limit: asyncio.Semaphore, cost: int, func, *args):
+        """
+        Run a blocking SDK call in a worker thread once the semaphore and rate limit allow it
         
-        logger.info(f"Successfully created {len(created_tasks)} out of {len(action_items)} tasks")
-        return created_tasks
+        Args:
+            limit: Semaphore capping the requests in flight
+            cost: Number of Asana actions the call makes
+            func: SDK call to run, followed by its arguments
+        """
+        async with limit:
+            await self._acquire_rate(cost)
+            return await asyncio.to_thread(func, *args)
+    
+    async def _acquire_rate(self, cost: int = 1):
+        """Wait until the token bucket holds `cost` tokens, then take them"""
+        rate = ASANA_REQUESTS_PER_MINUTE / 60
+        while True:
+            with self._rate_lock:
+                now = time.monotonic()
+                self._rate_tokens = min(
+                    float(ASANA_REQUESTS_PER_MINUTE),
+                    self._rate_tokens + (now - self._rate_updated) * rate
+                )
+                self._rate_updated = now
+                if self._rate_tokens >= cost:
+                    self._rate_tokens -= cost
+                    return
+                wait = (cost - self._rate_tokens) / rate
+            await asyncio.sleep(wait)
+    
+    @staticmethod
+    def _task_base_data(project_id: str,
+                        workspace_id: str,
+                        section_id: Optional[str] = None) -> Dict:
+        """
+        Task fields shared by every item created in one call
+        
+        With a section ID the tasks are placed straight into the section
+        through their memberships; otherwise they are added to the project.
+        """
+        if section_id:
+            return {
+                "memberships": [{"project": project_id, "section": section_id}],
+                "workspace": workspace_id
+            }
+        return {
+            "projects": [project_id],
+            "workspace": workspace_id
+        }
+    
+    def _build_task_payload(self,
+                            action_item: Dict[str, str],
+                            base_data: Dict) -> Dict:
+        """
+        Build the create-task request body for an action item
+        
+        Args:
+            action_item: Action item with title and description
+            base_data: Shared task fields from _task_base_data(), built once per call
+            
+        Returns:
+            Request body with the task fields under 'data'
+        """
+        task_payload = {
+            "data": {
+                **base_data,
+                "name": action_item.get('title', 'Untitled Task'),
+                "notes": action_item.get('description', '')
+            }
+        }
+        
+        # Add optional fields if present, mapping priority to Asana format
+        priority = PRIORITY_MAP.get((action_item.get('priority') or '').lower())
+        if priority:
+            task_payload['data']['priority'] = priority
+        
+        return task_payload
+    
+    @staticmethod
+    def _task_summary(created_task: Dict) -> Dict:
+        """Reduce an Asana task record to the fields the app uses"""
+        return {
+            'gid': created_task.get('gid', ''),
+            'name': created_task.get('name', ''),
+            'notes': created_task.get('notes', ''),
+            'permalink_url': created_task.get('permalink_url', '')
+        }
+    
+    def _create_task_batch(self,
+                           action_items: List[Dict[str, str]],
+                           project_id: str,
+                           workspace_id: str,
+                           section_id: Optional[str] = None) -> List[Union[Dict, None, Exception]]:
+        """
+        Create up to ASANA_BATCH_SIZE tasks with a single Batch API request
+        
+        Tasks are placed straight into the section through their memberships,
+        so no separate add-to-section call is needed.
+        
+        Args:
+            action_items: Action items to create (at most ASANA_BATCH_SIZE)
+            project_id: Project ID
+            workspace_id: Workspace ID
+            section_id: Section ID to create the tasks in (optional)
+            
+        Returns:
+            Per action item: the created task details; None where Asana
+            rejected the action (4xx), so it is safe to send again; or the
+            error where the outcome is unknown (timeouts, server errors),
+            since the task may exist already
+        """
+        base_data = self._task_base_data(project_id, workspace_id, section_id)
+        actions = [
+            {'method': 'post', 'relative_path': '/tasks', 'data': self._build_task_payload(item, base_data)['data']}
+            for item in action_items
+        ]
+        
+        logger.info(f"Submitting batch of {len(actions)} task(s)")
+        
+        try:
+            responses = self._with_retry(
+                self.batch_api.create_batch_request, {'data': {'actions': actions}}, {}, idempotent=False
+            )
+        except ApiException as e:
+            status = getattr(e, 'status', None) or 0
+            logger.error(f"❌ Batch request failed: {status or 'N/A'} {e}")
+            if 400 <= status < 500:
+                return [None] * len(action_items)
+            return [e] * len(action_items)
+        except Exception as e:
+            logger.error(f"❌ UNEXPECTED ERROR in _create_task_batch: {type(e).__name__}: {str(e)}")
+            return [e] * len(action_items)
+        
+        results = []
+        for item, response in zip(action_items, responses):
+            status_code = response.get('status_code', 0)
+            if 200 <= status_code < 300:
+                body = response.get('body') or {}
+                results.append(self._task_summary(body.get('data', body)))
+            else:
+                logger.warning(f"⚠️ Batch action for '{item.get('title', 'Unknown')}' failed with status {status_code}: {response.get('body')}")
+                if 400 <= status_code < 500:
+                    results.append(None)
+                else:
+                    results.append(RuntimeError(f"Batch action ended with status {status_code}; not resent in case it was applied"))
+        
+        # Pad in case the response had fewer entries than actions; their outcome is unknown
+        results.extend(
+            [RuntimeError("Missing from the batch response; not resent in case it was applied")]
+            * (len(action_items) - len(results))
+        )
+        return results
     
     def _create_single_task(self, 
                            action_item: Dict[str, str], 
@@ -263,41 +601,22 @@ class AsanaTaskCreator:
         Returns:
             Created task details or None if failed
         """
-        logger.info("-"*30)
+        logger.debug("-"*30)
         logger.info(f"Creating single task: {action_item.get('title', 'Untitled Task')}")
-        logger.info(f"Project ID: {project_id} (type: {type(project_id)})")
-        logger.info(f"Workspace ID: {workspace_id} (type: {type(workspace_id)})")
-        logger.info(f"Section ID: {section_id} (type: {type(section_id) if section_id else 'None'})")
+        logger.debug(f"Project ID: {project_id} (type: {type(project_id)})")
+        logger.debug(f"Workspace ID: {workspace_id} (type: {type(workspace_id)})")
+        logger.debug(f"Section ID: {section_id} (type: {type(section_id) if section_id else 'None'})")
         
         try:
-            # Build task payload
-            task_payload = {
-                "data": {
-                    "name": action_item.get('title', 'Untitled Task'),
-                    "notes": action_item.get('description', ''),
-                    "projects": [project_id],
-                    "workspace": workspace_id
-                }
-            }
+            task_payload = self._build_task_payload(action_item, self._task_base_data(project_id, workspace_id))
             
-            # Add optional fields if present
-            if 'priority' in action_item:
-                # Map priority to Asana format if needed
-                priority_map = {
-                    'high': 'high',
-                    'medium': 'medium',
-                    'low': 'low'
-                }
-                priority = action_item['priority'].lower()
-                if priority in priority_map:
-                    task_payload['data']['priority'] = priority_map[priority]
-            
-            logger.info("Task payload being sent:")
-            logger.info(json.dumps(task_payload, indent=2))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Task payload being sent:")
+                logger.debug(orjson.dumps(task_payload, option=orjson.OPT_INDENT_2).decode())
             
             # Create the task - requires empty opts parameter
-            logger.info("Calling tasks_api.create_task()...")
-            created_task = self.tasks_api.create_task(task_payload, {})
+            logger.debug("Calling tasks_api.create_task()...")
+            created_task = self._with_retry(self.tasks_api.create_task, task_payload, {}, idempotent=False)
             logger.info(f"✅ Task created with GID: {created_task.get('gid', 'Unknown')}")
             
             # If section_id is provided, add task to section
@@ -307,10 +626,12 @@ class AsanaTaskCreator:
                     # The SDK expects the payload wrapped in opts with 'body' key
                     opts = {'body': add_to_section_payload}
                     
-                    logger.info(f"Adding task to section {section_id}")
-                    logger.info(f"Payload: {json.dumps(add_to_section_payload, indent=2)}")
+                    logger.debug(f"Adding task to section {section_id}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Payload: {orjson.dumps(add_to_section_payload, option=orjson.OPT_INDENT_2).decode()}")
                     
-                    self.sections_api.add_task_for_section(
+                    self._with_retry(
+                        self.sections_api.add_task_for_section,
                         section_id,
                         opts
                     )
@@ -320,12 +641,7 @@ class AsanaTaskCreator:
             
             logger.info(f"Created task: {created_task.get('name', 'Unknown')} (ID: {created_task.get('gid', 'Unknown')})")
             
-            return {
-                'gid': created_task.get('gid', ''),
-                'name': created_task.get('name', ''),
-                'notes': created_task.get('notes', ''),
-                'permalink_url': created_task.get('permalink_url', '')
-            }
+            return self._task_summary(created_task)
             
         except ApiException as e:
             logger.error("❌ ASANA API EXCEPTION in _create_single_task:")
@@ -336,7 +652,6 @@ class AsanaTaskCreator:
             return None
         except Exception as e:
             logger.error(f"❌ UNEXPECTED ERROR in _create_single_task: {type(e).__name__}: {str(e)}")
-            import traceback
             logger.error(traceback.format_exc())
             return None
     
@@ -344,6 +659,8 @@ class AsanaTaskCreator:
         """
         Get list of projects in workspace
         
+        Results are reused for PROJECTS_TTL_SECONDS.
+        
         Args:
             workspace_id: Workspace ID (optional, will use first workspace if not provided)
             
@@ -356,15 +673,22 @@ class AsanaTaskCreator:
         if not workspace_id:
             return []
         
+        cache_key = (self._token_key, workspace_id)
+        cached = _projects_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < PROJECTS_TTL_SECONDS:
+            return list(cached[1])
+        
         try:
             projects = self.projects_api.get_projects_for_workspace(workspace_id, {})
-            return [
+            project_list = [
                 {
                     'name': project.get('name', ''),
                     'gid': project.get('gid', '')
                 }
                 for project in projects
             ]
+            _projects_cache[cache_key] = (time.monotonic(), project_list)
+            return list(project_list)
         except ApiException as e:
             logger.error(f"Failed to get projects: {e}")
             return []
@@ -3,16 +3,294 @@ Gemini AI Analyzer Module
 Uses Google Gemini to analyze transcripts and extract action items
 """
 
+import io
 import os
 import json
+import time
+import random
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+import threading
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
+import importlib.util
+import httpx
+import orjson
+from pydantic import BaseModel, Field, ValidationError
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+from .llm_cache import SemanticCache
+from .sync_runner import run_sync
+from .prompts import (
+    PROMPT_DYNAMIC_MARKER,
+    MEETING_SUMMARY_MERGE_PROMPT,
+    SALES_PROMPT,
+    INTERNAL_PROMPT,
+    ONBOARDING_PROMPT,
+    SALES_DEPT_PROMPT,
+    PROJECT_MEETING_PROMPT,
+    SUPPORT_PROMPT,
+    EXISTING_CUSTOMER_PROMPT,
+    transcript_prompt
+)
 
 logger = logging.getLogger(__name__)
 
+# Attempts per Gemini request on rate limiting (429), server errors (5xx) and
+# network failures, with exponential backoff capped at GEMINI_MAX_BACKOFF_SECONDS
+# and scaled by a random factor within +/- GEMINI_BACKOFF_JITTER
+GEMINI_MAX_ATTEMPTS = 6
+GEMINI_BACKOFF_SECONDS = 1.0
+GEMINI_MAX_BACKOFF_SECONDS = 30.0
+GEMINI_BACKOFF_JITTER = 0.25
+
+# Longest server-suggested retry delay (RetryInfo on a 429) that is honored
+GEMINI_MAX_RETRY_DELAY_SECONDS = 60.0
+
+# Transcript analyses in flight at once in analyze_transcripts_async
+GEMINI_MAX_CONCURRENCY = 4
+
+# Client-side budget kept under the account's Gemini quota (defaults are the
+# paid tier 1 limits for gemini-2.5-flash); requests queue locally once it is spent
+GEMINI_REQUESTS_PER_MINUTE = int(os.getenv('GEMINI_REQUESTS_PER_MINUTE', '1000'))
+GEMINI_TOKENS_PER_MINUTE = int(os.getenv('GEMINI_TOKENS_PER_MINUTE', '1000000'))
+
+# Margin applied to a request's estimated token cost (about 4 characters per
+# input token, plus the full max_output_tokens)
+GEMINI_TOKEN_ESTIMATE_MARGIN = 1.2
+
+# Consecutive outage errors (5xx or connection failures) after which requests
+# fail fast for GEMINI_BREAKER_RESET_SECONDS before a probe request is let through
+GEMINI_BREAKER_FAILURE_THRESHOLD = 5
+GEMINI_BREAKER_RESET_SECONDS = 30.0
+
+# Output token caps tried in turn for a single-pass transcript analysis: a response
+# cut off at one cap (finish reason MAX_TOKENS) is requested again with the next.
+# Gemini 2.5 counts thinking tokens against the cap, so thinking is limited to
+# TRANSCRIPT_THINKING_BUDGET to leave room for the response. Batches use the last
+# cap straight away.
+TRANSCRIPT_OUTPUT_TOKEN_STEPS = (4096, 8192)
+TRANSCRIPT_THINKING_BUDGET = 1024
+
+# Transcripts at least this long go straight to the fallback model
+FALLBACK_MODEL_MIN_CHARS = 40_000
+
+# Transcripts longer than this are analyzed in parts of up to TRANSCRIPT_CHUNK_CHARS
+# and the results merged, keeping each response well within max_output_tokens
+TRANSCRIPT_SINGLE_PASS_CHARS = 150_000
+TRANSCRIPT_CHUNK_CHARS = 100_000
+
+# Connections kept open to the Gemini API by each client; requests are
+# multiplexed over HTTP/2 when the h2 package is installed
+GEMINI_HTTP_LIMITS = httpx.Limits(
+    max_connections=GEMINI_MAX_CONCURRENCY * 2,
+    max_keepalive_connections=GEMINI_MAX_CONCURRENCY * 2
+)
+GEMINI_HTTP2 = importlib.util.find_spec('h2') is not None
+
+# Embedding model used to match near-identical transcripts in the semantic cache
+EMBEDDING_MODEL = "gemini-embedding-001"
+
+# Characters per embedded transcript chunk (the model takes about 2k tokens)
+# and chunks per embedding request
+EMBEDDING_CHUNK_CHARS = 6000
+EMBEDDING_BATCH_SIZE = 100
+
+# Lifetime of the explicit context caches holding the fixed part of transcript
+# prompts; a cache is replaced CONTEXT_CACHE_REFRESH_SECONDS before it expires
+CONTEXT_CACHE_TTL_SECONDS = 3600
+CONTEXT_CACHE_REFRESH_SECONDS = 60
+
+# Prompt prefixes that may be served from a context cache: the fixed instructions
+# of each meeting type. Any other prefix carries per-call values and would need a
+# cache of its own for every call.
+CONTEXT_CACHEABLE_PREFIXES = frozenset({
+    SALES_PROMPT,
+    INTERNAL_PROMPT,
+    ONBOARDING_PROMPT,
+    SALES_DEPT_PROMPT,
+    PROJECT_MEETING_PROMPT,
+    SUPPORT_PROMPT,
+    EXISTING_CUSTOMER_PROMPT
+})
+
+# Largest batch the Batch API accepts inline; bigger batches are uploaded as a JSONL file
+BATCH_INLINE_LIMIT_BYTES = 20 * 1024 * 1024
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed Gemini request is worth retrying"""
+    if isinstance(error, errors.APIError):
+        return error.code == 429 or (error.code or 0) >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _is_outage(error: Exception) -> bool:
+    """Whether a failed Gemini request suggests the service is down (rather than busy or refusing it)"""
+    if isinstance(error, errors.APIError):
+        return (error.code or 0) >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _text_chars(contents) -> int:
+    """Characters of text in request contents (strings, Parts, Contents or lists of them)"""
+    if isinstance(contents, str):
+        return len(contents)
+    if isinstance(contents, (list, tuple)):
+        return sum(_text_chars(item) for item in contents)
+    text = getattr(contents, 'text', None)
+    if isinstance(text, str):
+        return len(text)
+    return _text_chars(getattr(contents, 'parts', None) or [])
+
+
+def _estimate_tokens(contents, config: Optional[types.GenerateContentConfig] = None) -> int:
+    """Rough token cost of a request, for the client-side rate limiter; images and files are not counted"""
+    output_tokens = (config.max_output_tokens if config else None) or 0
+    return int((_text_chars(contents) // 4 + output_tokens) * GEMINI_TOKEN_ESTIMATE_MARGIN)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retrying after the given (1-based) failed attempt"""
+    delay = min(GEMINI_BACKOFF_SECONDS * 2 ** (attempt - 1), GEMINI_MAX_BACKOFF_SECONDS)
+    return delay * random.uniform(1 - GEMINI_BACKOFF_JITTER, 1 + GEMINI_BACKOFF_JITTER)
+
+
+def _suggested_retry_delay(error: Exception) -> Optional[float]:
+    """Retry delay Gemini attached to a rate-limit error (google.rpc.RetryInfo), if any"""
+    if not isinstance(error, errors.APIError) or error.code != 429 or not isinstance(error.details, dict):
+        return None
+    for detail in error.details.get('error', {}).get('details', []):
+        if detail.get('@type', '').endswith('google.rpc.RetryInfo'):
+            try:
+                return min(float(detail.get('retryDelay', '').rstrip('s')), GEMINI_MAX_RETRY_DELAY_SECONDS)
+            except ValueError:
+                return None
+    return None
+
+
+class RateLimiter:
+    """
+    Requests- and tokens-per-minute budget for Gemini requests
+    
+    Each limit is a token bucket refilled continuously over a minute.
+    reserve() takes a request's share at once, letting the buckets go into
+    debt, and returns how long the caller should wait before sending the
+    request, so concurrent callers queue in order instead of polling.
+    """
+    
+    def __init__(self,
+                 requests_per_minute: int = GEMINI_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: int = GEMINI_TOKENS_PER_MINUTE):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, tokens: int) -> float:
+        """
+        Reserve budget for one request
+        
+        Args:
+            tokens: Estimated token cost of the request
+            
+        Returns:
+            Seconds to wait before sending the request
+        """
+        # A request bigger than the whole budget only has to wait for a full bucket
+        tokens = min(tokens, self.tokens_per_minute)
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            self._requests = min(
+                float(self.requests_per_minute),
+                self._requests + elapsed * self.requests_per_minute / 60
+            ) - 1
+            self._tokens = min(
+                float(self.tokens_per_minute),
+                self._tokens + elapsed * self.tokens_per_minute / 60
+            ) - tokens
+            return max(
+                0.0,
+                -self._requests * 60 / self.requests_per_minute,
+                -self._tokens * 60 / self.tokens_per_minute
+            )
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a Gemini request while the circuit breaker is open"""
+
+
+# Errors a Gemini request, or decoding its response, can end with. Handlers that
+# fall back to an empty result catch only these, so programming errors surface.
+GEMINI_ERRORS = (
+    errors.APIError,
+    errors.UnknownApiResponseError,
+    httpx.HTTPError,
+    CircuitOpenError,
+    orjson.JSONDecodeError,
+    ValidationError
+)
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker for Gemini requests
+    
+    After failure_threshold consecutive outage errors the circuit opens and
+    requests fail immediately with CircuitOpenError. Once reset_timeout has
+    passed a single probe request is let through (half-open): any response
+    from the service closes the circuit again, another outage error
+    re-opens it.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self,
+                 failure_threshold: int = GEMINI_BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = GEMINI_BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def before_call(self):
+        """
+        Check that a request may be sent
+        
+        Raises:
+            CircuitOpenError: While the circuit is open, or half-open with a probe in flight
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(f"Gemini appears to be unavailable; not retrying for {remaining:.0f}s")
+                self.state = self.HALF_OPEN
+            elif self.state == self.HALF_OPEN:
+                raise CircuitOpenError("Gemini appears to be unavailable; waiting on a probe request")
+    
+    def record(self, error: Optional[Exception] = None):
+        """Record the outcome of a request; only outage errors count as failures"""
+        with self._lock:
+            if error is None or not _is_outage(error):
+                self.state = self.CLOSED
+                self._failures = 0
+                return
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"⚠️ Gemini circuit opened after {self._failures} failures; failing fast for {self.reset_timeout:.0f}s")
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
 
 class ActionItem(BaseModel):
     """Model for an action item extracted from transcript"""
@@ -33,27 +311,225 @@ class TranscriptAnalysis(BaseModel):
     meeting_title: str = Field(description="Concise title for the meeting (10-30 characters)")
 
 
+# Generation settings, built once and shared by every request. Treat as read-only.
+# Structured-output config for transcript analysis. The SDK derives the response
+# schema from TranscriptAnalysis (field descriptions included) and parses the
+# response into it, so summary, participants, decisions, action items and
+# title all come back from a single request.
+TRANSCRIPT_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=TranscriptAnalysis,
+    temperature=0.1,  # Low temperature for consistent extraction
+    max_output_tokens=TRANSCRIPT_OUTPUT_TOKEN_STEPS[-1],  # Sales Sync meetings can have many action items
+    thinking_config=types.ThinkingConfig(thinking_budget=TRANSCRIPT_THINKING_BUDGET)
+)
+
+# Plain JSON output, used for quick tasks and simple extraction
+JSON_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    temperature=0.1
+)
+
+# Fingerprint of the TranscriptAnalysis schema, included in semantic cache scopes
+TRANSCRIPT_SCHEMA_VERSION = hashlib.blake2b(
+    orjson.dumps(TranscriptAnalysis.model_json_schema(), option=orjson.OPT_SORT_KEYS),
+    digest_size=16
+).hexdigest()
+
+# Values used for TranscriptAnalysis fields missing from a model response
+TRANSCRIPT_ANALYSIS_DEFAULTS = {
+    "action_items": [],
+    "summary": "",
+    "participants": [],
+    "key_decisions": [],
+    "meeting_title": "Meeting"
+}
+
+
+class ActionItemStreamParser:
+    """
+    Pull complete action items out of a transcript analysis while it streams in
+    
+    Feed it the chunks of the JSON response in order; each call returns the
+    action items whose objects were closed by that chunk. Only the
+    top-level "action_items" array is read, so the rest of the response can
+    arrive in any order.
+    """
+    
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        self._last_string = None
+        # Depth inside the action_items array: None until found, 0 once closed
+        self._array_depth = None
+        self._item_start = None
+    
+    def feed(self, text: str) -> List[Dict]:
+        """
+        Add a chunk of the response
+        
+        Args:
+            text: Next chunk of the JSON text
+            
+        Returns:
+            Action item dicts completed by this chunk
+        """
+        self._buffer += text
+        buffer = self._buffer
+        items = []
+        
+        while self._pos < len(buffer):
+            char = buffer[self._pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = buffer[self._string_start:self._pos]
+            elif char == '"':
+                self._in_string = True
+                self._string_start = self._pos + 1
+            elif char in '{[':
+                self._depth += 1
+                if char == '[' and self._depth == 2 and self._array_depth is None and self._last_string == 'action_items':
+                    self._array_depth = 2
+                elif char == '{' and self._array_depth and self._depth == self._array_depth + 1:
+                    self._item_start = self._pos
+            elif char in '}]':
+                if char == '}' and self._item_start is not None and self._depth == self._array_depth + 1:
+                    try:
+                        items.append(orjson.loads(buffer[self._item_start:self._pos + 1]))
+                    except orjson.JSONDecodeError as e:
+                        logger.warning(f"⚠️ Skipping malformed streamed action item: {e}")
+                    self._item_start = None
+                elif char == ']' and self._array_depth and self._depth == self._array_depth:
+                    self._array_depth = 0
+                self._depth -= 1
+            self._pos += 1
+        
+        return items
+
+
 class GeminiAnalyzer:
     """Analyze transcripts using Google Gemini AI"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-pro"):
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 model: str = "gemini-2.5-flash",
+                 fallback_model: Optional[str] = "gemini-2.5-pro",
+                 semantic_cache: Optional[SemanticCache] = None,
+                 context_caching: bool = False):
         """
         Initialize Gemini analyzer
         
         Args:
             api_key: Gemini API key (if None, will use environment variable)
-            model: Model to use ("gemini-2.5-pro", "gemini-2.5-flash", "gemini-1.5-flash", etc.)
+            model: Model to use ("gemini-2.5-flash", "gemini-2.5-pro", "gemini-1.5-flash", etc.)
+            fallback_model: Model used for transcript analysis when a transcript
+                is long or the default model finds no action items (None to
+                always use model)
+            semantic_cache: Cache to reuse analyses of identical or near-identical
+                transcripts from (optional, disabled by default)
+            context_caching: Serve the fixed part of transcript prompts from
+                explicit Gemini context caches (disabled by default)
         """
         self.api_key = api_key or os.getenv('GEMINI_API_KEY')
         if not self.api_key:
             raise ValueError("Gemini API key is required. Set GEMINI_API_KEY environment variable.")
         
         # Initialize client
-        self.client = genai.Client(api_key=self.api_key)
+        client_args = {'http2': GEMINI_HTTP2, 'limits': GEMINI_HTTP_LIMITS}
+        self.client = genai.Client(
+            api_key=self.api_key,
+            http_options=types.HttpOptions(client_args=client_args, async_client_args=client_args)
+        )
         self.model = model
+        self.fallback_model = fallback_model
+        self.semantic_cache = semantic_cache
+        self.context_caching = context_caching
+        
+        # Prompt prefix hash -> (context cache name or None if caching failed, refresh time)
+        self._context_caches: Dict[str, Tuple[Optional[str], float]] = {}
+        self._context_cache_lock = threading.Lock()
+        
+        # Monotonic time before which no request is sent, set when the API
+        # reports the quota is exhausted so concurrent calls back off together
+        self._cooldown_until = 0.0
+        
+        # Shared by every request path so an outage stops all of them at once
+        self._breaker = CircuitBreaker()
+        self._rate_limiter = RateLimiter()
         
         logger.info(f"Initialized Gemini analyzer with model: {model}")
     
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a failed request
+        
+        Uses the delay Gemini suggests on a rate-limit error, or exponential
+        backoff otherwise. A suggested delay also starts a cooldown that
+        holds back every other request made through this analyzer.
+        """
+        delay = _suggested_retry_delay(error)
+        if delay is None:
+            return _backoff_delay(attempt)
+        self._cooldown_until = max(self._cooldown_until, time.monotonic() + delay)
+        return delay
+    
+    def _cooldown_remaining(self) -> float:
+        """Seconds left of a rate-limit cooldown, 0 if none is active"""
+        return max(0.0, self._cooldown_until - time.monotonic())
+    
+    def _generate_content(self, **kwargs) -> types.GenerateContentResponse:
+        """
+        client.models.generate_content, retrying transient failures with backoff
+        
+        Each attempt first waits for room in the client-side rate limit.
+        
+        Raises:
+            CircuitOpenError: If Gemini has been failing and the circuit breaker is open
+        """
+        for attempt in range(1, GEMINI_MAX_ATTEMPTS + 1):
+            time.sleep(self._cooldown_remaining())
+            self._breaker.before_call()
+            time.sleep(self._rate_limiter.reserve(_estimate_tokens(kwargs.get('contents'), kwargs.get('config'))))
+            try:
+                response = self.client.models.generate_content(**kwargs)
+                self._breaker.record()
+                return response
+            except Exception as e:
+                self._breaker.record(e)
+                if attempt == GEMINI_MAX_ATTEMPTS or not _is_transient(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.warning(f"⚠️ Gemini request failed ({e}), retrying in {delay:.0f}s (attempt {attempt}/{GEMINI_MAX_ATTEMPTS})")
+                time.sleep(delay)
+    
+    async def _generate_content_async(self, **kwargs) -> types.GenerateContentResponse:
+        """Async counterpart of _generate_content() using the aio client"""
+        for attempt in range(1, GEMINI_MAX_ATTEMPTS + 1):
+            await asyncio.sleep(self._cooldown_remaining())
+            self._breaker.before_call()
+            await asyncio.sleep(self._rate_limiter.reserve(_estimate_tokens(kwargs.get('contents'), kwargs.get('config'))))
+            try:
+                response = await self.client.aio.models.generate_content(**kwargs)
+                self._breaker.record()
+                return response
+            except Exception as e:
+                self._breaker.record(e)
+                if attempt == GEMINI_MAX_ATTEMPTS or not _is_transient(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.warning(f"⚠️ Gemini request failed ({e}), retrying in {delay:.0f}s (attempt {attempt}/{GEMINI_MAX_ATTEMPTS})")
+                await asyncio.sleep(delay)
+    
     def analyze_transcript(self, 
                           transcript: str, 
                           customer_name: str,
@@ -65,6 +541,82 @@ class GeminiAnalyzer:
         """
         Analyze transcript and extract structured action items
         
+        For callers without a running event loop; async code awaits
+        analyze_transcript_async() instead.
+        
+        Args:
+            transcript: The transcript text to analyze
+            customer_name: Name of the customer/project
+            additional_context: Any additional context about the meeting
+            meeting_type: Type of meeting ("sales_call", "internal_meeting", or "project_meeting")
+            department: Department name for internal meetings
+            project: Project name for project meetings
+            
+        Returns:
+            TranscriptAnalysis object with extracted data
+        """
+        if len(transcript) > TRANSCRIPT_SINGLE_PASS_CHARS:
+            return run_sync(self._analyze_in_parts_async(
+                transcript, customer_name, additional_context, meeting_type, department, project
+            ), "analyze_transcript", "analyze_transcript_async")
+        
+        model = self._transcript_model(transcript)
+        analysis = self._analyze_transcript_with(
+            model, transcript, customer_name, additional_context, meeting_type, department, project
+        )
+        if self._should_escalate(model, transcript, analysis):
+            logger.info(f"{model} found no action items; retrying with {self.fallback_model}")
+            analysis = self._analyze_transcript_with(
+                self.fallback_model, transcript, customer_name, additional_context, meeting_type, department, project
+            )
+        return analysis
+    
+    def _analyze_transcript_with(self,
+                                 model: str,
+                                 transcript: str,
+                                 customer_name: str,
+                                 additional_context: str,
+                                 meeting_type: str,
+                                 department: str,
+                                 project: str) -> TranscriptAnalysis:
+        """Analyze a transcript in a single request to the given model"""
+        scope = self._transcript_cache_scope(model, customer_name, additional_context, meeting_type, department, project)
+        cached, embedding = self._lookup_transcript_cache(scope, transcript)
+        if cached:
+            return self.parse_transcript_text(cached)
+        
+        prompt = self._build_transcript_prompt(
+            transcript, customer_name, additional_context, meeting_type, department, project
+        )
+        
+        try:
+            # Generate response with structured output
+            response = self._send_transcript_prompt(prompt, model)
+            self._store_transcript_cache(scope, transcript, getattr(response, 'text', None), embedding)
+            return self._parse_transcript_response(response)
+            
+        except GEMINI_ERRORS as e:
+            logger.error(f"Error analyzing transcript: {str(e)}")
+            # Return empty analysis on error
+            return TranscriptAnalysis(
+                action_items=[],
+                summary="Error analyzing transcript",
+                participants=[],
+                key_decisions=[],
+                meeting_title="Meeting"
+            )
+    
+    async def analyze_transcript_async(self,
+                                       transcript: str,
+                                       customer_name: str,
+                                       additional_context: str = "",
+                                       meeting_type: str = "sales_call",
+                                       recording_link: str = "",
+                                       department: str = "",
+                                       project: str = "") -> TranscriptAnalysis:
+        """
+        Async version of analyze_transcript() using the SDK's aio client
+        
         Args:
             transcript: The transcript text to analyze
             customer_name: Name of the customer/project
@@ -76,6 +628,676 @@ class GeminiAnalyzer:
         Returns:
             TranscriptAnalysis object with extracted data
         """
+        if len(transcript) > TRANSCRIPT_SINGLE_PASS_CHARS:
+            return await self._analyze_in_parts_async(
+                transcript, customer_name, additional_context, meeting_type, department, project
+            )
+        
+        model = self._transcript_model(transcript)
+        analysis = await self._analyze_transcript_with_async(
+            model, transcript, customer_name, additional_context, meeting_type, department, project
+        )
+        if self._should_escalate(model, transcript, analysis):
+            logger.info(f"{model} found no action items; retrying with {self.fallback_model}")
+            analysis = await self._analyze_transcript_with_async(
+                self.fallback_model, transcript, customer_name, additional_context, meeting_type, department, project
+            )
+        return analysis
+    
+    async def _analyze_transcript_with_async(self,
+                                             model: str,
+                                             transcript: str,
+                                             customer_name: str,
+                                             additional_context: str,
+                                             meeting_type: str,
+                                             department: str,
+                                             project: str) -> TranscriptAnalysis:
+        """Async version of _analyze_transcript_with()"""
+        scope = self._transcript_cache_scope(model, customer_name, additional_context, meeting_type, department, project)
+        cached, embedding = await asyncio.to_thread(self._lookup_transcript_cache, scope, transcript)
+        if cached:
+            return self.parse_transcript_text(cached)
+        
+        prompt = self._build_transcript_prompt(
+            transcript, customer_name, additional_context, meeting_type, department, project
+        )
+        
+        try:
+            # Generate response with structured output
+            response = await self._send_transcript_prompt_async(prompt, model)
+            self._store_transcript_cache(scope, transcript, getattr(response, 'text', None), embedding)
+            return self._parse_transcript_response(response)
+            
+        except GEMINI_ERRORS as e:
+            logger.error(f"Error analyzing transcript: {str(e)}")
+            # Return empty analysis on error
+            return TranscriptAnalysis(
+                action_items=[],
+                summary="Error analyzing transcript",
+                participants=[],
+                key_decisions=[],
+                meeting_title="Meeting"
+            )
+    
+    async def analyze_transcripts_async(self,
+                                        jobs: List[Dict[str, str]],
+                                        max_concurrency: int = GEMINI_MAX_CONCURRENCY) -> List[TranscriptAnalysis]:
+        """
+        Analyze several transcripts concurrently
+        
+        Every distinct job runs through analyze_transcript_async(), with at
+        most max_concurrency requests in flight so a large batch doesn't run
+        into rate limits. Jobs repeated within the batch are analyzed once.
+        
+        Args:
+            jobs: One dict per transcript, holding the keyword arguments of
+                analyze_transcript_async()
+            max_concurrency: Maximum number of Gemini requests in flight
+            
+        Returns:
+            TranscriptAnalysis objects in the same order as jobs
+        """
+        limit = asyncio.Semaphore(max_concurrency)
+        
+        async def analyze(job: Dict[str, str]) -> TranscriptAnalysis:
+            async with limit:
+                return await self.analyze_transcript_async(**job)
+        
+        # Identical jobs share one request; later copies get their own copy of the result
+        keys = [tuple(sorted(job.items())) for job in jobs]
+        distinct = {key: job for key, job in zip(keys, jobs)}
+        if len(distinct) < len(jobs):
+            logger.info(f"Analyzing {len(distinct)} distinct transcripts for {len(jobs)} jobs")
+        results = dict(zip(distinct, await asyncio.gather(*[analyze(job) for job in distinct.values()])))
+        
+        analyses = []
+        seen = set()
+        for key in keys:
+            analyses.append(results[key] if key not in seen else results[key].model_copy(deep=True))
+            seen.add(key)
+        return analyses
+    
+    def analyze_transcripts(self,
+                            jobs: List[Dict[str, str]],
+                            max_concurrency: int = GEMINI_MAX_CONCURRENCY) -> List[TranscriptAnalysis]:
+        """Synchronous wrapper around analyze_transcripts_async(), for callers without a running event loop"""
+        return run_sync(self.analyze_transcripts_async(jobs, max_concurrency), "analyze_transcripts", "analyze_transcripts_async")
+    
+    async def _analyze_in_parts_async(self,
+                                      transcript: str,
+                                      customer_name: str,
+                                      additional_context: str,
+                                      meeting_type: str,
+                                      department: str,
+                                      project: str) -> TranscriptAnalysis:
+        """
+        Analyze a long transcript in parts and merge the results (map-reduce)
+        
+        The parts are analyzed concurrently. Action items are merged and
+        de-duplicated by title, participants and decisions are combined, and
+        one short extra request merges the part summaries into a summary and
+        title for the whole meeting.
+        
+        Returns:
+            TranscriptAnalysis for the whole transcript
+        """
+        parts = self._split_transcript(transcript)
+        logger.info(f"Transcript is {len(transcript)} characters; analyzing it in {len(parts)} parts")
+        
+        analyses = await self.analyze_transcripts_async([
+            {
+                'transcript': part,
+                'customer_name': customer_name,
+                'additional_context': additional_context,
+                'meeting_type': meeting_type,
+                'department': department,
+                'project': project
+            }
+            for part in parts
+        ])
+        succeeded = [
+            analysis for analysis in analyses
+            if analysis.action_items or not analysis.summary.startswith("Error")
+        ]
+        if not succeeded:
+            return analyses[0]
+        if len(succeeded) < len(analyses):
+            logger.warning(f"⚠️ {len(analyses) - len(succeeded)} of {len(analyses)} transcript parts failed to analyze")
+        
+        # Merge, keeping the first occurrence of each action item title
+        action_items = {}
+        for analysis in succeeded:
+            for item in analysis.action_items:
+                action_items.setdefault(' '.join(item.title.lower().split()), item)
+        
+        summary, meeting_title = await self._merge_summaries_async(succeeded)
+        return TranscriptAnalysis(
+            action_items=list(action_items.values()),
+            summary=summary,
+            participants=list(dict.fromkeys(name for analysis in succeeded for name in analysis.participants)),
+            key_decisions=list(dict.fromkeys(decision for analysis in succeeded for decision in analysis.key_decisions)),
+            meeting_title=meeting_title
+        )
+    
+    async def _merge_summaries_async(self, analyses: List[TranscriptAnalysis]) -> Tuple[str, str]:
+        """
+        Combine the summaries of consecutive transcript parts
+        
+        Returns:
+            Tuple of (summary, meeting_title); the joined part summaries and
+            the first part's title if the merge request fails
+        """
+        fallback = ("\n\n".join(analysis.summary for analysis in analyses), analyses[0].meeting_title)
+        if len(analyses) == 1:
+            return fallback
+        
+        prompt = MEETING_SUMMARY_MERGE_PROMPT.format(
+            part_count=len(analyses),
+            summaries="\n\n".join(
+                f"Part {index}: {analysis.summary}" for index, analysis in enumerate(analyses, 1)
+            )
+        )
+        try:
+            response = await self._generate_content_async(model=self.model, contents=prompt, config=JSON_CONFIG)
+            merged = orjson.loads(response.text)
+            return merged.get('summary') or fallback[0], merged.get('meeting_title') or fallback[1]
+        except GEMINI_ERRORS as e:
+            logger.warning(f"⚠️ Could not merge transcript part summaries: {e}")
+            return fallback
+    
+    @classmethod
+    def _split_transcript(cls,
+                          text: str,
+                          max_chars: int = TRANSCRIPT_CHUNK_CHARS,
+                          separators: Tuple[str, ...] = ("\n\n", "\n", ". ", " ")) -> List[str]:
+        """
+        Split a transcript into parts of at most max_chars
+        
+        Breaks between paragraphs (speaker turns) where possible, then
+        between lines, sentences and words; text without any separator is
+        cut at max_chars. Only the whitespace of a separator is dropped at a
+        break, so a sentence split keeps its full stop.
+        """
+        if len(text) <= max_chars:
+            return [text]
+        if not separators:
+            return [text[i:i + max_chars] for i in range(0, len(text), max_chars)]
+        
+        separator, finer_separators = separators[0], separators[1:]
+        # The non-whitespace part of the separator stays with the text before it
+        kept = separator.rstrip()
+        joiner = separator[len(kept):]
+        pieces = text.split(separator)
+        pieces = [piece + kept for piece in pieces[:-1]] + pieces[-1:]
+        
+        parts = []
+        current = ""
+        for piece in pieces:
+            candidate = f"{current}{joiner}{piece}" if current else piece
+            if len(candidate) <= max_chars:
+                current = candidate
+                continue
+            if current:
+                parts.append(current)
+            if len(piece) > max_chars:
+                parts.extend(cls._split_transcript(piece, max_chars, finer_separators))
+                current = ""
+            else:
+                current = piece
+        if current:
+            parts.append(current)
+        return parts
+    
+    def analyze_transcript_live(self,
+                                transcript: str,
+                                customer_name: str,
+                                additional_context: str = "",
+                                meeting_type: str = "sales_call",
+                                recording_link: str = "",
+                                department: str = "",
+                                project: str = "",
+                                on_action_item: Optional[Callable[[ActionItem], None]] = None,
+                                on_restart: Optional[Callable[[], None]] = None,
+                                on_retry: Optional[Callable[[int, float, Exception], None]] = None) -> TranscriptAnalysis:
+        """
+        Analyze a transcript, reporting action items as they stream in
+        
+        Takes the same arguments as analyze_transcript() and escalates to the
+        fallback model the same way; like it, for sync callers only. Unlike analyze_transcript(), errors are
+        raised to the caller rather than turned into an empty analysis.
+        
+        Args:
+            on_action_item: Called with each ActionItem as soon as it is complete
+            on_restart: Called when the analysis starts over (on the fallback
+                model or with a higher output cap), so items reported so far
+                should be discarded
+            on_retry: Called as on_retry(attempt, delay, error) before a
+                transient failure is retried
+            
+        Returns:
+            TranscriptAnalysis object with extracted data
+        """
+        if len(transcript) > TRANSCRIPT_SINGLE_PASS_CHARS:
+            # Long transcripts are analyzed in parts; the merged items arrive together
+            analysis = run_sync(self._analyze_in_parts_async(
+                transcript, customer_name, additional_context, meeting_type, department, project
+            ), "analyze_transcript_live", "analyze_transcript_async")
+            if on_action_item:
+                for item in analysis.action_items:
+                    on_action_item(item)
+            return analysis
+        
+        model = self._transcript_model(transcript)
+        analysis = self._analyze_transcript_live_with(
+            model, transcript, customer_name, additional_context, meeting_type, department, project,
+            on_action_item, on_restart, on_retry
+        )
+        if self._should_escalate(model, transcript, analysis):
+            logger.info(f"{model} found no action items; retrying with {self.fallback_model}")
+            if on_restart:
+                on_restart()
+            analysis = self._analyze_transcript_live_with(
+                self.fallback_model, transcript, customer_name, additional_context, meeting_type, department, project,
+                on_action_item, on_restart, on_retry
+            )
+        return analysis
+    
+    def _analyze_transcript_live_with(self,
+                                      model: str,
+                                      transcript: str,
+                                      customer_name: str,
+                                      additional_context: str,
+                                      meeting_type: str,
+                                      department: str,
+                                      project: str,
+                                      on_action_item: Optional[Callable[[ActionItem], None]],
+                                      on_restart: Optional[Callable[[], None]],
+                                      on_retry: Optional[Callable[[int, float, Exception], None]]) -> TranscriptAnalysis:
+        """
+        Analyze a transcript in a single streamed request to the given model
+        
+        Like _send_transcript_prompt(), a response cut off at one of the
+        TRANSCRIPT_OUTPUT_TOKEN_STEPS caps is streamed again with the next.
+        """
+        scope = self._transcript_cache_scope(model, customer_name, additional_context, meeting_type, department, project)
+        cached, embedding = self._lookup_transcript_cache(scope, transcript)
+        if cached:
+            if on_action_item:
+                for item in self.iter_action_items([cached]):
+                    on_action_item(item)
+            return self.parse_transcript_text(cached)
+        
+        prompt = self._build_transcript_prompt(
+            transcript, customer_name, additional_context, meeting_type, department, project
+        )
+        
+        for max_output_tokens in TRANSCRIPT_OUTPUT_TOKEN_STEPS:
+            responses = []
+            
+            def recorded_texts():
+                for response in self._stream_transcript_prompt(prompt, model, max_output_tokens, on_retry):
+                    responses.append(response)
+                    if response.text:
+                        yield response.text
+            
+            for item in self.iter_action_items(recorded_texts()):
+                if on_action_item:
+                    on_action_item(item)
+            
+            # The finish reason and token usage arrive with the last chunk
+            if (not responses
+                    or not self._hit_output_cap(responses[-1], max_output_tokens)
+                    or max_output_tokens == TRANSCRIPT_OUTPUT_TOKEN_STEPS[-1]):
+                break
+            if on_restart:
+                on_restart()
+        
+        text = ''.join(response.text for response in responses if response.text)
+        self._store_transcript_cache(scope, transcript, text, embedding)
+        return self.parse_transcript_text(text)
+    
+    def _stream_transcript_prompt(self,
+                                  prompt: str,
+                                  model: str,
+                                  max_output_tokens: Optional[int] = None,
+                                  on_retry: Optional[Callable[[int, float, Exception], None]] = None) -> Iterator[types.GenerateContentResponse]:
+        """
+        Stream the response to a transcript prompt
+        
+        Opening the stream is retried like any other request; once a chunk
+        has been yielded a failure is raised.
+        
+        Yields:
+            Response chunks, the last one carrying the finish reason and usage
+        """
+        contents, config = self._transcript_request(prompt, model, max_output_tokens)
+        
+        for attempt in range(1, GEMINI_MAX_ATTEMPTS + 1):
+            time.sleep(self._cooldown_remaining())
+            self._breaker.before_call()
+            time.sleep(self._rate_limiter.reserve(_estimate_tokens(contents, config)))
+            try:
+                stream = iter(self.client.models.generate_content_stream(
+                    model=model,
+                    contents=contents,
+                    config=config
+                ))
+                first_chunk = next(stream, None)
+                self._breaker.record()
+                break
+            except Exception as e:
+                self._breaker.record(e)
+                if attempt < GEMINI_MAX_ATTEMPTS and self._context_cache_gone(config, e):
+                    contents, config = self._transcript_request(prompt, model, max_output_tokens)
+                    continue
+                if attempt == GEMINI_MAX_ATTEMPTS or not _is_transient(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.warning(f"⚠️ Gemini stream failed ({e}), retrying in {delay:.0f}s (attempt {attempt}/{GEMINI_MAX_ATTEMPTS})")
+                if on_retry:
+                    on_retry(attempt, delay, e)
+                time.sleep(delay)
+        
+        if first_chunk is None:
+            return
+        yield first_chunk
+        yield from stream
+    
+    @staticmethod
+    def iter_action_items(chunks: Iterable[str]) -> Iterator[ActionItem]:
+        """
+        Yield action items from a streamed analysis as soon as each one is complete
+        
+        Lets callers start working on the first tasks (e.g. creating them in
+        Asana) while Gemini is still generating the rest of the response.
+        
+        Args:
+            chunks: Text chunks of a streamed transcript analysis
+            
+        Yields:
+            ActionItem objects in the order they appear in the response
+        """
+        parser = ActionItemStreamParser()
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                try:
+                    yield ActionItem(**item)
+                except ValidationError as e:
+                    logger.warning(f"⚠️ Skipping invalid streamed action item: {e}")
+    
+    def _transcript_model(self, transcript: str) -> str:
+        """Model for a single-pass transcript analysis: the fallback model for long transcripts"""
+        if self.fallback_model and len(transcript) >= FALLBACK_MODEL_MIN_CHARS:
+            return self.fallback_model
+        return self.model
+    
+    def _should_escalate(self, model: str, transcript: str, analysis: TranscriptAnalysis) -> bool:
+        """Whether to retry an analysis on the fallback model because it found no action items"""
+        return (
+            bool(self.fallback_model)
+            and model != self.fallback_model
+            and not analysis.action_items
+            and bool(transcript.strip())
+            and not analysis.summary.startswith("Error")
+        )
+    
+    def _transcript_cache_scope(self,
+                                model: str,
+                                customer_name: str,
+                                additional_context: str,
+                                meeting_type: str,
+                                department: str,
+                                project: str) -> str:
+        """
+        Semantic cache scope covering every prompt input other than the transcript
+        
+        The model and response schema are part of the scope too, so answers
+        from another model or in an older shape are never reused.
+        """
+        return json.dumps([
+            model, TRANSCRIPT_SCHEMA_VERSION,
+            customer_name, additional_context, meeting_type, department, project
+        ])
+    
+    def _embed_transcript(self, transcript: str) -> Optional[List[float]]:
+        """
+        Embed a transcript for semantic cache lookups
+        
+        Long transcripts are split into EMBEDDING_CHUNK_CHARS chunks that are
+        embedded separately and averaged, so the whole transcript counts.
+        
+        Returns:
+            The embedding, or None if the embedding request failed
+        """
+        chunks = [
+            transcript[i:i + EMBEDDING_CHUNK_CHARS]
+            for i in range(0, len(transcript), EMBEDDING_CHUNK_CHARS)
+        ] or [transcript]
+        try:
+            vectors = []
+            for i in range(0, len(chunks), EMBEDDING_BATCH_SIZE):
+                result = self.client.models.embed_content(
+                    model=EMBEDDING_MODEL,
+                    contents=chunks[i:i + EMBEDDING_BATCH_SIZE],
+                    config=types.EmbedContentConfig(task_type="SEMANTIC_SIMILARITY")
+                )
+                vectors.extend(embedding.values for embedding in result.embeddings)
+        except GEMINI_ERRORS as e:
+            logger.warning(f"⚠️ Could not embed transcript for the semantic cache: {e}")
+            return None
+        
+        return [sum(values) / len(vectors) for values in zip(*vectors)]
+    
+    def _lookup_transcript_cache(self, scope: str, transcript: str) -> Tuple[Optional[str], Optional[List[float]]]:
+        """
+        Look up a cached analysis for a transcript
+        
+        Returns:
+            Tuple of (cached response text or None, transcript embedding to
+            store with a fresh response, or None)
+        """
+        if self.semantic_cache is None:
+            return None, None
+        
+        cached = self.semantic_cache.get_exact(scope, transcript)
+        if cached:
+            logger.info("✅ Reusing cached analysis of an identical transcript")
+            return cached, None
+        
+        embedding = self._embed_transcript(transcript)
+        if embedding is not None:
+            cached = self.semantic_cache.get_similar(scope, transcript, embedding)
+            if cached:
+                logger.info("✅ Reusing cached analysis of a near-identical transcript")
+        return cached, embedding
+    
+    def _store_transcript_cache(self,
+                                scope: str,
+                                transcript: str,
+                                response_text: Optional[str],
+                                embedding: Optional[List[float]]):
+        """Cache an analysis response, if it is valid JSON"""
+        if self.semantic_cache is None or not response_text:
+            return
+        try:
+            orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            return
+        self.semantic_cache.put(scope, transcript, response_text, embedding)
+    
+    def submit_transcript_batch(self, jobs: List[Dict[str, str]]) -> str:
+        """
+        Queue transcript analyses with the Gemini Batch API
+        
+        Batch jobs cost half as much as interactive calls but finish
+        asynchronously, usually within minutes and at most within 24 hours.
+        Requests are sent inline, or uploaded as a JSONL file when they
+        exceed BATCH_INLINE_LIMIT_BYTES.
+        
+        Args:
+            jobs: One dict per transcript, holding the keyword arguments of
+                analyze_transcript() (recording_link is ignored)
+            
+        Returns:
+            Name of the batch job, to poll with get_transcript_batch()
+        """
+        prompts = [
+            self._build_transcript_prompt(
+                job['transcript'],
+                job['customer_name'],
+                job.get('additional_context', ""),
+                job.get('meeting_type', "sales_call"),
+                job.get('department', ""),
+                job.get('project', "")
+            )
+            for job in jobs
+        ]
+        config = self._transcript_config()
+        display_name = f"transcript-analysis-{len(jobs)}"
+        
+        if sum(len(prompt.encode('utf-8')) for prompt in prompts) > BATCH_INLINE_LIMIT_BYTES:
+            src = self._upload_batch_file(prompts, config, display_name)
+        else:
+            src = [
+                {'contents': [{'role': 'user', 'parts': [{'text': prompt}]}], 'config': config}
+                for prompt in prompts
+            ]
+        
+        batch_job = self.client.batches.create(
+            model=self.model,
+            src=src,
+            config={'display_name': display_name}
+        )
+        logger.info(f"Queued batch job {batch_job.name} with {len(jobs)} transcript(s)")
+        return batch_job.name
+    
+    def get_transcript_batch(self, job_name: str) -> Tuple[str, Optional[List[TranscriptAnalysis]]]:
+        """
+        Check a batch job queued by submit_transcript_batch()
+        
+        Args:
+            job_name: Name returned by submit_transcript_batch()
+            
+        Returns:
+            Tuple of (job state, analyses in submission order or None if the
+            job hasn't succeeded)
+        """
+        state, texts = self._batch_response_texts(job_name)
+        if texts is None:
+            return state, None
+        
+        analyses = []
+        for text in texts:
+            if text:
+                analyses.append(self.parse_transcript_text(text))
+            else:
+                analyses.append(TranscriptAnalysis(
+                    action_items=[],
+                    summary="Error analyzing transcript",
+                    participants=[],
+                    key_decisions=[],
+                    meeting_title="Meeting"
+                ))
+        return state, analyses
+    
+    def _upload_batch_file(self,
+                           prompts: List[str],
+                           config: types.GenerateContentConfig,
+                           display_name: str) -> str:
+        """
+        Upload batch requests as a JSONL file
+        
+        Each line is keyed "request-<index>" so responses can be put back
+        in submission order.
+        
+        Returns:
+            Name of the uploaded file, to pass as the batch source
+        """
+        if isinstance(config.response_schema, type):
+            # The SDK converts model classes when it sends a request; a raw
+            # request file needs the JSON schema instead
+            config = config.model_copy(update={
+                'response_schema': None,
+                'response_json_schema': config.response_schema.model_json_schema()
+            })
+        generation_config = config.model_dump(mode='json', exclude_none=True)
+        lines = [
+            orjson.dumps({
+                'key': f"request-{index}",
+                'request': {
+                    'contents': [{'role': 'user', 'parts': [{'text': prompt}]}],
+                    'generation_config': generation_config
+                }
+            })
+            for index, prompt in enumerate(prompts)
+        ]
+        uploaded = self.client.files.upload(
+            file=io.BytesIO(b'\n'.join(lines)),
+            config={'display_name': display_name, 'mime_type': 'jsonl'}
+        )
+        logger.info(f"Uploaded {len(prompts)} batch request(s) as {uploaded.name}")
+        return uploaded.name
+    
+    def _batch_file_texts(self, file_name: str, job_name: str) -> List[Optional[str]]:
+        """Response texts from a JSONL batch result file, in submission order"""
+        results = {}
+        for line in self.client.files.download(file=file_name).splitlines():
+            if not line.strip():
+                continue
+            result = orjson.loads(line)
+            parts = (
+                (result.get('response', {}).get('candidates') or [{}])[0]
+                .get('content', {}).get('parts', [])
+            )
+            text = ''.join(part.get('text', '') for part in parts)
+            if not text:
+                logger.error(f"Batch request failed in {job_name}: {result.get('error')}")
+            results[int(result['key'].rsplit('-', 1)[1])] = text or None
+        return [results.get(index) for index in range(max(results, default=-1) + 1)]
+    
+    def _batch_response_texts(self, job_name: str) -> Tuple[str, Optional[List[Optional[str]]]]:
+        """
+        Fetch a batch job and, once it has succeeded, the text of each response
+        
+        Returns:
+            Tuple of (job state, response texts in submission order with None
+            for failed requests, or None if the job hasn't succeeded)
+        """
+        batch_job = self.client.batches.get(name=job_name)
+        state = getattr(batch_job.state, 'name', str(batch_job.state))
+        
+        if state != 'JOB_STATE_SUCCEEDED':
+            return state, None
+        
+        if batch_job.dest.file_name:
+            return state, self._batch_file_texts(batch_job.dest.file_name, job_name)
+        
+        texts = []
+        for inlined in batch_job.dest.inlined_responses:
+            if inlined.response and inlined.response.text:
+                texts.append(inlined.response.text)
+            else:
+                logger.error(f"Batch request failed in {job_name}: {inlined.error}")
+                texts.append(None)
+        return state, texts
+    
+    def _build_transcript_prompt(self,
+                                 transcript: str,
+                                 customer_name: str,
+                                 additional_context: str = "",
+                                 meeting_type: str = "sales_call",
+                                 department: str = "",
+                                 project: str = "") -> str:
+        """
+        Pick the prompt for a transcript based on meeting type, department and project
+        
+        Each prompt puts its fixed context and instructions first and the
+        per-call customer details and transcript last, so consecutive calls of
+        the same meeting type share a long prefix for Gemini's implicit caching.
+        
+        Returns:
+            The full analysis prompt
+        """
         # Create the analysis prompt based on meeting type
         if meeting_type == "internal_meeting":
             # Check for department-specific prompts
@@ -100,111 +1322,230 @@ class GeminiAnalyzer:
         else:
             prompt = self._create_sales_prompt(transcript, customer_name, additional_context)
         
+        return prompt
+    
+    def _send_transcript_prompt(self, prompt: str, model: str) -> types.GenerateContentResponse:
+        """
+        Send a transcript prompt, raising the output cap while the response is cut off
+        
+        Tries each cap in TRANSCRIPT_OUTPUT_TOKEN_STEPS until a response
+        finishes below it. A context cache that has disappeared is recreated
+        once along the way.
+        """
+        for max_output_tokens in TRANSCRIPT_OUTPUT_TOKEN_STEPS:
+            contents, config = self._transcript_request(prompt, model, max_output_tokens)
+            try:
+                response = self._generate_content(model=model, contents=contents, config=config)
+            except errors.APIError as e:
+                if not self._context_cache_gone(config, e):
+                    raise
+                contents, config = self._transcript_request(prompt, model, max_output_tokens)
+                response = self._generate_content(model=model, contents=contents, config=config)
+            if not self._hit_output_cap(response, max_output_tokens):
+                break
+        return response
+    
+    async def _send_transcript_prompt_async(self, prompt: str, model: str) -> types.GenerateContentResponse:
+        """Async version of _send_transcript_prompt()"""
+        for max_output_tokens in TRANSCRIPT_OUTPUT_TOKEN_STEPS:
+            contents, config = await asyncio.to_thread(self._transcript_request, prompt, model, max_output_tokens)
+            try:
+                response = await self._generate_content_async(model=model, contents=contents, config=config)
+            except errors.APIError as e:
+                if not self._context_cache_gone(config, e):
+                    raise
+                contents, config = await asyncio.to_thread(self._transcript_request, prompt, model, max_output_tokens)
+                response = await self._generate_content_async(model=model, contents=contents, config=config)
+            if not self._hit_output_cap(response, max_output_tokens):
+                break
+        return response
+    
+    @staticmethod
+    def _hit_output_cap(response: types.GenerateContentResponse, max_output_tokens: int) -> bool:
+        """
+        Whether a response was cut off by its output token cap
+        
+        Also logs the output and thinking tokens used, so the caps in
+        TRANSCRIPT_OUTPUT_TOKEN_STEPS can be tuned.
+        """
+        usage = response.usage_metadata
+        if usage:
+            logger.info(
+                f"Transcript analysis used {usage.candidates_token_count or 0} output and "
+                f"{usage.thoughts_token_count or 0} thinking tokens (cap {max_output_tokens})"
+            )
+        if not response.candidates or response.candidates[0].finish_reason != types.FinishReason.MAX_TOKENS:
+            return False
+        if max_output_tokens < TRANSCRIPT_OUTPUT_TOKEN_STEPS[-1]:
+            logger.warning(f"⚠️ Transcript analysis hit the {max_output_tokens}-token output cap; retrying with a higher cap")
+        return True
+    
+    def _transcript_request(self,
+                            prompt: str,
+                            model: str,
+                            max_output_tokens: Optional[int] = None) -> Tuple[str, types.GenerateContentConfig]:
+        """
+        Contents and config for a transcript prompt sent to model
+        
+        With context caching enabled, the fixed part of the prompt (before
+        PROMPT_DYNAMIC_MARKER) is served from a context cache and only the
+        per-call part is sent, giving one cache per meeting type and model.
+        Otherwise, or when the part before the marker isn't one of the
+        CONTEXT_CACHEABLE_PREFIXES, the whole prompt is sent.
+        """
+        if self.context_caching and PROMPT_DYNAMIC_MARKER in prompt:
+            prefix, marker, suffix = prompt.partition(PROMPT_DYNAMIC_MARKER)
+            cache_name = self._context_cache_name(prefix, model) if prefix in CONTEXT_CACHEABLE_PREFIXES else None
+            if cache_name:
+                return marker.lstrip() + suffix, self._transcript_config(cache_name, max_output_tokens)
+        return prompt, self._transcript_config(max_output_tokens=max_output_tokens)
+    
+    def _context_cache_name(self, prefix: str, model: str) -> Optional[str]:
+        """
+        Name of the context cache holding a prompt prefix, created on first use
+        
+        A prefix the API won't cache (for example one below the model's
+        minimum cacheable size) is remembered as uncacheable for the cache
+        lifetime, so the request isn't repeated on every call.
+        """
+        key = hashlib.blake2b(f"{model}\n{prefix}".encode('utf-8'), digest_size=16).hexdigest()
+        with self._context_cache_lock:
+            entry = self._context_caches.get(key)
+            if entry and entry[1] > time.monotonic():
+                return entry[0]
+        
         try:
-            # Generate response with structured output using manual schema
-            # Convert Pydantic model to schema dict for compatibility
-            schema = {
-                "type": "object",
-                "properties": {
-                    "action_items": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "title": {"type": "string"},
-                                "description": {"type": "string"},
-                                "priority": {"type": "string"},
-                                "mentioned_by": {"type": "string"},
-                                "timestamp": {"type": "string"},
-                                "is_question": {"type": "boolean"}
-                            },
-                            "required": ["title", "description"]
-                        }
-                    },
-                    "summary": {"type": "string"},
-                    "participants": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                    "key_decisions": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                    "meeting_title": {"type": "string"}
-                },
-                "required": ["action_items", "summary", "participants", "key_decisions", "meeting_title"]
-            }
-            
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=schema,
-                    temperature=0.1,  # Low temperature for consistent extraction
-                    max_output_tokens=8192  # Increased for Sales Sync meetings with many action items
+            cache = self.client.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    display_name=f"transcript-prompt-{key[:12]}",
+                    contents=[types.Content(role="user", parts=[types.Part(text=prefix)])],
+                    ttl=f"{CONTEXT_CACHE_TTL_SECONDS}s"
                 )
             )
+            cache_name = cache.name
+            logger.info(f"✅ Created context cache {cache_name} for a transcript prompt")
+        except GEMINI_ERRORS as e:
+            logger.warning(f"⚠️ Could not create context cache, sending full prompts: {e}")
+            cache_name = None
+        
+        with self._context_cache_lock:
+            self._context_caches[key] = (
+                cache_name,
+                time.monotonic() + CONTEXT_CACHE_TTL_SECONDS - CONTEXT_CACHE_REFRESH_SECONDS
+            )
+        return cache_name
+    
+    def _context_cache_gone(self, config: types.GenerateContentConfig, error: Exception) -> bool:
+        """
+        Whether a request failed because its context cache no longer exists
+        
+        Caches can expire or be deleted before the refresh time recorded
+        here. When that happens the cache is forgotten, so the next
+        _transcript_request() creates a new one.
+        """
+        if not config.cached_content or not isinstance(error, errors.APIError) or error.code not in (403, 404):
+            return False
+        with self._context_cache_lock:
+            for key, (cache_name, _) in list(self._context_caches.items()):
+                if cache_name == config.cached_content:
+                    del self._context_caches[key]
+        logger.warning(f"⚠️ Context cache {config.cached_content} is gone; recreating it")
+        return True
+    
+    def _transcript_config(self,
+                           cached_content: Optional[str] = None,
+                           max_output_tokens: Optional[int] = None) -> types.GenerateContentConfig:
+        """
+        Structured-output config used for transcript analysis
+        
+        Args:
+            cached_content: Name of a context cache holding the start of the prompt (optional)
+            max_output_tokens: Output token cap (optional, default the highest cap)
             
-            # Parse the response
-            if hasattr(response, 'text') and response.text:
-                try:
-                    result_json = json.loads(response.text)
-                except json.JSONDecodeError as json_error:
-                    logger.error(f"JSON parsing error: {json_error}")
-                    logger.error(f"Response text (first 500 chars): {response.text[:500]}")
-                    logger.error(f"Response text (around error position): {response.text[max(0, json_error.pos-100):min(len(response.text), json_error.pos+100)]}")
-                    
-                    # Try to clean the response and parse again
-                    try:
-                        # Remove any trailing commas and fix common JSON issues
-                        cleaned_text = response.text.strip()
-                        # Try to fix unterminated strings by escaping quotes
-                        cleaned_text = cleaned_text.replace('\\"', '\\\"')
-                        result_json = json.loads(cleaned_text)
-                        logger.info("Successfully parsed after cleaning")
-                    except:
-                        # If still failing, return partial analysis
-                        logger.error("Could not parse JSON even after cleaning")
-                        return TranscriptAnalysis(
-                            action_items=[],
-                            summary="Error parsing AI response - JSON formatting issue",
-                            participants=[],
-                            key_decisions=[],
-                            meeting_title="Sales Sync Meeting"
-                        )
-                
-                # Convert to Pydantic model
-                analysis = TranscriptAnalysis(
-                    action_items=[ActionItem(**item) for item in result_json.get('action_items', [])],
-                    summary=result_json.get('summary', ''),
-                    participants=result_json.get('participants', []),
-                    key_decisions=result_json.get('key_decisions', []),
-                    meeting_title=result_json.get('meeting_title', 'Meeting')
-                )
-            else:
-                # Fallback empty analysis
-                analysis = TranscriptAnalysis(
-                    action_items=[],
-                    summary="Unable to extract content",
-                    participants=[],
-                    key_decisions=[],
-                    meeting_title="Meeting"
-                )
+        Returns:
+            The shared TRANSCRIPT_CONFIG, or a copy with the given settings
+        """
+        update = {}
+        if cached_content:
+            update['cached_content'] = cached_content
+        if max_output_tokens and max_output_tokens != TRANSCRIPT_CONFIG.max_output_tokens:
+            update['max_output_tokens'] = max_output_tokens
+        if update:
+            return TRANSCRIPT_CONFIG.model_copy(update=update)
+        return TRANSCRIPT_CONFIG
+    
+    def _parse_transcript_response(self, response) -> TranscriptAnalysis:
+        """
+        Convert a structured-output Gemini response into a TranscriptAnalysis
+        
+        Args:
+            response: Response returned by generate_content
             
+        Returns:
+            TranscriptAnalysis object with extracted data
+        """
+        # The SDK has already validated the response against TranscriptAnalysis;
+        # parsed is None when that failed, and the text is repaired by hand
+        analysis = getattr(response, 'parsed', None)
+        if isinstance(analysis, TranscriptAnalysis):
             logger.info(f"Successfully analyzed transcript. Found {len(analysis.action_items)} action items.")
             return analysis
+        return self.parse_transcript_text(getattr(response, 'text', None))
+    
+    def parse_transcript_text(self, response_text: Optional[str]) -> TranscriptAnalysis:
+        """
+        Convert the JSON text of a transcript analysis into a TranscriptAnalysis
+        
+        Args:
+            response_text: Full JSON text returned by the model (may be empty)
             
-        except Exception as e:
-            logger.error(f"Error analyzing transcript: {str(e)}")
-            # Return empty analysis on error
-            return TranscriptAnalysis(
+        Returns:
+            TranscriptAnalysis object with extracted data
+        """
+        # Parse the response
+        if response_text:
+            try:
+                result_json = orjson.loads(response_text)
+            except orjson.JSONDecodeError as json_error:
+                logger.error(f"JSON parsing error: {json_error}")
+                logger.error(f"Response text (first 500 chars): {response_text[:500]}")
+                logger.error(f"Response text (around error position): {response_text[max(0, json_error.pos-100):min(len(response_text), json_error.pos+100)]}")
+                
+                # Try to clean the response and parse again
+                try:
+                    # Remove any trailing commas and fix common JSON issues
+                    cleaned_text = response_text.strip()
+                    # Try to fix unterminated strings by escaping quotes
+                    cleaned_text = cleaned_text.replace('\\"', '\\\"')
+                    result_json = orjson.loads(cleaned_text)
+                    logger.info("Successfully parsed after cleaning")
+                except orjson.JSONDecodeError:
+                    # If still failing, return partial analysis
+                    logger.error("Could not parse JSON even after cleaning")
+                    return TranscriptAnalysis(
+                        action_items=[],
+                        summary="Error parsing AI response - JSON formatting issue",
+                        participants=[],
+                        key_decisions=[],
+                        meeting_title="Sales Sync Meeting"
+                    )
+            
+            # Convert to Pydantic model in a single validation pass, filling in
+            # any fields the model left out
+            analysis = TranscriptAnalysis.model_validate({**TRANSCRIPT_ANALYSIS_DEFAULTS, **result_json})
+        else:
+            # Fallback empty analysis
+            analysis = TranscriptAnalysis(
                 action_items=[],
-                summary="Error analyzing transcript",
+                summary="Unable to extract content",
                 participants=[],
                 key_decisions=[],
                 meeting_title="Meeting"
             )
+        
+        logger.info(f"Successfully analyzed transcript. Found {len(analysis.action_items)} action items.")
+        return analysis
     
     def _create_sales_prompt(self, transcript: str, customer_name: str, additional_context: str) -> str:
         """
@@ -226,135 +1567,11 @@ Customer-Specific Context:
 {additional_context}
 """
         
-        prompt = f"""<context>
-You are analyzing a sales call transcript for {customer_name}, a prospect/customer of Opus.
-
-About the presenter: Adi Tiwari, VP of Operations and Sales Executive at Opus, a software company specializing in behavioral health software.
-
-Opus Products:
-- EHR (Electronic Health Record) - Main product
-- CRM (Customer Relationship Management) - White-labeled
-- RCM (Revenue Cycle Management) - White-labeled
-- Opus Kiosk
-- AI Scribe Co-pilot
-
-Typical attendees from prospects:
-- Providers/Therapists
-- Billers
-- Front desk staff
-- Admins
-- Owners/Operators
-{customer_context_section}
-</context>
-
-<transcript>
-{transcript}
-</transcript>
-
-<instructions>
-CONTEXT: You are analyzing a sales call where Adi Tiwari is the Opus sales executive/presenter.
-
-Analyze this sales call transcript and extract:
-1. Action items - ONLY tasks that Adi Tiwari specifically needs to complete
-2. A brief summary of the demo/call
-3. List of participants (names and roles if mentioned)
-4. Key decisions or buying signals
-5. Meeting title - Create a concise descriptive title (10-30 chars) that captures the essence of this call:
-   - Examples: "Initial Demo", "Follow-up - Billing", "Technical Deep Dive", "Pricing Discussion", "Implementation Planning"
-   - Focus on the main topic or stage of the sales process
-
-For action items, focus on:
-- Questions that need answers (technical, pricing, compliance, integration)
-- Follow-up materials to send
-- Next steps discussed
-- Features or modules to demonstrate further
-- Implementation or timeline discussions
-
-TIMESTAMP EXTRACTION:
-- Look for timestamps in the transcript (format: MM:SS or HH:MM:SS)
-- Record the timestamp when each action item or question was discussed
-- If multiple timestamps, use the first clear mention
-- If no timestamp found, leave as null
-
-CUSTOMER QUESTIONS:
-- Mark items as questions (is_question: true) when:
-  - Customer explicitly asks "What about...?", "How does...?", "Can you...?"
-  - Customer requests information or clarification
-  - Topic requires follow-up research or answer
-- For questions, format title as: "Customer Question: [brief question]"
-- Include full context in description
-
-MANDATORY TASKS FOR SALES CALLS - ALWAYS INCLUDE THESE THREE:
-(Use "{customer_name}" as the customer name in the titles below)
-
-1. SUMMARY OF CALL (ALWAYS REQUIRED - MUST BE FIRST):
-   - Title: "SUMMARY OF CALL"
-   - Priority: low
-   - Description: Provide a comprehensive meeting summary including:
-     * Meeting stage/type (initial discovery, demo, follow-up, pricing discussion, technical deep dive, etc.)
-     * Key topics discussed and main points covered
-     * Customer's level of engagement and sentiment (interested, hesitant, excited, concerned, etc.)
-     * Primary pain points or challenges the customer mentioned
-     * Opus products/features that were demonstrated or discussed
-     * Customer's specific use cases and requirements
-     * Important questions raised by the customer and how they were addressed
-     * Any objections or concerns expressed
-     * Buying signals or positive indicators observed
-     * Next steps and expected timeline
-     * Overall assessment of the call's success and progress in the sales cycle
-   - This is NOT an action item - it's purely informational for reference
-   - Write in a narrative style that gives context to someone who wasn't on the call
-
-2. SEND FOLLOW-UP EMAIL (ALWAYS REQUIRED):
-   - Title: "Send follow-up email to {customer_name}"
-   - Priority: high
-   - Description should include a HIGH-LEVEL SUMMARY (one paragraph):
-     * What was demonstrated/discussed (high-level topics, not technical details)
-     * Key points of interest from the customer
-     * Main concerns or requirements mentioned
-     * Next steps agreed upon
-   - Do NOT include technical implementation details or feature specifics
-   - Example: "Demonstrated the EHR platform focusing on scheduling and billing modules. Customer expressed interest in insurance verification features and workflow automation. Main concern was integration with existing systems. Agreed to schedule a follow-up call next week to discuss implementation timeline."
-
-3. UPDATE HUBSPOT (ALWAYS REQUIRED):
-   - Title: "Update HubSpot for {customer_name}"
-   - Priority: high
-   - Description MUST include these specific instructions:
-     * Update the 'Next Step' field in HubSpot for this deal
-     * Set the 'Next Activity Date' based on discussed timeline
-     * Create a task in HubSpot for the next action (e.g., "Follow up with client in one week", "Send pricing proposal by Friday")
-     * Log this call/meeting as an activity
-   - Include what the next action should be based on the conversation
-
-ADDITIONAL ACTION ITEMS:
-Then extract any OTHER action items that ADI TIWARI explicitly owns or commits to:
-- Look for phrases like "I'll send", "I'll schedule", "I'll follow up", "Let me get you"
-- Exclude tasks assigned to prospects/customers (like "Steve will send")
-- Exclude general discussion topics that aren't clear assignments
-- If unclear who owns it, default to NOT including it as Adi's action
-
-IMPORTANT: Write action items with enough context so someone who didn't attend the meeting can understand:
-- What specific question was asked
-- What feature/module was discussed
-- What the customer's concern or requirement is
-- Why this follow-up is needed
-
-OWNERSHIP RULES:
-- If someone says "Steve will send..." → That's Steve's task, NOT Adi's
-- If David says "I will collect data..." → That's David's task, NOT Adi's  
-- If Adi says "I'll send..." or "Let me..." → That IS Adi's task
-- General discussions without clear ownership → NOT an action item
-- When in doubt about ownership → EXCLUDE it
-
-Prioritize based on:
-- High: Blocking decisions, urgent timeline, critical requirements
-- Medium: Important but not urgent, standard follow-ups
-- Low: Nice-to-have information, future considerations
-
-Return a structured JSON response with all extracted information.
-</instructions>"""
-        
-        return prompt
+        return transcript_prompt(
+            SALES_PROMPT,
+            f"Customer: {customer_name}\n{customer_context_section}",
+            transcript
+        )
     
     def _create_internal_prompt(self, transcript: str, additional_context: str) -> str:
         """
@@ -367,85 +1584,7 @@ Return a structured JSON response with all extracted information.
         Returns:
             Formatted prompt string for internal meetings
         """
-        prompt = f"""<context>
-You are analyzing an internal Opus meeting transcript.
-
-About Opus:
-- Software company specializing in behavioral health
-- Main product: EHR (Electronic Health Record)
-- Other products: CRM, RCM (both white-labeled), Opus Kiosk, AI Scribe Co-pilot
-
-Meeting context:
-- Internal operational or strategic meeting
-- Attendees are Opus team members
-- Adi Tiwari is VP of Operations, handles support, marketing, and cross-functional operations
-
-KEY DEPARTMENT HEADS FOR TASK DELEGATION:
-- Marketing: Sean Rickenbacker (Marketing Director)
-- Engineering/Development: Hector Fraginals (CTO)
-- Onboarding/Training: Janelle Hall (Lead Onboarding Director)
-- Support: John (Support Lead)
-
-{additional_context if additional_context else ""}
-</context>
-
-<transcript>
-{transcript}
-</transcript>
-
-<instructions>
-Analyze this internal meeting transcript and extract:
-1. Action items - specific tasks that need to be completed
-2. A brief summary of the meeting
-3. List of participants (Opus team members)
-4. Key decisions made
-5. Meeting title - Create a concise descriptive title (10-30 chars) that captures the meeting type:
-   - Examples: "Leadership Sync", "Retrospective", "Sprint Planning", "Training Session", "Strategy Review", "Support Review"
-   - Focus on the type or purpose of the meeting
-
-MANDATORY TASK - ALWAYS INCLUDE AS FIRST ACTION ITEM:
-1. SUMMARY OF CALL:
-   - Title: "SUMMARY OF CALL"
-   - Priority: low
-   - Description: Comprehensive meeting overview including:
-     * Meeting purpose and context
-     * Main topics discussed and key points covered
-     * Department(s) involved and their perspectives
-     * Important decisions made or deferred
-     * Process improvements or changes discussed
-     * Cross-functional dependencies identified
-     * Team dynamics and engagement level
-     * Any blockers or challenges raised
-     * Action items agreed upon and ownership
-     * Next steps and follow-up meetings planned
-     * Overall meeting effectiveness and outcomes
-   - This is NOT an action item requiring work - it's informational documentation
-   - Write as a narrative that provides context for team members who weren't present
-
-For additional action items:
-- Extract clear, actionable tasks
-- Focus on operational and strategic items
-- Include decisions that require follow-up
-- Note cross-functional dependencies
-- Capture process improvements or changes discussed
-
-IMPORTANT:
-- Tasks are rarely assigned to Adi unless explicitly stated
-- Most tasks are for team organization and will be assigned later in Asana
-- Include enough context for proper task assignment later
-- Focus on WHO needs to do WHAT by WHEN (if mentioned)
-- Do NOT use the is_question flag - that's only for sales calls with external customers
-- Internal meetings generate action items for department heads, NOT customer questions
-
-Prioritize based on:
-- High: Critical operational issues, customer-impacting items, urgent deadlines
-- Medium: Standard operational tasks, process improvements
-- Low: Future considerations, nice-to-have improvements
-
-Return a structured JSON response with all extracted information.
-</instructions>"""
-        
-        return prompt
+        return transcript_prompt(INTERNAL_PROMPT, additional_context if additional_context else "", transcript)
     
     def _create_onboarding_prompt(self, transcript: str, additional_context: str) -> str:
         """
@@ -458,90 +1597,7 @@ Return a structured JSON response with all extracted information.
         Returns:
             Formatted prompt string for onboarding meetings
         """
-        prompt = f"""<context>
-You are analyzing an internal Opus onboarding department meeting transcript.
-
-CRITICAL LEADERSHIP CONTEXT:
-- Humberto Buniotto (CEO) - His instructions SUPERSEDE all others. If Humberto says something needs to be done, it's the highest priority action item.
-  - Name variations: May appear as "Humberto", "Buniotto", "CEO"
-- Adi Tiwari (VP of Operations) - Second in command, reports to Humberto
-  - Name variations: May appear as "Adi", "Aditya", "VP"
-
-About Opus:
-- Software company specializing in behavioral health
-- Main product: EHR (Electronic Health Record)
-- Other products: CRM, RCM (both white-labeled), Opus Kiosk, AI Scribe Co-pilot
-
-Onboarding Department Focus:
-- Client implementation and onboarding processes
-- Training and setup for new customers
-- Integration and technical setup
-- Customer success handoffs
-
-{additional_context if additional_context else ""}
-</context>
-
-<transcript>
-{transcript}
-</transcript>
-
-<instructions>
-Analyze this onboarding meeting transcript and extract:
-1. Action items - specific tasks that need to be completed
-2. A brief summary of the meeting
-3. List of participants
-4. Key decisions made
-5. Meeting title - Create a concise descriptive title (10-30 chars)
-
-MANDATORY TASK - ALWAYS INCLUDE AS FIRST ACTION ITEM:
-1. SUMMARY OF CALL:
-   - Title: "SUMMARY OF CALL"
-   - Priority: low
-   - Description: Comprehensive onboarding meeting summary including:
-     * Meeting purpose (new client onboarding, implementation review, training session, etc.)
-     * Client name and their current onboarding stage
-     * Key onboarding topics discussed
-     * Client requirements and customization needs identified
-     * Training topics covered or scheduled
-     * Integration points and technical requirements
-     * Timeline and milestones discussed
-     * Client concerns or questions raised
-     * Humberto's (CEO) directives if present
-     * Adi's (VP Ops) operational guidance if present
-     * Resources needed or blockers identified
-     * Next steps in the onboarding process
-     * Overall client readiness and engagement assessment
-   - This is NOT an action item - it's informational documentation
-   - Focus on providing context for the onboarding team's reference
-
-CRITICAL OWNERSHIP RULES FOR ONBOARDING:
-1. If HUMBERTO (CEO) says something needs to be done → It's an action item (HIGH PRIORITY)
-2. If ADI says something needs to be done → It's an action item (HIGH/MEDIUM PRIORITY)
-3. Humberto or Adi MAY assign tasks to themselves - capture these
-4. Unless explicitly directed to Humberto or Adi, assume tasks are for the team
-5. Watch for name variations and misspellings
-
-For action items:
-- Extract ALL directives from Humberto (CEO) - these are non-negotiable
-- Extract directives from Adi (VP Operations)
-- Include questions that need answers (but do NOT use is_question flag - that's only for sales calls)
-- Note if someone specific is assigned (rare, but possible)
-- Default assumption: Tasks are for the onboarding team unless specified
-
-TIMESTAMP EXTRACTION:
-- Look for timestamps in the transcript (format: MM:SS or HH:MM:SS)
-- Record when each action item was discussed
-
-Priority Guidelines:
-- Humberto's directives: HIGH priority
-- Adi's directives: HIGH or MEDIUM priority based on urgency
-- Team questions/follow-ups: MEDIUM priority
-- General improvements: LOW priority
-
-Return a structured JSON response with all extracted information.
-</instructions>"""
-        
-        return prompt
+        return transcript_prompt(ONBOARDING_PROMPT, additional_context if additional_context else "", transcript)
     
     def _create_sales_dept_prompt(self, transcript: str, additional_context: str) -> str:
         """
@@ -554,117 +1610,7 @@ Return a structured JSON response with all extracted information.
         Returns:
             Formatted prompt string for sales sync meetings
         """
-        prompt = f"""<context>
-You are analyzing a Sales Sync meeting transcript from Opus.
-
-MEETING PURPOSE:
-This is a weekly sales team sync where we:
-- Review open deals in the pipeline
-- Discuss strategies to close specific opportunities
-- Assign action items for advancing deals
-- Review marketing initiatives and campaigns
-- Discuss HubSpot hygiene and process improvements
-- Plan next steps for each opportunity
-
-KEY TEAM MEMBERS AND THEIR ROLES:
-- Adi Tiwari: VP of Operations, Sales Executive, primary demo person for all deals
-- Humberto Buniotto: CEO (highest authority)
-- Chris Garraffa: Account Executive
-- Nigel Green: Sales Consultant
-- Gabriel Lacap: Sales Account Engineer (notes, follow-ups, agreements)
-- Shawn Rickenbacker: Marketing Director
-
-IMPORTANT NAME SPELLINGS:
-- It's 'Garraffa' not 'Garofa' or 'Garafa'
-- It's 'Shawn' not 'Sean' 
-- It's 'Buniotto' not 'Buñodo' or other variations
-- It's 'Lacap' not 'Lakap'
-
-About Opus:
-- Software company specializing in behavioral health
-- Main product: EHR (Electronic Health Record)
-- Other products: CRM (white-labeled Lead Squared), RCM, Opus Kiosk, AI Scribe Co-pilot
-- Sales process involves demos, pricing discussions, and implementation planning
-
-{additional_context if additional_context else ""}
-</context>
-
-<transcript>
-{transcript}
-</transcript>
-
-<instructions>
-Analyze this Sales Sync meeting transcript and extract:
-1. Action items - specific tasks with clear ownership
-2. A brief summary of the meeting
-3. List of participants
-4. Key decisions made
-5. Meeting title - Create a concise descriptive title (10-30 chars)
-
-MANDATORY TASK - ALWAYS INCLUDE AS FIRST ACTION ITEM:
-1. SUMMARY OF CALL:
-   - Title: "SUMMARY OF CALL"
-   - Priority: low
-   - Description: Comprehensive sales meeting summary including:
-     * Deals reviewed and their current status
-     * Key opportunities discussed with next steps
-     * Blockers or challenges for specific deals
-     * Marketing initiatives or campaigns discussed
-     * HubSpot process improvements or hygiene items
-     * Win/loss analysis if discussed
-     * Competitive intelligence shared
-     * Team member updates and capacity
-     * Strategic decisions or pivots
-     * Pipeline health and forecast
-     * Action items by deal owner
-   - This is informational documentation for the sales team
-
-CRITICAL OWNERSHIP RULES:
-1. CEO directives from Humberto are HIGHEST priority
-2. VP directives from Adi are HIGH priority
-3. Properly attribute tasks to the right person:
-   - Deal-specific tasks → Usually Chris, Nigel, or Adi (whoever owns the deal)
-   - Marketing tasks → Shawn Rickenbacker
-   - Agreement/documentation tasks → Gabriel Lacap
-   - HubSpot hygiene → Often team-wide or specific AE
-4. If unclear who owns a deal, look for context clues like "my deal" or "I'll follow up"
-
-For action items, focus on:
-- Follow-ups with specific prospects
-- Demo scheduling and preparation
-- Proposal and pricing tasks
-- Contract and agreement preparation
-- Marketing collateral needs
-- HubSpot updates and data entry
-- Competitive research needs
-- Internal process improvements
-
-DEAL ATTRIBUTION:
-- When action items relate to specific deals, include the company name
-- Format: "Follow up with [Company] about [topic]"
-- Track which AE owns which deal when mentioned
-
-TIMESTAMP EXTRACTION:
-- Look for timestamps in the transcript (format: MM:SS or HH:MM:SS)
-- Record when key decisions or commitments were made
-
-Priority Guidelines:
-- CEO directives: HIGH
-- Deal-closing activities: HIGH
-- Time-sensitive proposals: HIGH
-- Marketing campaigns: MEDIUM
-- HubSpot hygiene: MEDIUM
-- Process improvements: LOW
-
-IMPORTANT:
-- Do NOT use the is_question flag - that's only for sales calls with external customers
-- Sales Sync meetings generate internal action items for the sales team, NOT customer questions
-- This is an internal team meeting, not a customer-facing call
-
-Return a structured JSON response with all extracted information.
-</instructions>"""
-        
-        return prompt
+        return transcript_prompt(SALES_DEPT_PROMPT, additional_context if additional_context else "", transcript)
     
     def _create_project_meeting_prompt(self, transcript: str, additional_context: str) -> str:
         """
@@ -677,81 +1623,10 @@ Return a structured JSON response with all extracted information.
         Returns:
             Formatted prompt string for project meetings
         """
-        prompt = f"""<context>
-You are analyzing a meeting transcript for a project meeting.
-
-PROJECT CONTEXT:
-{additional_context if additional_context else "This is a project meeting. Extract action items and key decisions based on the discussion."}
-</context>
-
-<transcript>
-{transcript}
-</transcript>
-
-<instructions>
-Analyze this project meeting transcript and extract:
-1. Action items - specific tasks related to the integration project
-2. A brief summary of the meeting
-3. List of participants (identify company affiliation when possible)
-4. Key technical or business decisions made
-5. Meeting title - Create a concise descriptive title (10-30 chars) focused on the meeting topic
-
-MANDATORY TASK - ALWAYS INCLUDE AS FIRST ACTION ITEM:
-1. SUMMARY OF CALL:
-   - Title: "SUMMARY OF CALL"
-   - Priority: low
-   - Description: Comprehensive meeting summary including:
-     * Meeting purpose and main topics discussed
-     * Current status and progress updates
-     * Key decisions made
-     * Action items and next steps
-     * Blockers or dependencies identified
-     * Timeline updates or commitments
-     * Resource needs or requirements
-     * Overall project status
-   - This is NOT an action item - it's project documentation for reference
-   - Provide technical and business context for both teams
-
-CRITICAL EXTRACTION RULES:
-1. Deliverables and commitments are HIGH priority
-2. Blockers and critical issues are HIGH priority
-3. Timeline commitments are HIGH priority
-4. Process improvements are MEDIUM priority
-5. Documentation tasks are MEDIUM priority
-
-For action items, focus on:
-- Specific tasks and deliverables mentioned
-- Decisions that require follow-up
-- Blockers or dependencies
-- Timeline commitments
-- Follow-up meetings or actions needed
-
-OWNERSHIP ATTRIBUTION:
-- Assign tasks to the person who committed to them
-- If unclear, assign to the most relevant person based on context
-- Use job titles and roles mentioned in the meeting
-
-TIMESTAMP EXTRACTION:
-- Look for timestamps in the transcript (format: MM:SS or HH:MM:SS)
-- Record when key decisions or commitments were made
-
-PROJECT QUESTIONS:
-- For questions needing clarification, format title as: "Question: [specific question]"
-- These are clarification items that need follow-up
-- Include full context in the description
-- DO NOT mark these with is_question flag (that's only for sales calls)
-
-Priority Guidelines:
-- Critical blockers: HIGH
-- Deliverables with deadlines: HIGH
-- Process improvements: MEDIUM
-- Documentation: MEDIUM
-- Future enhancements: LOW
-
-Return a structured JSON response with all extracted information.
-</instructions>"""
-        
-        return prompt
+        project_context = additional_context if additional_context else (
+            "This is a project meeting. Extract action items and key decisions based on the discussion."
+        )
+        return transcript_prompt(PROJECT_MEETING_PROMPT, f"PROJECT CONTEXT:\n{project_context}", transcript)
     
     def _create_support_prompt(self, transcript: str, additional_context: str) -> str:
         """
@@ -764,121 +1639,7 @@ Return a structured JSON response with all extracted information.
         Returns:
             Formatted prompt string for support meetings
         """
-        prompt = f"""<context>
-You are analyzing a Support Leadership meeting transcript from Opus.
-
-MEETING PURPOSE:
-This is a customer support leadership meeting focusing on:
-- Bug tracking and resolution
-- Vendor/partner management and escalations
-- Cross-functional initiatives
-- Support ticket priorities and workflows
-- Technical escalations and issues
-- Customer issue resolution strategies
-
-KEY TEAM MEMBERS AND THEIR ROLES:
-- John Catipon: Customer Support Lead, responsible for day-to-day support operations
-- Adi Tiwari: VP of Operations, provides oversight for Support Leadership department
-- Hector Fraginals: Chief Technology Officer (CTO), handles engineering escalations
-- Janelle: Lead Onboarding Director, handles onboarding-related support issues
-
-IMPORTANT CONTEXT ABOUT OPUS:
-- We're an EHR (Electronic Health Record) company in the behavioral health space
-- We get many bug reports and support tickets that need tracking
-- Support often collaborates with Engineering (Hector/CTO) for technical issues
-- Support coordinates with Onboarding (Janelle) for implementation issues
-
-VENDOR/PARTNER INFORMATION:
-When these vendors are mentioned, use the following context:
-- Dosespot: E-prescribing and medication management partner
-  * Issues related to medication ordering, prescriptions, controlled substances
-  * API integration issues with e-prescribing
-- LeadSquared (LSQ): White-labeled CRM solution provider
-  * CRM functionality issues
-  * Lead management and tracking problems
-  * Marketing automation concerns
-- Imagine (referred to as "Opus RCM"): Revenue Cycle Management partner
-  * Billing and claims issues
-  * Insurance verification problems
-  * Payment processing concerns
-
-{additional_context if additional_context else ""}
-</context>
-
-<transcript>
-{transcript}
-</transcript>
-
-<instructions>
-Analyze this Support Leadership meeting transcript and extract:
-1. Action items - specific tasks with clear ownership
-2. A brief summary of the meeting
-3. List of participants
-4. Key decisions made
-5. Meeting title - Create a concise descriptive title (10-30 chars)
-
-MANDATORY TASK - ALWAYS INCLUDE AS FIRST ACTION ITEM:
-1. SUMMARY OF MEETING:
-   - Title: "SUMMARY OF MEETING"
-   - Priority: low
-   - Description: Comprehensive support meeting overview including:
-     * Major bugs or issues discussed and their priority
-     * Customer escalations and resolution strategies
-     * Vendor/partner issues (Dosespot, LSQ, Opus RCM)
-     * Engineering escalations to Hector/CTO
-     * Onboarding support issues for Janelle
-     * Support workflow improvements or process changes
-     * Resource allocation and capacity planning
-     * Cross-functional coordination needs
-     * Training needs or knowledge gaps identified
-     * Key metrics or KPIs discussed
-   - This is NOT an action item - it's informational documentation
-   - Write as a narrative for team members who weren't present
-
-For additional action items, focus on:
-- Bug tickets that need to be created or tracked
-- Customer escalations requiring follow-up
-- Vendor issues needing escalation (specify which vendor)
-- Engineering tasks for Hector's team
-- Onboarding support items for Janelle's team
-- Process improvements or documentation needs
-- Training or knowledge transfer requirements
-- Cross-team coordination tasks
-
-OWNERSHIP RULES:
-- Support tasks → Usually John Catipon (Customer Support Lead)
-- Operations/strategic tasks → Adi (VP of Ops)
-- Engineering/technical escalations → Hector (CTO)
-- Onboarding-related support → Janelle
-- Vendor escalations → Specify the vendor (Dosespot, LSQ, Opus RCM)
-- If unclear, default to John Catipon for operational support tasks
-
-IMPORTANT:
-- Do NOT use the is_question flag - that's only for sales calls with external customers
-- Support meetings generate action items and escalations, NOT customer questions
-
-VENDOR TASK FORMATTING:
-When creating tasks related to vendors, always include vendor name:
-- "Escalate [issue] to Dosespot team"
-- "Follow up with LSQ about [CRM feature]"
-- "Contact Opus RCM regarding [billing issue]"
-
-Priority Guidelines:
-- Critical customer issues: HIGH
-- Bugs affecting multiple customers: HIGH
-- Vendor escalations: MEDIUM-HIGH
-- Process improvements: MEDIUM
-- Documentation updates: LOW-MEDIUM
-- Meeting summary: LOW (always)
-
-TIMESTAMP EXTRACTION:
-- Look for timestamps in the transcript (format: MM:SS or HH:MM:SS)
-- Record when key issues or escalations were raised
-
-Return a structured JSON response with all extracted information.
-</instructions>"""
-        
-        return prompt
+        return transcript_prompt(SUPPORT_PROMPT, additional_context if additional_context else "", transcript)
     
     def _create_existing_customer_prompt(self, transcript: str, customer_name: str, additional_context: str) -> str:
         """
@@ -892,105 +1653,12 @@ Return a structured JSON response with all extracted information.
         Returns:
             Formatted prompt string for existing customer escalations
         """
-        prompt = f"""<context>
-You are analyzing a meeting transcript for an existing Opus customer who is experiencing issues or escalations during their onboarding phase.
-
-MEETING PURPOSE:
-This is an escalation or issue resolution meeting for an existing customer who has already purchased Opus and is currently in the onboarding/implementation phase. The VP of Operations (Adi Tiwari) is handling the escalation as the Account Executive and needs to delegate tasks appropriately.
-
-KEY TEAM MEMBERS AND DEFAULT ASSIGNEES:
-- Adi Tiwari: VP of Operations and Account Executive (handles customer escalations and relationships)
-- Janelle: Lead Onboarding Director (primary contact for onboarding issues)
-- Laura: Onboarding team member (assists with onboarding tasks)
-- Hector Fraginals: Chief Technology Officer (for technical/engineering escalations)
-- John: Support Lead (for support-related issues)
-
-ESCALATION WORKFLOW:
-1. Customer raises issue to their Account Executive (Adi)
-2. Adi responds to customer via email/Slack to acknowledge and set expectations
-3. Adi creates tasks to delegate the actual work to the appropriate team
-4. Team members handle their assigned tasks
-5. Adi follows up with customer on resolution
-
-CUSTOMER-SPECIFIC CONTEXT:
-Customer: {customer_name}
-{additional_context if additional_context else "No additional context provided for this customer."}
-</context>
-
-<transcript>
-{transcript}
-</transcript>
-
-<instructions>
-Analyze this existing customer escalation transcript and extract:
-1. Action items - specific tasks with clear delegation intent
-2. A brief summary of the meeting/escalation
-3. List of participants
-4. Key decisions made
-5. Meeting title - Create a concise descriptive title (10-30 chars)
-
-MANDATORY TASK - ALWAYS INCLUDE AS FIRST ACTION ITEM:
-1. ESCALATION SUMMARY:
-   - Title: "ESCALATION SUMMARY"
-   - Priority: low
-   - Description: Comprehensive escalation overview including:
-     * Nature of the customer's issue or concern
-     * Current status of their onboarding/implementation
-     * Specific problems or blockers identified
-     * Customer's expectations and timeline requirements
-     * Proposed resolution approach
-     * Teams that need to be involved (Onboarding, Engineering, Support)
-     * Risk assessment (impact on go-live date, customer satisfaction)
-     * Follow-up requirements with the customer
-   - This is documentation for reference, not an action item requiring work
-
-For additional action items, focus on:
-- Onboarding tasks that need to be completed or fixed
-- Technical issues requiring engineering attention
-- Configuration or setup problems
-- Training or documentation needs
-- Process improvements identified
-- Customer communication and follow-ups
-- Internal coordination between teams
-
-DELEGATION GUIDELINES:
-- Onboarding issues → Janelle or Laura
-- Technical/system issues → Hector (CTO)
-- Support process issues → John (Support Lead)
-- Customer communication → Usually remains with Adi
-- If unclear, note "Assignee: TBD - [suggested team]"
-
-TASK FORMATTING:
-- Create clear, actionable tasks that someone can pick up and execute
-- Include enough context so the assignee understands the customer situation
-- Format: "[Action Required]: [Specific task for customer name]"
-- Include any deadlines or urgency mentioned by the customer
-
-CUSTOMER CONTEXT AWARENESS:
-- Consider the customer-specific context provided above
-- Note any special requirements or sensitivities mentioned
-- Flag if the issue relates to promises made during sales
-- Identify if this is a recurring issue or new problem
-
-Priority Guidelines:
-- Customer-blocking issues: HIGH
-- Issues affecting go-live date: HIGH
-- Configuration/setup tasks: MEDIUM
-- Documentation/training: MEDIUM
-- Process improvements: LOW
-- Summary: LOW (always)
-
-IMPORTANT NOTES:
-- These are existing paying customers, not prospects
-- Focus on resolution and maintaining customer satisfaction
-- Tasks should enable delegation while Adi maintains customer relationship
-- Don't assign tasks directly - leave assignee field empty for manual assignment
-- Include customer name in task titles for clarity
-
-Return a structured JSON response with all extracted information.
-</instructions>"""
-        
-        return prompt
+        customer_context = additional_context if additional_context else "No additional context provided for this customer."
+        return transcript_prompt(
+            EXISTING_CUSTOMER_PROMPT,
+            f"CUSTOMER-SPECIFIC CONTEXT:\nCustomer: {customer_name}\n{customer_context}",
+            transcript
+        )
     
     def _create_prompt(self, transcript: str, customer_name: str, additional_context: str) -> str:
         """
@@ -1016,6 +1684,57 @@ Return a structured JSON response with all extracted information.
         Returns:
             Extracted tasks and context as a string
         """
+        contents = self._build_image_contents(image_file, customer_name, meeting_type, customer_context)
+        
+        try:
+            response = self._generate_content(
+                model=self.model,
+                contents=contents
+            )
+            
+            if response and response.text:
+                return response.text
+            else:
+                return "Unable to extract content from the image. Please try again or enter tasks manually."
+                
+        except GEMINI_ERRORS as e:
+            logger.error(f"Image analysis failed: {e}")
+            raise Exception(f"Failed to analyze image: {str(e)}") from e
+    
+    async def analyze_image_for_tasks_async(self,
+                                            image_file,
+                                            customer_name: str,
+                                            meeting_type: str,
+                                            customer_context: str = "") -> str:
+        """Async version of analyze_image_for_tasks() using the SDK's aio client"""
+        contents = self._build_image_contents(image_file, customer_name, meeting_type, customer_context)
+        
+        try:
+            response = await self._generate_content_async(
+                model=self.model,
+                contents=contents
+            )
+            
+            if response and response.text:
+                return response.text
+            else:
+                return "Unable to extract content from the image. Please try again or enter tasks manually."
+                
+        except GEMINI_ERRORS as e:
+            logger.error(f"Image analysis failed: {e}")
+            raise Exception(f"Failed to analyze image: {str(e)}") from e
+    
+    def _build_image_contents(self,
+                              image_file,
+                              customer_name: str,
+                              meeting_type: str,
+                              customer_context: str = "") -> List[Dict]:
+        """
+        Build the multimodal request contents for an image analysis
+        
+        Returns:
+            Contents list with the inline image and the analysis prompt
+        """
         import base64
         from io import BytesIO
         
@@ -1085,39 +1804,26 @@ Based on the image content, extract and format the following:
 
 Format the output as natural language tasks that can be directly used for task creation."""
         
-        try:
-            # Use Gemini's multimodal capability
-            # Combine image and text in the content
-            contents = [
-                {
-                    "role": "user",
-                    "parts": [
-                        {
-                            "inline_data": {
-                                "mime_type": f"image/{image_file.type.split('/')[-1] if hasattr(image_file, 'type') else 'jpeg'}",
-                                "data": base64_image
-                            }
-                        },
-                        {
-                            "text": prompt
+        # Use Gemini's multimodal capability
+        # Combine image and text in the content
+        contents = [
+            {
+                "role": "user",
+                "parts": [
+                    {
+                        "inline_data": {
+                            "mime_type": f"image/{image_file.type.split('/')[-1] if hasattr(image_file, 'type') else 'jpeg'}",
+                            "data": base64_image
                         }
-                    ]
-                }
-            ]
-            
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=contents
-            )
-            
-            if response and response.text:
-                return response.text
-            else:
-                return "Unable to extract content from the image. Please try again or enter tasks manually."
-                
-        except Exception as e:
-            logger.error(f"Image analysis failed: {e}")
-            raise Exception(f"Failed to analyze image: {str(e)}")
+                    },
+                    {
+                        "text": prompt
+                    }
+                ]
+            }
+        ]
+        
+        return contents
     
     def analyze_pdf_for_tasks(self,
                               pdf_text: str,
@@ -1136,6 +1842,57 @@ Format the output as natural language tasks that can be directly used for task c
         Returns:
             Extracted tasks and context as a string
         """
+        prompt = self._build_pdf_task_prompt(pdf_text, customer_name, meeting_type, customer_context)
+        
+        try:
+            response = self._generate_content(
+                model=self.model,
+                contents=prompt
+            )
+            
+            if response and response.text:
+                return response.text
+            else:
+                return "Unable to extract tasks from the PDF. Please try again or enter tasks manually."
+                
+        except GEMINI_ERRORS as e:
+            logger.error(f"PDF analysis for tasks failed: {e}")
+            raise Exception(f"Failed to analyze PDF: {str(e)}") from e
+    
+    async def analyze_pdf_for_tasks_async(self,
+                                          pdf_text: str,
+                                          customer_name: str,
+                                          meeting_type: str,
+                                          customer_context: str = "") -> str:
+        """Async version of analyze_pdf_for_tasks() using the SDK's aio client"""
+        prompt = self._build_pdf_task_prompt(pdf_text, customer_name, meeting_type, customer_context)
+        
+        try:
+            response = await self._generate_content_async(
+                model=self.model,
+                contents=prompt
+            )
+            
+            if response and response.text:
+                return response.text
+            else:
+                return "Unable to extract tasks from the PDF. Please try again or enter tasks manually."
+                
+        except GEMINI_ERRORS as e:
+            logger.error(f"PDF analysis for tasks failed: {e}")
+            raise Exception(f"Failed to analyze PDF: {str(e)}") from e
+    
+    def _build_pdf_task_prompt(self,
+                               pdf_text: str,
+                               customer_name: str,
+                               meeting_type: str,
+                               customer_context: str = "") -> str:
+        """
+        Build the task-extraction prompt for a PDF conversation
+        
+        Returns:
+            The full analysis prompt
+        """
         # Create context-aware prompt based on meeting type
         if meeting_type == "existing_customer" and customer_context:
             context_prompt = f"""
@@ -1212,37 +1969,63 @@ Based on the complete conversation/document above, extract and format:
 
 Format the output as clear, actionable tasks that capture the full context of the conversation."""
         
+        return prompt
+    
+    def test_connection(self) -> bool:
+        """
+        Test the Gemini connection
+        
+        Returns:
+            True if connection successful, False otherwise
+        """
         try:
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=prompt
-            )
-            
-            if response and response.text:
-                return response.text
-            else:
-                return "Unable to extract tasks from the PDF. Please try again or enter tasks manually."
-                
-        except Exception as e:
-            logger.error(f"PDF analysis for tasks failed: {e}")
-            raise Exception(f"Failed to analyze PDF: {str(e)}")
+            # Fetching the configured model validates both the key and the model name
+            model_info = self.client.models.get(model=self.model)
+            return bool(model_info)
+        except GEMINI_ERRORS as e:
+            logger.error(f"Connection test failed: {e}")
+            return False
     
     def interpret_quick_tasks(self, 
                              task_input: str, 
                              context_name: str,
-                             context_type: str) -> List[Dict[str, str]]:
+                             context_type: str,
+                             on_fallback: Optional[Callable[[str], None]] = None) -> List[Dict[str, str]]:
         """
         Interpret natural language task descriptions into structured tasks
         Can handle multiple tasks separated by newlines or semicolons
         
+        For callers without a running event loop; async code awaits
+        interpret_quick_tasks_async() instead.
+        
         Args:
             task_input: Natural language task description(s)
             context_name: Name of customer/department/project for context
             context_type: Type of context (Sales Call, Internal Meeting, Project Meeting)
+            on_fallback: Called with the text of each task that Gemini couldn't
+                interpret and was kept as a plain fallback task
             
         Returns:
             List of task dictionaries with title, description, priority
         """
+        return run_sync(
+            self.interpret_quick_tasks_async(task_input, context_name, context_type, on_fallback),
+            "interpret_quick_tasks",
+            "interpret_quick_tasks_async"
+        )
+    
+    async def interpret_quick_tasks_async(self, 
+                                          task_input: str, 
+                                          context_name: str,
+                                          context_type: str,
+                                          on_fallback: Optional[Callable[[str], None]] = None) -> List[Dict[str, str]]:
+        """
+        Async version of interpret_quick_tasks
+        
+        After the detection call splits the input, every task is interpreted
+        concurrently instead of one request at a time. Tasks are returned in
+        input order.
+        """
         # First, let AI determine if there are multiple tasks
         detection_prompt = f"""Analyze this input and determine if it contains multiple separate tasks:
 
@@ -1268,26 +2051,68 @@ If it's one task, return task_count: 1 with the full text as the single task.
         
         try:
             # Detect multiple tasks
-            detection_response = self.client.models.generate_content(
+            detection_response = await self._generate_content_async(
                 model=self.model,
                 contents=detection_prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    temperature=0.1
-                )
+                config=JSON_CONFIG
             )
             
-            detected = json.loads(detection_response.text)
-            individual_tasks = detected.get('tasks', [task_input])
+            detected = orjson.loads(detection_response.text)
+            individual_tasks = detected.get('tasks') if isinstance(detected, dict) else None
+            if not isinstance(individual_tasks, list):
+                individual_tasks = [task_input]
+            individual_tasks = [task_text for task_text in individual_tasks if isinstance(task_text, str) and task_text.strip()]
+            
+            # Now process all tasks at once; a task that fails falls back on its own
+            interpreted = await asyncio.gather(
+                *[
+                    self._interpret_single_task_async(task_text, context_name, context_type)
+                    for task_text in individual_tasks
+                ],
+                return_exceptions=True
+            )
             
-            # Now process each task
-            all_tasks = []
+            tasks = []
+            for task_text, task in zip(individual_tasks, interpreted):
+                if isinstance(task, GEMINI_ERRORS):
+                    logger.error(f"Error interpreting quick task: {task}")
+                    if on_fallback:
+                        on_fallback(task_text)
+                    task = self._fallback_quick_task(task_text)
+                elif isinstance(task, BaseException):
+                    raise task
+                if task:
+                    tasks.append(task)
+            return tasks
             
-            for task_text in individual_tasks:
-                if not task_text.strip():
-                    continue
-                    
-                interpretation_prompt = f"""Convert this natural language task instruction into a structured task:
+        except GEMINI_ERRORS as e:
+            logger.error(f"Error interpreting quick tasks: {str(e)}")
+            # Fallback: create a simple task from the input
+            if on_fallback:
+                on_fallback(task_input)
+            return [self._fallback_quick_task(task_input)]
+    
+    @staticmethod
+    def _fallback_quick_task(task_text: str) -> Dict[str, str]:
+        """Plain task holding the instruction as typed, used when it can't be interpreted"""
+        return {
+            'title': 'Quick Task',
+            'description': task_text,
+            'priority': 'medium'
+        }
+    
+    async def _interpret_single_task_async(self,
+                                           task_text: str,
+                                           context_name: str,
+                                           context_type: str) -> Optional[Dict[str, str]]:
+        """
+        Structure one quick task instruction
+        
+        Returns:
+            Task dictionary with title, description, priority, or None if
+            the response had no title
+        """
+        interpretation_prompt = f"""Convert this natural language task instruction into a structured task:
 
 Task instruction: "{task_text}"
 
@@ -1314,36 +2139,134 @@ Return ONLY a JSON object with this structure:
   "priority": "<high|medium|low>"
 }}
 """
-                
-                response = self.client.models.generate_content(
-                    model=self.model,
-                    contents=interpretation_prompt,
-                    config=types.GenerateContentConfig(
-                        response_mime_type="application/json",
-                        temperature=0.1
-                    )
-                )
-                
-                if response.text:
-                    task_data = json.loads(response.text)
-                    # Ensure all required fields
-                    if 'title' in task_data:
-                        all_tasks.append({
-                            'title': task_data.get('title', 'Quick Task'),
-                            'description': task_data.get('description', task_text),
-                            'priority': task_data.get('priority', 'medium')
-                        })
+        
+        response = await self._generate_content_async(
+            model=self.model,
+            contents=interpretation_prompt,
+            config=JSON_CONFIG
+        )
+        
+        if response.text:
+            task_data = orjson.loads(response.text)
+            # Ensure all required fields
+            if isinstance(task_data, dict) and 'title' in task_data:
+                return {
+                    'title': task_data.get('title', 'Quick Task'),
+                    'description': task_data.get('description', task_text),
+                    'priority': task_data.get('priority', 'medium')
+                }
+        return None
+    
+    def submit_quick_task_batch(self, submissions: List[Dict[str, str]]) -> str:
+        """
+        Queue quick task interpretations with the Gemini Batch API
+        
+        Each submission is interpreted in a single request that both splits
+        and structures the tasks, at half the cost of interpret_quick_tasks().
+        
+        Args:
+            submissions: One dict per quick task entry, with task_input,
+                context_name and context_type as for interpret_quick_tasks()
             
-            return all_tasks
+        Returns:
+            Name of the batch job, to poll with get_quick_task_batch()
+        """
+        requests = [
+            {
+                'contents': [{
+                    'role': 'user',
+                    'parts': [{'text': self._build_quick_task_batch_prompt(
+                        submission['task_input'],
+                        submission['context_name'],
+                        submission['context_type']
+                    )}]
+                }],
+                'config': JSON_CONFIG
+            }
+            for submission in submissions
+        ]
+        
+        batch_job = self.client.batches.create(
+            model=self.model,
+            src=requests,
+            config={'display_name': f"quick-tasks-{len(submissions)}"}
+        )
+        logger.info(f"Queued batch job {batch_job.name} with {len(submissions)} quick task entr(ies)")
+        return batch_job.name
+    
+    def get_quick_task_batch(self, job_name: str) -> Tuple[str, Optional[List[List[Dict[str, str]]]]]:
+        """
+        Check a batch job queued by submit_quick_task_batch()
+        
+        Args:
+            job_name: Name returned by submit_quick_task_batch()
             
-        except Exception as e:
-            logger.error(f"Error interpreting quick tasks: {str(e)}")
-            # Fallback: create a simple task from the input
-            return [{
-                'title': 'Quick Task',
-                'description': task_input,
-                'priority': 'medium'
-            }]
+        Returns:
+            Tuple of (job state, task lists in submission order or None if the
+            job hasn't succeeded); a failed entry yields an empty list
+        """
+        state, texts = self._batch_response_texts(job_name)
+        if texts is None:
+            return state, None
+        
+        task_lists = []
+        for text in texts:
+            try:
+                response = orjson.loads(text) if text else {}
+            except orjson.JSONDecodeError as e:
+                logger.error(f"Could not parse quick task batch response: {e}")
+                response = {}
+            entries = response.get('tasks') if isinstance(response, dict) else None
+            if not isinstance(entries, list):
+                entries = []
+            
+            # Each entry is checked on its own, so one malformed task doesn't drop the rest
+            tasks = []
+            for task_data in entries:
+                if isinstance(task_data, dict) and 'title' in task_data:
+                    tasks.append({
+                        'title': task_data.get('title', 'Quick Task'),
+                        'description': task_data.get('description', ''),
+                        'priority': task_data.get('priority', 'medium')
+                    })
+                elif isinstance(task_data, str) and task_data.strip():
+                    tasks.append(self._fallback_quick_task(task_data))
+            task_lists.append(tasks)
+        return state, task_lists
+    
+    def _build_quick_task_batch_prompt(self, task_input: str, context_name: str, context_type: str) -> str:
+        """Single-request prompt that splits and structures quick tasks, for batch jobs"""
+        return f"""Convert these natural language task instructions into structured tasks:
+
+Input: "{task_input}"
+
+Context:
+- Organization/Project: {context_name}
+- Meeting Type: {context_type}
+
+Instructions:
+1. Split the input into separate tasks. Tasks might be separated by new lines, semicolons,
+   words like "and also", "additionally", "plus", or numbered or bulleted lists.
+   Each distinct action should be a separate task.
+2. For each task extract:
+   - Title: A clear, concise, action-oriented task title (5-10 words)
+   - Description: Detailed explanation including any specific details, timeline or deadline,
+     people or resources mentioned, and context about why the task is needed
+   - Priority: "high" if it mentions urgent, ASAP, today, tomorrow, critical;
+     "medium" if it mentions this week, soon, next few days;
+     "low" if no urgency is indicated or it mentions eventually, when possible, later
+
+Return ONLY a JSON object with this structure:
+{{
+  "tasks": [
+    {{
+      "title": "<clear action title>",
+      "description": "<detailed description>",
+      "priority": "<high|medium|low>"
+    }}
+  ]
+}}
+"""
     
     def extract_simple_action_items(self, transcript: str) -> List[Dict[str, str]]:
         """
@@ -1365,18 +2288,15 @@ Return ONLY a JSON object with this structure:
         Focus on clear, actionable tasks mentioned in the meeting."""
         
         try:
-            response = self.client.models.generate_content(
+            response = self._generate_content(
                 model=self.model,
                 contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    temperature=0.1
-                )
+                config=JSON_CONFIG
             )
             
             # Parse JSON response
             if response.text:
-                items = json.loads(response.text)
+                items = orjson.loads(response.text)
                 if isinstance(items, list):
                     return items
                 elif isinstance(items, dict) and 'action_items' in items:
@@ -1384,6 +2304,6 @@ Return ONLY a JSON object with this structure:
             
             return []
             
-        except Exception as e:
+        except GEMINI_ERRORS as e:
             logger.error(f"Error extracting action items: {str(e)}")
             return []
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+LLM Response Cache Module
+Reuses model responses for repeated or near-identical requests
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+import numpy as np
+
+# Cosine similarity at or above which two texts are treated as the same request.
+# Meetings that share a template (same agenda, same boilerplate) embed close
+# together, so this is kept very high and paired with a length check.
+SEMANTIC_CACHE_THRESHOLD = 0.995
+
+# Largest relative difference in normalized length between near-identical texts
+SEMANTIC_CACHE_LENGTH_TOLERANCE = 0.01
+
+# Responses kept before the least recently used are dropped
+SEMANTIC_CACHE_MAX_ENTRIES = 256
+
+
+class SemanticCache:
+    """
+    In-memory cache of model responses keyed by text and its embedding
+    
+    Every entry belongs to a scope: a string covering everything about the
+    request other than the cached text (meeting type, customer, context...).
+    Lookups only match entries of the same scope, so a response is never
+    reused for a request built from a different prompt. Exact text matches
+    are found by hash; near-identical texts need both a cosine similarity of
+    their embeddings of at least the threshold and lengths within
+    SEMANTIC_CACHE_LENGTH_TOLERANCE of each other.
+    """
+    
+    def __init__(self,
+                 threshold: float = SEMANTIC_CACHE_THRESHOLD,
+                 max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+                 length_tolerance: float = SEMANTIC_CACHE_LENGTH_TOLERANCE):
+        """
+        Initialize the cache
+        
+        Args:
+            threshold: Minimum cosine similarity for a near-identical match
+            max_entries: Number of responses kept across all scopes
+            length_tolerance: Largest relative length difference for a near-identical match
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.length_tolerance = length_tolerance
+        # (scope, text hash) -> (unit-length embedding or None, normalized text length, response)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Optional[np.ndarray], int, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Text with case and whitespace normalized"""
+        return ' '.join(text.split()).lower()
+    
+    @classmethod
+    def _text_key(cls, text: str) -> str:
+        """Hash of the normalized text"""
+        return hashlib.blake2b(cls._normalize(text).encode('utf-8'), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _unit(embedding: Sequence[float]) -> np.ndarray:
+        """Embedding scaled to unit length, so a dot product is the cosine similarity"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def get_exact(self, scope: str, text: str) -> Optional[str]:
+        """Response cached for the same text in this scope, if any"""
+        key = (scope, self._text_key(text))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+    
+    def get_similar(self, scope: str, text: str, embedding: Sequence[float]) -> Optional[str]:
+        """
+        Response cached for the most similar text of about the same length in this scope
+        
+        Args:
+            scope: Scope of the request
+            text: Text to match
+            embedding: Embedding of the text
+            
+        Returns:
+            The response, or None if no entry reaches the threshold
+        """
+        query = self._unit(embedding)
+        length = len(self._normalize(text))
+        with self._lock:
+            candidates = [
+                (key, entry) for key, entry in self._entries.items()
+                if key[0] == scope and entry[0] is not None and entry[0].shape == query.shape
+                and abs(entry[1] - length) <= self.length_tolerance * max(entry[1], length)
+            ]
+            if not candidates:
+                return None
+            similarities = np.stack([entry[0] for _, entry in candidates]) @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            key, entry = candidates[best]
+            self._entries.move_to_end(key)
+            return entry[2]
+    
+    def put(self,
+            scope: str,
+            text: str,
+            response: str,
+            embedding: Optional[Sequence[float]] = None):
+        """
+        Cache a response
+        
+        Args:
+            scope: Scope of the request (see class docstring)
+            text: Text the response was generated for
+            response: Response to reuse
+            embedding: Embedding of the text; without one only exact matches hit
+        """
+        key = (scope, self._text_key(text))
+        vector = self._unit(embedding) if embedding is not None else None
+        with self._lock:
+            self._entries[key] = (vector, len(self._normalize(text)), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -3,28 +3,54 @@ PDF Processing Module
 Handles extraction of text from PDF transcripts
 """
 
+import io
+import re
 import logging
+import threading
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Optional, Tuple
-import PyPDF2
-import pdfplumber
-import fitz  # PyMuPDF
+from typing import BinaryIO, Callable, ContextManager, Iterator, Optional, Sequence, Tuple, Union
+import fitz  # PyMuPDF; pdfplumber and PyPDF2 are imported by their fallback extractors
 
 logger = logging.getLogger(__name__)
 
+# PDF input: raw bytes or a seekable binary file object (e.g. a Streamlit UploadedFile)
+PDFSource = Union[bytes, BinaryIO]
+
+# Bytes searched for the %PDF- header marker during validation
+PDF_HEADER_WINDOW = 1024
+
+# Pages inspected when deciding whether a PDF without extractable text is a scan
+SCANNED_CHECK_PAGES = 3
+
+# Longest a single page may take in the pdfplumber/PyPDF2 fallbacks
+PAGE_TIMEOUT_SECONDS = 15
+
+# Patterns used by PDFProcessor._clean_text, compiled once at import
+_HYPHEN_BREAK_RE = re.compile(r'-\s*\n\s*')
+_WHITESPACE_RE = re.compile(r'\s+')
+_PAGE_NUMBER_RE = re.compile(r'^\s*\d+\s*$', re.MULTILINE)
+_PAGE_FOOTER_RE = re.compile(r'Page \d+ of \d+', re.IGNORECASE)
+
+# PyMuPDF doesn't support use from several threads at once, and extractions run
+# in worker threads, so every fitz call holds this lock. It is taken per call
+# (open, one page, close) so a large PDF doesn't hold up everyone else's.
+_fitz_lock = threading.Lock()
+
 
 class PDFProcessor:
     """Process PDF files and extract text content"""
     
     def __init__(self, max_file_size_mb: int = 50):
         self.max_file_size_mb = max_file_size_mb
+        self.skipped_pages = 0
     
-    def validate_file(self, file_content: bytes, filename: str) -> Tuple[bool, Optional[str]]:
+    def validate_file(self, file_content: PDFSource, filename: str) -> Tuple[bool, Optional[str]]:
         """
         Validate uploaded PDF file
         
         Args:
-            file_content: Raw file bytes
+            file_content: Raw file bytes or a seekable binary file object
             filename: Name of the file
             
         Returns:
@@ -35,31 +61,65 @@ class PDFProcessor:
             return False, "File must be a PDF"
         
         # Check file size
-        file_size_mb = len(file_content) / (1024 * 1024)
+        file_size_mb = self._source_size(file_content) / (1024 * 1024)
         if file_size_mb > self.max_file_size_mb:
             return False, f"File too large: {file_size_mb:.1f}MB (max: {self.max_file_size_mb}MB)"
         
         # Check if it's a valid PDF
         try:
-            # Try to read first few bytes to verify PDF header
-            if not file_content[:4] == b'%PDF':
+            # Readers accept the %PDF- marker anywhere in the first 1024 bytes,
+            # so only that much is read to verify the header
+            if b'%PDF-' not in self._read_header(file_content, PDF_HEADER_WINDOW):
                 return False, "Invalid PDF file format"
         except Exception:
             return False, "Could not validate PDF format"
         
         return True, None
     
-    def extract_text(self, file_content: bytes, method: str = "auto") -> Tuple[str, str]:
+    @staticmethod
+    def _source_size(source: PDFSource) -> int:
+        """Size in bytes of a PDF source, without reading a file object's content"""
+        if isinstance(source, (bytes, bytearray)):
+            return len(source)
+        position = source.tell()
+        size = source.seek(0, io.SEEK_END)
+        source.seek(position)
+        return size
+    
+    @staticmethod
+    def _read_header(source: PDFSource, length: int) -> bytes:
+        """First bytes of a PDF source, leaving a file object's position at the start"""
+        if isinstance(source, (bytes, bytearray)):
+            return bytes(source[:length])
+        source.seek(0)
+        header = source.read(length)
+        source.seek(0)
+        return header
+    
+    @staticmethod
+    def _as_stream(source: PDFSource) -> BinaryIO:
+        """Binary stream positioned at the start of the PDF"""
+        if isinstance(source, (bytes, bytearray)):
+            return io.BytesIO(source)
+        source.seek(0)
+        return source
+    
+    def extract_text(self, file_content: PDFSource, method: str = "auto") -> Tuple[str, str]:
         """
         Extract text from PDF using the specified or best available method
         
+        File objects are read in place by the extraction libraries, so the
+        PDF doesn't need to be copied into a bytes object first.
+        
         Args:
-            file_content: PDF file content as bytes
+            file_content: PDF file content as bytes or a seekable binary file object
             method: Extraction method ("pymupdf", "pdfplumber", "pypdf2", or "auto")
             
         Returns:
             Tuple of (extracted_text, method_used)
         """
+        self.skipped_pages = 0
+        
         if method == "auto":
             # Try methods in order of preference
             methods = [
@@ -73,7 +133,12 @@ class PDFProcessor:
                     text = extract_func(file_content)
                     if text and text.strip():
                         logger.info(f"Successfully extracted text using {method_name}")
-                        return self._clean_text(text), method_name
+                        return self._clean_text(text), self._method_label(method_name)
+                    if method_name == "pymupdf" and self._looks_scanned(file_content):
+                        # Image-only pages without fonts have no text layer for the
+                        # slower fallbacks to find either
+                        logger.warning("No embedded text found; the PDF appears to be scanned")
+                        return "", "none"
                 except Exception as e:
                     logger.warning(f"Method {method_name} failed: {str(e)}")
                     continue
@@ -91,52 +156,158 @@ class PDFProcessor:
             if method in extract_funcs:
                 try:
                     text = extract_funcs[method](file_content)
-                    return self._clean_text(text), method
+                    return self._clean_text(text), self._method_label(method)
                 except Exception as e:
                     logger.error(f"Extraction with {method} failed: {str(e)}")
                     return "", method
             
             return "", "invalid_method"
     
-    def _extract_with_pymupdf(self, file_content: bytes) -> str:
+    def _extract_with_pymupdf(self, file_content: PDFSource) -> str:
         """Extract text using PyMuPDF"""
-        doc = fitz.open(stream=file_content, filetype="pdf")
-        text_parts = []
-        
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            text = page.get_text()
-            if text.strip():
-                text_parts.append(text)
+        with _fitz_lock:
+            doc = fitz.open(stream=self._as_stream(file_content), filetype="pdf")
+            page_count = len(doc)
+        try:
+            text_parts = []
+            for index in range(page_count):
+                with _fitz_lock:
+                    text = doc[index].get_text("text")
+                if text.strip():
+                    text_parts.append(text)
+            return '\n'.join(text_parts)
+        finally:
+            with _fitz_lock:
+                doc.close()
+    
+    def _looks_scanned(self, file_content: PDFSource) -> bool:
+        """
+        Whether a PDF looks like a scan: its first pages use no fonts and only hold images
         
-        doc.close()
-        return '\n'.join(text_parts)
+        Cheap check used when PyMuPDF found no text, to skip the fallbacks
+        only when they can't do better; PyMuPDF can come up empty on files
+        the others read (unusual font encodings, forms).
+        """
+        try:
+            with _fitz_lock, fitz.open(stream=self._as_stream(file_content), filetype="pdf") as doc:
+                pages = [doc[index] for index in range(min(len(doc), SCANNED_CHECK_PAGES))]
+                return bool(pages) and all(not page.get_fonts() and page.get_images() for page in pages)
+        except Exception as e:
+            logger.warning(f"Could not check whether the PDF is scanned: {e}")
+            return False
     
-    def _extract_with_pdfplumber(self, file_content: bytes) -> str:
-        """Extract text using pdfplumber"""
-        import io
-        text_parts = []
+    def _extract_with_pdfplumber(self, file_content: PDFSource) -> str:
+        """Extract text using pdfplumber (default layout settings, no LAParams analysis)"""
+        import pdfplumber
         
-        with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    text_parts.append(text)
+        data = self._read_all(file_content)
+        
+        @contextmanager
+        def open_pages() -> Iterator[Sequence]:
+            with pdfplumber.open(io.BytesIO(data)) as pdf:
+                yield pdf.pages
         
-        return '\n'.join(text_parts)
+        return self._extract_pages(open_pages, lambda page: page.extract_text())
     
-    def _extract_with_pypdf2(self, file_content: bytes) -> str:
+    def _extract_with_pypdf2(self, file_content: PDFSource) -> str:
         """Extract text using PyPDF2"""
-        import io
-        reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+        import PyPDF2
+        
+        data = self._read_all(file_content)
+        return self._extract_pages(
+            lambda: nullcontext(PyPDF2.PdfReader(io.BytesIO(data)).pages),
+            lambda page: page.extract_text()
+        )
+    
+    @staticmethod
+    def _read_all(source: PDFSource) -> bytes:
+        """Whole content of a PDF source, leaving a file object's position at the start"""
+        if isinstance(source, (bytes, bytearray)):
+            return bytes(source)
+        source.seek(0)
+        data = source.read()
+        source.seek(0)
+        return data
+    
+    def _extract_pages(self, open_pages: Callable[[], ContextManager[Sequence]], extract_page: Callable) -> str:
+        """
+        Extract text page by page, stopping at a page that takes over PAGE_TIMEOUT_SECONDS
+        
+        Used by the pure-Python extractors, where a pathological page can take
+        minutes. Neither pdfplumber nor PyPDF2 is thread-safe, so the document
+        is opened, read and closed by a single worker thread on its own copy
+        of the file. A running page can't be interrupted: on timeout the
+        worker is told to stop once that page finishes, the text read so far
+        is returned and the pages left unread, the slow one included, are
+        counted in self.skipped_pages.
+        
+        Args:
+            open_pages: Returns a context manager yielding the document's
+                pages; called in the worker thread
+            extract_page: Function returning the text of one page
+            
+        Returns:
+            Text of the extracted pages joined by newlines
+            
+        Raises:
+            TimeoutError: If the document can't even be opened within PAGE_TIMEOUT_SECONDS
+        """
+        progress = threading.Condition()
+        stop = threading.Event()
         text_parts = []
+        state = {'total': None, 'done': 0, 'finished': False, 'error': None}
         
-        for page in reader.pages:
-            text = page.extract_text()
-            if text.strip():
-                text_parts.append(text)
+        def work():
+            try:
+                with open_pages() as pages:
+                    with progress:
+                        state['total'] = len(pages)
+                        progress.notify_all()
+                    for page in pages:
+                        text = extract_page(page)
+                        with progress:
+                            if stop.is_set():
+                                return
+                            if text and text.strip():
+                                text_parts.append(text)
+                            state['done'] += 1
+                            progress.notify_all()
+            except Exception as e:
+                state['error'] = e
+            finally:
+                with progress:
+                    state['finished'] = True
+                    progress.notify_all()
         
-        return '\n'.join(text_parts)
+        threading.Thread(target=work, name="pdf-page-extraction", daemon=True).start()
+        
+        with progress:
+            while not state['finished']:
+                seen = (state['total'], state['done'])
+                if not progress.wait_for(
+                    lambda: state['finished'] or (state['total'], state['done']) != seen,
+                    timeout=PAGE_TIMEOUT_SECONDS
+                ):
+                    stop.set()
+                    break
+            
+            if state['error'] is not None:
+                raise state['error']
+            if not state['finished']:
+                if state['total'] is None:
+                    raise TimeoutError(f"PDF took over {PAGE_TIMEOUT_SECONDS}s to open")
+                self.skipped_pages = state['total'] - state['done']
+                logger.warning(
+                    f"Page {state['done'] + 1} took over {PAGE_TIMEOUT_SECONDS}s; "
+                    f"stopping with {self.skipped_pages} page(s) unread"
+                )
+            return '\n'.join(text_parts)
+    
+    def _method_label(self, method_name: str) -> str:
+        """Method name reported by extract_text, noting any pages left unread after a timeout"""
+        if self.skipped_pages:
+            return f"{method_name} (stopped at a slow page; {self.skipped_pages} page(s) unread)"
+        return method_name
     
     def _clean_text(self, text: str) -> str:
         """
@@ -148,19 +319,17 @@ class PDFProcessor:
         Returns:
             Cleaned text
         """
-        import re
-        
         # Fix hyphenated words across lines
-        text = re.sub(r'-\s*\n\s*', '', text)
+        text = _HYPHEN_BREAK_RE.sub('', text)
         
         # Replace multiple whitespace with single space
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove page numbers (standalone numbers)
-        text = re.sub(r'^\s*\d+\s*$', '', text, flags=re.MULTILINE)
+        text = _PAGE_NUMBER_RE.sub('', text)
         
         # Remove common headers/footers
-        text = re.sub(r'Page \d+ of \d+', '', text, flags=re.IGNORECASE)
+        text = _PAGE_FOOTER_RE.sub('', text)
         
         # Clean up extra whitespace
         text = text.strip()
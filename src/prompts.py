@@ -0,0 +1,689 @@
+"""
+Transcript Prompt Templates
+Fixed instructions for each meeting type, shared by every analysis call
+"""
+
+# Where the per-call part of a transcript prompt (customer details and the
+# transcript itself) starts; everything before it is the same across calls
+PROMPT_DYNAMIC_MARKER = "\n\n<meeting_context>"
+
+
+def transcript_prompt(instructions: str, meeting_context: str, transcript: str) -> str:
+    """
+    Assemble a transcript prompt: fixed instructions first, per-call details last
+    
+    Keeping the long instruction block at the start lets consecutive calls
+    share a prompt prefix for Gemini's prompt caching.
+    
+    Args:
+        instructions: One of the prompt constants below
+        meeting_context: Customer or meeting details for this call
+        transcript: The transcript text
+        
+    Returns:
+        The full prompt
+    """
+    return (
+        f"{instructions}{PROMPT_DYNAMIC_MARKER}\n{meeting_context}\n</meeting_context>\n\n"
+        f"<transcript>\n{transcript}\n</transcript>"
+    )
+
+
+# Sales call with a prospect; the customer is named in the meeting context
+SALES_PROMPT = """<context>
+You are analyzing a sales call transcript for a prospect/customer of Opus (named in <meeting_context> below).
+
+About the presenter: Adi Tiwari, VP of Operations and Sales Executive at Opus, a software company specializing in behavioral health software.
+
+Opus Products:
+- EHR (Electronic Health Record) - Main product
+- CRM (Customer Relationship Management) - White-labeled
+- RCM (Revenue Cycle Management) - White-labeled
+- Opus Kiosk
+- AI Scribe Co-pilot
+
+Typical attendees from prospects:
+- Providers/Therapists
+- Billers
+- Front desk staff
+- Admins
+- Owners/Operators
+</context>
+
+<instructions>
+CONTEXT: You are analyzing a sales call where Adi Tiwari is the Opus sales executive/presenter.
+
+Analyze this sales call transcript and extract:
+1. Action items - ONLY tasks that Adi Tiwari specifically needs to complete
+2. A brief summary of the demo/call
+3. List of participants (names and roles if mentioned)
+4. Key decisions or buying signals
+5. Meeting title - Create a concise descriptive title (10-30 chars) that captures the essence of this call:
+   - Examples: "Initial Demo", "Follow-up - Billing", "Technical Deep Dive", "Pricing Discussion", "Implementation Planning"
+   - Focus on the main topic or stage of the sales process
+
+For action items, focus on:
+- Questions that need answers (technical, pricing, compliance, integration)
+- Follow-up materials to send
+- Next steps discussed
+- Features or modules to demonstrate further
+- Implementation or timeline discussions
+
+TIMESTAMP EXTRACTION:
+- Look for timestamps in the transcript (format: MM:SS or HH:MM:SS)
+- Record the timestamp when each action item or question was discussed
+- If multiple timestamps, use the first clear mention
+- If no timestamp found, leave as null
+
+CUSTOMER QUESTIONS:
+- Mark items as questions (is_question: true) when:
+  - Customer explicitly asks "What about...?", "How does...?", "Can you...?"
+  - Customer requests information or clarification
+  - Topic requires follow-up research or answer
+- For questions, format title as: "Customer Question: [brief question]"
+- Include full context in description
+
+MANDATORY TASKS FOR SALES CALLS - ALWAYS INCLUDE THESE THREE:
+(In the titles below, replace [Customer] with the customer named in <meeting_context>)
+
+1. SUMMARY OF CALL (ALWAYS REQUIRED - MUST BE FIRST):
+   - Title: "SUMMARY OF CALL"
+   - Priority: low
+   - Description: Provide a comprehensive meeting summary including:
+     * Meeting stage/type (initial discovery, demo, follow-up, pricing discussion, technical deep dive, etc.)
+     * Key topics discussed and main points covered
+     * Customer's level of engagement and sentiment (interested, hesitant, excited, concerned, etc.)
+     * Primary pain points or challenges the customer mentioned
+     * Opus products/features that were demonstrated or discussed
+     * Customer's specific use cases and requirements
+     * Important questions raised by the customer and how they were addressed
+     * Any objections or concerns expressed
+     * Buying signals or positive indicators observed
+     * Next steps and expected timeline
+     * Overall assessment of the call's success and progress in the sales cycle
+   - This is NOT an action item - it's purely informational for reference
+   - Write in a narrative style that gives context to someone who wasn't on the call
+
+2. SEND FOLLOW-UP EMAIL (ALWAYS REQUIRED):
+   - Title: "Send follow-up email to [Customer]"
+   - Priority: high
+   - Description should include a HIGH-LEVEL SUMMARY (one paragraph):
+     * What was demonstrated/discussed (high-level topics, not technical details)
+     * Key points of interest from the customer
+     * Main concerns or requirements mentioned
+     * Next steps agreed upon
+   - Do NOT include technical implementation details or feature specifics
+   - Example: "Demonstrated the EHR platform focusing on scheduling and billing modules. Customer expressed interest in insurance verification features and workflow automation. Main concern was integration with existing systems. Agreed to schedule a follow-up call next week to discuss implementation timeline."
+
+3. UPDATE HUBSPOT (ALWAYS REQUIRED):
+   - Title: "Update HubSpot for [Customer]"
+   - Priority: high
+   - Description MUST include these specific instructions:
+     * Update the 'Next Step' field in HubSpot for this deal
+     * Set the 'Next Activity Date' based on discussed timeline
+     * Create a task in HubSpot for the next action (e.g., "Follow up with client in one week", "Send pricing proposal by Friday")
+     * Log this call/meeting as an activity
+   - Include what the next action should be based on the conversation
+
+ADDITIONAL ACTION ITEMS:
+Then extract any OTHER action items that ADI TIWARI explicitly owns or commits to:
+- Look for phrases like "I'll send", "I'll schedule", "I'll follow up", "Let me get you"
+- Exclude tasks assigned to prospects/customers (like "Steve will send")
+- Exclude general discussion topics that aren't clear assignments
+- If unclear who owns it, default to NOT including it as Adi's action
+
+IMPORTANT: Write action items with enough context so someone who didn't attend the meeting can understand:
+- What specific question was asked
+- What feature/module was discussed
+- What the customer's concern or requirement is
+- Why this follow-up is needed
+
+OWNERSHIP RULES:
+- If someone says "Steve will send..." → That's Steve's task, NOT Adi's
+- If David says "I will collect data..." → That's David's task, NOT Adi's  
+- If Adi says "I'll send..." or "Let me..." → That IS Adi's task
+- General discussions without clear ownership → NOT an action item
+- When in doubt about ownership → EXCLUDE it
+
+Prioritize based on:
+- High: Blocking decisions, urgent timeline, critical requirements
+- Medium: Important but not urgent, standard follow-ups
+- Low: Nice-to-have information, future considerations
+
+Return a structured JSON response with all extracted information.
+</instructions>"""
+
+# Internal Opus meeting without a department-specific prompt
+INTERNAL_PROMPT = """<context>
+You are analyzing an internal Opus meeting transcript.
+
+About Opus:
+- Software company specializing in behavioral health
+- Main product: EHR (Electronic Health Record)
+- Other products: CRM, RCM (both white-labeled), Opus Kiosk, AI Scribe Co-pilot
+
+Meeting context:
+- Internal operational or strategic meeting
+- Attendees are Opus team members
+- Adi Tiwari is VP of Operations, handles support, marketing, and cross-functional operations
+
+KEY DEPARTMENT HEADS FOR TASK DELEGATION:
+- Marketing: Sean Rickenbacker (Marketing Director)
+- Engineering/Development: Hector Fraginals (CTO)
+- Onboarding/Training: Janelle Hall (Lead Onboarding Director)
+- Support: John (Support Lead)
+</context>
+
+<instructions>
+Analyze this internal meeting transcript and extract:
+1. Action items - specific tasks that need to be completed
+2. A brief summary of the meeting
+3. List of participants (Opus team members)
+4. Key decisions made
+5. Meeting title - Create a concise descriptive title (10-30 chars) that captures the meeting type:
+   - Examples: "Leadership Sync", "Retrospective", "Sprint Planning", "Training Session", "Strategy Review", "Support Review"
+   - Focus on the type or purpose of the meeting
+
+MANDATORY TASK - ALWAYS INCLUDE AS FIRST ACTION ITEM:
+1. SUMMARY OF CALL:
+   - Title: "SUMMARY OF CALL"
+   - Priority: low
+   - Description: Comprehensive meeting overview including:
+     * Meeting purpose and context
+     * Main topics discussed and key points covered
+     * Department(s) involved and their perspectives
+     * Important decisions made or deferred
+     * Process improvements or changes discussed
+     * Cross-functional dependencies identified
+     * Team dynamics and engagement level
+     * Any blockers or challenges raised
+     * Action items agreed upon and ownership
+     * Next steps and follow-up meetings planned
+     * Overall meeting effectiveness and outcomes
+   - This is NOT an action item requiring work - it's informational documentation
+   - Write as a narrative that provides context for team members who weren't present
+
+For additional action items:
+- Extract clear, actionable tasks
+- Focus on operational and strategic items
+- Include decisions that require follow-up
+- Note cross-functional dependencies
+- Capture process improvements or changes discussed
+
+IMPORTANT:
+- Tasks are rarely assigned to Adi unless explicitly stated
+- Most tasks are for team organization and will be assigned later in Asana
+- Include enough context for proper task assignment later
+- Focus on WHO needs to do WHAT by WHEN (if mentioned)
+- Do NOT use the is_question flag - that's only for sales calls with external customers
+- Internal meetings generate action items for department heads, NOT customer questions
+
+Prioritize based on:
+- High: Critical operational issues, customer-impacting items, urgent deadlines
+- Medium: Standard operational tasks, process improvements
+- Low: Future considerations, nice-to-have improvements
+
+Return a structured JSON response with all extracted information.
+</instructions>"""
+
+# Internal meeting of the onboarding department
+ONBOARDING_PROMPT = """<context>
+You are analyzing an internal Opus onboarding department meeting transcript.
+
+CRITICAL LEADERSHIP CONTEXT:
+- Humberto Buniotto (CEO) - His instructions SUPERSEDE all others. If Humberto says something needs to be done, it's the highest priority action item.
+  - Name variations: May appear as "Humberto", "Buniotto", "CEO"
+- Adi Tiwari (VP of Operations) - Second in command, reports to Humberto
+  - Name variations: May appear as "Adi", "Aditya", "VP"
+
+About Opus:
+- Software company specializing in behavioral health
+- Main product: EHR (Electronic Health Record)
+- Other products: CRM, RCM (both white-labeled), Opus Kiosk, AI Scribe Co-pilot
+
+Onboarding Department Focus:
+- Client implementation and onboarding processes
+- Training and setup for new customers
+- Integration and technical setup
+- Customer success handoffs
+</context>
+
+<instructions>
+Analyze this onboarding meeting transcript and extract:
+1. Action items - specific tasks that need to be completed
+2. A brief summary of the meeting
+3. List of participants
+4. Key decisions made
+5. Meeting title - Create a concise descriptive title (10-30 chars)
+
+MANDATORY TASK - ALWAYS INCLUDE AS FIRST ACTION ITEM:
+1. SUMMARY OF CALL:
+   - Title: "SUMMARY OF CALL"
+   - Priority: low
+   - Description: Comprehensive onboarding meeting summary including:
+     * Meeting purpose (new client onboarding, implementation review, training session, etc.)
+     * Client name and their current onboarding stage
+     * Key onboarding topics discussed
+     * Client requirements and customization needs identified
+     * Training topics covered or scheduled
+     * Integration points and technical requirements
+     * Timeline and milestones discussed
+     * Client concerns or questions raised
+     * Humberto's (CEO) directives if present
+     * Adi's (VP Ops) operational guidance if present
+     * Resources needed or blockers identified
+     * Next steps in the onboarding process
+     * Overall client readiness and engagement assessment
+   - This is NOT an action item - it's informational documentation
+   - Focus on providing context for the onboarding team's reference
+
+CRITICAL OWNERSHIP RULES FOR ONBOARDING:
+1. If HUMBERTO (CEO) says something needs to be done → It's an action item (HIGH PRIORITY)
+2. If ADI says something needs to be done → It's an action item (HIGH/MEDIUM PRIORITY)
+3. Humberto or Adi MAY assign tasks to themselves - capture these
+4. Unless explicitly directed to Humberto or Adi, assume tasks are for the team
+5. Watch for name variations and misspellings
+
+For action items:
+- Extract ALL directives from Humberto (CEO) - these are non-negotiable
+- Extract directives from Adi (VP Operations)
+- Include questions that need answers (but do NOT use is_question flag - that's only for sales calls)
+- Note if someone specific is assigned (rare, but possible)
+- Default assumption: Tasks are for the onboarding team unless specified
+
+TIMESTAMP EXTRACTION:
+- Look for timestamps in the transcript (format: MM:SS or HH:MM:SS)
+- Record when each action item was discussed
+
+Priority Guidelines:
+- Humberto's directives: HIGH priority
+- Adi's directives: HIGH or MEDIUM priority based on urgency
+- Team questions/follow-ups: MEDIUM priority
+- General improvements: LOW priority
+
+Return a structured JSON response with all extracted information.
+</instructions>"""
+
+# Internal meeting of the sales department
+SALES_DEPT_PROMPT = """<context>
+You are analyzing a Sales Sync meeting transcript from Opus.
+
+MEETING PURPOSE:
+This is a weekly sales team sync where we:
+- Review open deals in the pipeline
+- Discuss strategies to close specific opportunities
+- Assign action items for advancing deals
+- Review marketing initiatives and campaigns
+- Discuss HubSpot hygiene and process improvements
+- Plan next steps for each opportunity
+
+KEY TEAM MEMBERS AND THEIR ROLES:
+- Adi Tiwari: VP of Operations, Sales Executive, primary demo person for all deals
+- Humberto Buniotto: CEO (highest authority)
+- Chris Garraffa: Account Executive
+- Nigel Green: Sales Consultant
+- Gabriel Lacap: Sales Account Engineer (notes, follow-ups, agreements)
+- Shawn Rickenbacker: Marketing Director
+
+IMPORTANT NAME SPELLINGS:
+- It's 'Garraffa' not 'Garofa' or 'Garafa'
+- It's 'Shawn' not 'Sean' 
+- It's 'Buniotto' not 'Buñodo' or other variations
+- It's 'Lacap' not 'Lakap'
+
+About Opus:
+- Software company specializing in behavioral health
+- Main product: EHR (Electronic Health Record)
+- Other products: CRM (white-labeled Lead Squared), RCM, Opus Kiosk, AI Scribe Co-pilot
+- Sales process involves demos, pricing discussions, and implementation planning
+</context>
+
+<instructions>
+Analyze this Sales Sync meeting transcript and extract:
+1. Action items - specific tasks with clear ownership
+2. A brief summary of the meeting
+3. List of participants
+4. Key decisions made
+5. Meeting title - Create a concise descriptive title (10-30 chars)
+
+MANDATORY TASK - ALWAYS INCLUDE AS FIRST ACTION ITEM:
+1. SUMMARY OF CALL:
+   - Title: "SUMMARY OF CALL"
+   - Priority: low
+   - Description: Comprehensive sales meeting summary including:
+     * Deals reviewed and their current status
+     * Key opportunities discussed with next steps
+     * Blockers or challenges for specific deals
+     * Marketing initiatives or campaigns discussed
+     * HubSpot process improvements or hygiene items
+     * Win/loss analysis if discussed
+     * Competitive intelligence shared
+     * Team member updates and capacity
+     * Strategic decisions or pivots
+     * Pipeline health and forecast
+     * Action items by deal owner
+   - This is informational documentation for the sales team
+
+CRITICAL OWNERSHIP RULES:
+1. CEO directives from Humberto are HIGHEST priority
+2. VP directives from Adi are HIGH priority
+3. Properly attribute tasks to the right person:
+   - Deal-specific tasks → Usually Chris, Nigel, or Adi (whoever owns the deal)
+   - Marketing tasks → Shawn Rickenbacker
+   - Agreement/documentation tasks → Gabriel Lacap
+   - HubSpot hygiene → Often team-wide or specific AE
+4. If unclear who owns a deal, look for context clues like "my deal" or "I'll follow up"
+
+For action items, focus on:
+- Follow-ups with specific prospects
+- Demo scheduling and preparation
+- Proposal and pricing tasks
+- Contract and agreement preparation
+- Marketing collateral needs
+- HubSpot updates and data entry
+- Competitive research needs
+- Internal process improvements
+
+DEAL ATTRIBUTION:
+- When action items relate to specific deals, include the company name
+- Format: "Follow up with [Company] about [topic]"
+- Track which AE owns which deal when mentioned
+
+TIMESTAMP EXTRACTION:
+- Look for timestamps in the transcript (format: MM:SS or HH:MM:SS)
+- Record when key decisions or commitments were made
+
+Priority Guidelines:
+- CEO directives: HIGH
+- Deal-closing activities: HIGH
+- Time-sensitive proposals: HIGH
+- Marketing campaigns: MEDIUM
+- HubSpot hygiene: MEDIUM
+- Process improvements: LOW
+
+IMPORTANT:
+- Do NOT use the is_question flag - that's only for sales calls with external customers
+- Sales Sync meetings generate internal action items for the sales team, NOT customer questions
+- This is an internal team meeting, not a customer-facing call
+
+Return a structured JSON response with all extracted information.
+</instructions>"""
+
+# Project meeting (Finpay / LSQ)
+PROJECT_MEETING_PROMPT = """<context>
+You are analyzing a meeting transcript for a project meeting.
+
+</context>
+
+<instructions>
+Analyze this project meeting transcript and extract:
+1. Action items - specific tasks related to the integration project
+2. A brief summary of the meeting
+3. List of participants (identify company affiliation when possible)
+4. Key technical or business decisions made
+5. Meeting title - Create a concise descriptive title (10-30 chars) focused on the meeting topic
+
+MANDATORY TASK - ALWAYS INCLUDE AS FIRST ACTION ITEM:
+1. SUMMARY OF CALL:
+   - Title: "SUMMARY OF CALL"
+   - Priority: low
+   - Description: Comprehensive meeting summary including:
+     * Meeting purpose and main topics discussed
+     * Current status and progress updates
+     * Key decisions made
+     * Action items and next steps
+     * Blockers or dependencies identified
+     * Timeline updates or commitments
+     * Resource needs or requirements
+     * Overall project status
+   - This is NOT an action item - it's project documentation for reference
+   - Provide technical and business context for both teams
+
+CRITICAL EXTRACTION RULES:
+1. Deliverables and commitments are HIGH priority
+2. Blockers and critical issues are HIGH priority
+3. Timeline commitments are HIGH priority
+4. Process improvements are MEDIUM priority
+5. Documentation tasks are MEDIUM priority
+
+For action items, focus on:
+- Specific tasks and deliverables mentioned
+- Decisions that require follow-up
+- Blockers or dependencies
+- Timeline commitments
+- Follow-up meetings or actions needed
+
+OWNERSHIP ATTRIBUTION:
+- Assign tasks to the person who committed to them
+- If unclear, assign to the most relevant person based on context
+- Use job titles and roles mentioned in the meeting
+
+TIMESTAMP EXTRACTION:
+- Look for timestamps in the transcript (format: MM:SS or HH:MM:SS)
+- Record when key decisions or commitments were made
+
+PROJECT QUESTIONS:
+- For questions needing clarification, format title as: "Question: [specific question]"
+- These are clarification items that need follow-up
+- Include full context in the description
+- DO NOT mark these with is_question flag (that's only for sales calls)
+
+Priority Guidelines:
+- Critical blockers: HIGH
+- Deliverables with deadlines: HIGH
+- Process improvements: MEDIUM
+- Documentation: MEDIUM
+- Future enhancements: LOW
+
+Return a structured JSON response with all extracted information.
+</instructions>"""
+
+# Internal meeting of the support department
+SUPPORT_PROMPT = """<context>
+You are analyzing a Support Leadership meeting transcript from Opus.
+
+MEETING PURPOSE:
+This is a customer support leadership meeting focusing on:
+- Bug tracking and resolution
+- Vendor/partner management and escalations
+- Cross-functional initiatives
+- Support ticket priorities and workflows
+- Technical escalations and issues
+- Customer issue resolution strategies
+
+KEY TEAM MEMBERS AND THEIR ROLES:
+- John Catipon: Customer Support Lead, responsible for day-to-day support operations
+- Adi Tiwari: VP of Operations, provides oversight for Support Leadership department
+- Hector Fraginals: Chief Technology Officer (CTO), handles engineering escalations
+- Janelle: Lead Onboarding Director, handles onboarding-related support issues
+
+IMPORTANT CONTEXT ABOUT OPUS:
+- We're an EHR (Electronic Health Record) company in the behavioral health space
+- We get many bug reports and support tickets that need tracking
+- Support often collaborates with Engineering (Hector/CTO) for technical issues
+- Support coordinates with Onboarding (Janelle) for implementation issues
+
+VENDOR/PARTNER INFORMATION:
+When these vendors are mentioned, use the following context:
+- Dosespot: E-prescribing and medication management partner
+  * Issues related to medication ordering, prescriptions, controlled substances
+  * API integration issues with e-prescribing
+- LeadSquared (LSQ): White-labeled CRM solution provider
+  * CRM functionality issues
+  * Lead management and tracking problems
+  * Marketing automation concerns
+- Imagine (referred to as "Opus RCM"): Revenue Cycle Management partner
+  * Billing and claims issues
+  * Insurance verification problems
+  * Payment processing concerns
+</context>
+
+<instructions>
+Analyze this Support Leadership meeting transcript and extract:
+1. Action items - specific tasks with clear ownership
+2. A brief summary of the meeting
+3. List of participants
+4. Key decisions made
+5. Meeting title - Create a concise descriptive title (10-30 chars)
+
+MANDATORY TASK - ALWAYS INCLUDE AS FIRST ACTION ITEM:
+1. SUMMARY OF MEETING:
+   - Title: "SUMMARY OF MEETING"
+   - Priority: low
+   - Description: Comprehensive support meeting overview including:
+     * Major bugs or issues discussed and their priority
+     * Customer escalations and resolution strategies
+     * Vendor/partner issues (Dosespot, LSQ, Opus RCM)
+     * Engineering escalations to Hector/CTO
+     * Onboarding support issues for Janelle
+     * Support workflow improvements or process changes
+     * Resource allocation and capacity planning
+     * Cross-functional coordination needs
+     * Training needs or knowledge gaps identified
+     * Key metrics or KPIs discussed
+   - This is NOT an action item - it's informational documentation
+   - Write as a narrative for team members who weren't present
+
+For additional action items, focus on:
+- Bug tickets that need to be created or tracked
+- Customer escalations requiring follow-up
+- Vendor issues needing escalation (specify which vendor)
+- Engineering tasks for Hector's team
+- Onboarding support items for Janelle's team
+- Process improvements or documentation needs
+- Training or knowledge transfer requirements
+- Cross-team coordination tasks
+
+OWNERSHIP RULES:
+- Support tasks → Usually John Catipon (Customer Support Lead)
+- Operations/strategic tasks → Adi (VP of Ops)
+- Engineering/technical escalations → Hector (CTO)
+- Onboarding-related support → Janelle
+- Vendor escalations → Specify the vendor (Dosespot, LSQ, Opus RCM)
+- If unclear, default to John Catipon for operational support tasks
+
+IMPORTANT:
+- Do NOT use the is_question flag - that's only for sales calls with external customers
+- Support meetings generate action items and escalations, NOT customer questions
+
+VENDOR TASK FORMATTING:
+When creating tasks related to vendors, always include vendor name:
+- "Escalate [issue] to Dosespot team"
+- "Follow up with LSQ about [CRM feature]"
+- "Contact Opus RCM regarding [billing issue]"
+
+Priority Guidelines:
+- Critical customer issues: HIGH
+- Bugs affecting multiple customers: HIGH
+- Vendor escalations: MEDIUM-HIGH
+- Process improvements: MEDIUM
+- Documentation updates: LOW-MEDIUM
+- Meeting summary: LOW (always)
+
+TIMESTAMP EXTRACTION:
+- Look for timestamps in the transcript (format: MM:SS or HH:MM:SS)
+- Record when key issues or escalations were raised
+
+Return a structured JSON response with all extracted information.
+</instructions>"""
+
+# Escalation meeting with an existing customer
+EXISTING_CUSTOMER_PROMPT = """<context>
+You are analyzing a meeting transcript for an existing Opus customer who is experiencing issues or escalations during their onboarding phase.
+
+MEETING PURPOSE:
+This is an escalation or issue resolution meeting for an existing customer who has already purchased Opus and is currently in the onboarding/implementation phase. The VP of Operations (Adi Tiwari) is handling the escalation as the Account Executive and needs to delegate tasks appropriately.
+
+KEY TEAM MEMBERS AND DEFAULT ASSIGNEES:
+- Adi Tiwari: VP of Operations and Account Executive (handles customer escalations and relationships)
+- Janelle: Lead Onboarding Director (primary contact for onboarding issues)
+- Laura: Onboarding team member (assists with onboarding tasks)
+- Hector Fraginals: Chief Technology Officer (for technical/engineering escalations)
+- John: Support Lead (for support-related issues)
+
+ESCALATION WORKFLOW:
+1. Customer raises issue to their Account Executive (Adi)
+2. Adi responds to customer via email/Slack to acknowledge and set expectations
+3. Adi creates tasks to delegate the actual work to the appropriate team
+4. Team members handle their assigned tasks
+5. Adi follows up with customer on resolution
+</context>
+
+<instructions>
+Analyze this existing customer escalation transcript and extract:
+1. Action items - specific tasks with clear delegation intent
+2. A brief summary of the meeting/escalation
+3. List of participants
+4. Key decisions made
+5. Meeting title - Create a concise descriptive title (10-30 chars)
+
+MANDATORY TASK - ALWAYS INCLUDE AS FIRST ACTION ITEM:
+1. ESCALATION SUMMARY:
+   - Title: "ESCALATION SUMMARY"
+   - Priority: low
+   - Description: Comprehensive escalation overview including:
+     * Nature of the customer's issue or concern
+     * Current status of their onboarding/implementation
+     * Specific problems or blockers identified
+     * Customer's expectations and timeline requirements
+     * Proposed resolution approach
+     * Teams that need to be involved (Onboarding, Engineering, Support)
+     * Risk assessment (impact on go-live date, customer satisfaction)
+     * Follow-up requirements with the customer
+   - This is documentation for reference, not an action item requiring work
+
+For additional action items, focus on:
+- Onboarding tasks that need to be completed or fixed
+- Technical issues requiring engineering attention
+- Configuration or setup problems
+- Training or documentation needs
+- Process improvements identified
+- Customer communication and follow-ups
+- Internal coordination between teams
+
+DELEGATION GUIDELINES:
+- Onboarding issues → Janelle or Laura
+- Technical/system issues → Hector (CTO)
+- Support process issues → John (Support Lead)
+- Customer communication → Usually remains with Adi
+- If unclear, note "Assignee: TBD - [suggested team]"
+
+TASK FORMATTING:
+- Create clear, actionable tasks that someone can pick up and execute
+- Include enough context so the assignee understands the customer situation
+- Format: "[Action Required]: [Specific task for customer name]"
+- Include any deadlines or urgency mentioned by the customer
+
+CUSTOMER CONTEXT AWARENESS:
+- Consider the customer-specific context provided in <meeting_context>
+- Note any special requirements or sensitivities mentioned
+- Flag if the issue relates to promises made during sales
+- Identify if this is a recurring issue or new problem
+
+Priority Guidelines:
+- Customer-blocking issues: HIGH
+- Issues affecting go-live date: HIGH
+- Configuration/setup tasks: MEDIUM
+- Documentation/training: MEDIUM
+- Process improvements: LOW
+- Summary: LOW (always)
+
+IMPORTANT NOTES:
+- These are existing paying customers, not prospects
+- Focus on resolution and maintaining customer satisfaction
+- Tasks should enable delegation while Adi maintains customer relationship
+- Don't assign tasks directly - leave assignee field empty for manual assignment
+- Include customer name in task titles for clarity
+
+Return a structured JSON response with all extracted information.
+</instructions>"""
+
+
+# Reduce step for transcripts analyzed in parts; filled in with str.format
+MEETING_SUMMARY_MERGE_PROMPT = """The transcript of one meeting was too long to analyze at once, so it was analyzed in {part_count} consecutive parts. These are the summaries of the parts, in order:
+
+{summaries}
+
+Combine them into a single brief summary of the whole meeting, and give the meeting a concise title (10-30 characters).
+
+Return JSON with a "summary" field and a "meeting_title" field."""
@@ -0,0 +1,37 @@
+"""
+Sync Runner Module
+Runs the async implementations behind the synchronous API methods
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar('T')
+
+
+def run_sync(coro: Coroutine[Any, Any, T], sync_method: str, async_method: str) -> T:
+    """
+    Run a coroutine to completion for a synchronous caller
+    
+    The sync API methods are for callers without an event loop (Streamlit's
+    script thread, scripts). From inside a running loop asyncio.run() fails
+    with a generic RuntimeError, so this raises one naming the async method
+    to await instead.
+    
+    Args:
+        coro: Coroutine to run
+        sync_method: Name of the sync method running it, for the error message
+        async_method: Name of the method async callers should await instead
+        
+    Returns:
+        The coroutine's result
+        
+    Raises:
+        RuntimeError: If called from a thread with a running event loop
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    coro.close()
+    raise RuntimeError(f"{sync_method}() is for sync callers only; await {async_method}() from async code")
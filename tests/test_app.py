@@ -0,0 +1,34 @@
+"""
+Tests for the pure helpers in app.py (importing app doesn't start the UI)
+"""
+
+from app import dedupe_action_items
+
+
+def test_dedupe_matches_titles_ignoring_case_and_whitespace():
+    items = [
+        {'title': "Send pricing deck", 'description': "a"},
+        {'title': "Book demo", 'description': "b"},
+        {'title': "  send   PRICING deck ", 'description': "c"}
+    ]
+    
+    assert [item['title'] for item in dedupe_action_items(items)] == ["Send pricing deck", "Book demo"]
+
+
+def test_dedupe_keeps_longest_description_in_first_position():
+    items = [
+        {'title': "Send pricing deck", 'description': "short"},
+        {'title': "Book demo", 'description': ""},
+        {'title': "send pricing deck", 'description': "with the setup fee breakdown"}
+    ]
+    
+    assert dedupe_action_items(items) == [
+        {'title': "send pricing deck", 'description': "with the setup fee breakdown"},
+        {'title': "Book demo", 'description': ""}
+    ]
+
+
+def test_dedupe_leaves_distinct_items_and_missing_fields_alone():
+    items = [{'title': "Call Bob"}, {'title': "Call Bobby"}, {'description': "untitled"}]
+    
+    assert dedupe_action_items(items) == items
@@ -0,0 +1,351 @@
+"""
+Tests for src/gemini_analyzer.py that don't call the Gemini API
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from google.genai import errors, types
+
+from src import gemini_analyzer
+from src.gemini_analyzer import (
+    ActionItemStreamParser,
+    CircuitBreaker,
+    CircuitOpenError,
+    GeminiAnalyzer,
+    RateLimiter
+)
+
+
+def _response(text: str) -> types.GenerateContentResponse:
+    return types.GenerateContentResponse(candidates=[types.Candidate(
+        content=types.Content(role="model", parts=[types.Part(text=text)]),
+        finish_reason=types.FinishReason.STOP
+    )])
+
+
+class FakeClient:
+    """Stands in for genai.Client: caches can be expired, requests are recorded"""
+    
+    def __init__(self):
+        self.created = []
+        self.expired = set()
+        self.requests = []
+        self.caches = SimpleNamespace(create=self._create_cache)
+        self.models = SimpleNamespace(
+            generate_content=self._generate_content,
+            generate_content_stream=self._generate_content_stream
+        )
+    
+    def _create_cache(self, model, config):
+        name = f"cachedContents/{len(self.created) + 1}"
+        self.created.append((name, config.contents[0].parts[0].text))
+        return SimpleNamespace(name=name)
+    
+    def _generate_content(self, model, contents, config):
+        self.requests.append((contents, config.cached_content))
+        if config.cached_content in self.expired:
+            raise errors.APIError(404, {'error': {'code': 404, 'message': 'Cache not found', 'status': 'NOT_FOUND'}})
+        return _response('{"action_items": [], "summary": "ok"}')
+    
+    def _generate_content_stream(self, model, contents, config):
+        return iter([self._generate_content(model, contents, config)])
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = GeminiAnalyzer(api_key="test-key", context_caching=True)
+    analyzer.client = FakeClient()
+    return analyzer
+
+
+def test_expired_context_cache_is_recreated_and_request_resent(analyzer):
+    prompt = analyzer._create_sales_prompt("Adi: I'll send pricing.", "Acme", "")
+    analyzer._send_transcript_prompt(prompt, analyzer.model)
+    analyzer.client.expired.add("cachedContents/1")
+    
+    response = analyzer._send_transcript_prompt(prompt, analyzer.model)
+    
+    assert response.text == '{"action_items": [], "summary": "ok"}'
+    assert [name for name, _ in analyzer.client.created] == ["cachedContents/1", "cachedContents/2"]
+    assert [cache for _, cache in analyzer.client.requests] == [
+        "cachedContents/1", "cachedContents/1", "cachedContents/2"
+    ]
+
+
+def test_streamed_request_recreates_expired_context_cache(analyzer):
+    prompt = analyzer._create_sales_prompt("Adi: I'll send pricing.", "Acme", "")
+    analyzer._send_transcript_prompt(prompt, analyzer.model)
+    analyzer.client.expired.add("cachedContents/1")
+    
+    chunks = list(analyzer._stream_transcript_prompt(prompt, analyzer.model))
+    
+    assert len(chunks) == 1
+    assert analyzer.client.requests[-1][1] == "cachedContents/2"
+
+
+def test_sales_prompts_share_one_context_cache(analyzer):
+    for customer in ("Acme", "Globex", "Initech"):
+        prompt = analyzer._create_sales_prompt("Adi: I'll send pricing.", customer, "")
+        analyzer._send_transcript_prompt(prompt, analyzer.model)
+    
+    assert len(analyzer.client.created) == 1
+    assert "Acme" not in analyzer.client.created[0][1]
+
+
+def test_prefix_with_per_call_values_is_not_context_cached(analyzer):
+    prompt = analyzer._create_sales_prompt("Adi: I'll send pricing.", "Acme", "")
+    prefixed = "Customer: Acme\n" + prompt
+    
+    analyzer._send_transcript_prompt(prefixed, analyzer.model)
+    
+    assert analyzer.client.created == []
+    assert analyzer.client.requests == [(prefixed, None)]
+
+
+def _quick_task_analyzer(monkeypatch, analyzer, interpret):
+    async def detect(**kwargs):
+        return _response('{"task_count": 2, "tasks": ["Call Bob", "Email Ann"]}')
+    monkeypatch.setattr(analyzer, "_generate_content_async", detect)
+    monkeypatch.setattr(analyzer, "_interpret_single_task_async", interpret)
+    return analyzer
+
+
+def test_quick_task_gemini_error_falls_back_for_that_task_only(monkeypatch, analyzer):
+    async def interpret(task_text, context_name, context_type):
+        if task_text == "Call Bob":
+            raise errors.APIError(500, {'error': {'code': 500, 'message': 'boom', 'status': 'INTERNAL'}})
+        return {'title': task_text, 'description': "", 'priority': 'low'}
+    _quick_task_analyzer(monkeypatch, analyzer, interpret)
+    
+    tasks = asyncio.run(analyzer.interpret_quick_tasks_async("Call Bob and email Ann", "Acme", "sales_call"))
+    
+    assert tasks == [
+        analyzer._fallback_quick_task("Call Bob"),
+        {'title': "Email Ann", 'description': "", 'priority': 'low'}
+    ]
+
+
+def test_quick_task_bug_is_raised_not_hidden_by_fallback(monkeypatch, analyzer):
+    async def interpret(task_text, context_name, context_type):
+        raise KeyError("title")
+    _quick_task_analyzer(monkeypatch, analyzer, interpret)
+    
+    with pytest.raises(KeyError):
+        asyncio.run(analyzer.interpret_quick_tasks_async("Call Bob and email Ann", "Acme", "sales_call"))
+
+
+def test_quick_task_batch_checks_each_task_on_its_own(monkeypatch, analyzer):
+    texts = [
+        '{"tasks": [{"title": "Call Bob", "priority": "high"}, "Email Ann", 7, {"description": "no title"}]}',
+        '["not", "an", "object"]',
+        'not json',
+        None
+    ]
+    monkeypatch.setattr(analyzer, "_batch_response_texts", lambda job_name: ("JOB_STATE_SUCCEEDED", texts))
+    
+    state, task_lists = analyzer.get_quick_task_batch("batches/1")
+    
+    assert state == "JOB_STATE_SUCCEEDED"
+    assert task_lists == [
+        [
+            {'title': "Call Bob", 'description': "", 'priority': "high"},
+            analyzer._fallback_quick_task("Email Ann")
+        ],
+        [],
+        [],
+        []
+    ]
+
+
+STREAMED_ANALYSIS = (
+    '{"summary": "Has {braces} and [brackets]", "action_items": ['
+    '{"title": "Send \\"pricing\\" deck", "description": "Ask about {setup} fee]", "priority": "high"},'
+    '{"title": "Book demo", "description": "Path C:\\\\ehr\\\\", "priority": "low"}'
+    '], "participants": ["Adi"], "key_decisions": [], "meeting_title": "Demo"}'
+)
+
+
+def _feed_in_chunks(parser, text, size):
+    items = []
+    for i in range(0, len(text), size):
+        items.extend(parser.feed(text[i:i + size]))
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(STREAMED_ANALYSIS)])
+def test_stream_parser_finds_items_across_chunk_boundaries(size):
+    items = _feed_in_chunks(ActionItemStreamParser(), STREAMED_ANALYSIS, size)
+    
+    assert [item['title'] for item in items] == ['Send "pricing" deck', "Book demo"]
+    assert items[0]['description'] == "Ask about {setup} fee]"
+    assert items[1]['description'] == "Path C:\\ehr\\"
+
+
+def test_stream_parser_reports_each_item_once_as_it_closes():
+    parser = ActionItemStreamParser()
+    first_item_end = STREAMED_ANALYSIS.index('},') + 1
+    
+    assert parser.feed(STREAMED_ANALYSIS[:first_item_end - 1]) == []
+    assert [item['title'] for item in parser.feed(STREAMED_ANALYSIS[first_item_end - 1:first_item_end])] == ['Send "pricing" deck']
+    assert [item['title'] for item in parser.feed(STREAMED_ANALYSIS[first_item_end:])] == ["Book demo"]
+    assert parser.feed("") == []
+
+
+def test_stream_parser_ignores_nested_and_other_arrays():
+    text = (
+        '{"key_decisions": [{"title": "not an item"}], "meta": {"action_items": [{"title": "nested"}]},'
+        ' "action_items": [{"title": "Real", "description": "", "priority": "low"}]}'
+    )
+    
+    assert [item['title'] for item in _feed_in_chunks(ActionItemStreamParser(), text, 5)] == ["Real"]
+
+
+def test_iter_action_items_skips_invalid_items():
+    text = '{"action_items": [{"title": "Real", "description": "d", "priority": "low"}, {"description": "no title"}]}'
+    
+    items = list(GeminiAnalyzer.iter_action_items([text[:20], text[20:]]))
+    
+    assert [item.title for item in items] == ["Real"]
+
+
+def _words(text):
+    return ''.join(text.split())
+
+
+def test_split_transcript_keeps_short_text_whole():
+    assert GeminiAnalyzer._split_transcript("Adi: hello", 100) == ["Adi: hello"]
+
+
+def test_split_transcript_breaks_between_speaker_turns_first():
+    turns = [f"Speaker {i}: " + "word " * 10 for i in range(6)]
+    text = "\n\n".join(turns)
+    
+    parts = GeminiAnalyzer._split_transcript(text, len(turns[0]) * 2 + 2)
+    
+    assert parts == ["\n\n".join(turns[i:i + 2]) for i in range(0, 6, 2)]
+
+
+def test_split_transcript_falls_back_to_sentences_words_and_hard_cuts():
+    text = "Adi will send pricing. Bob asks about billing. " * 20 + "\n\nJanelle: training.\n" + "x" * 250
+    
+    parts = GeminiAnalyzer._split_transcript(text, 100)
+    
+    assert all(len(part) <= 100 for part in parts)
+    assert _words("".join(parts)) == _words(text)
+    assert parts[0].endswith("billing.")
+    assert parts[-3:] == ["x" * 100, "x" * 100, "x" * 50]
+
+
+def test_split_transcript_part_may_end_exactly_at_the_limit():
+    text = "aaaa bbbb cccc"
+    
+    assert GeminiAnalyzer._split_transcript(text, 9) == ["aaaa bbbb", "cccc"]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(gemini_analyzer.time, "monotonic", clock)
+    return clock
+
+
+def _outage():
+    return errors.APIError(503, {'error': {'code': 503, 'message': 'unavailable', 'status': 'UNAVAILABLE'}})
+
+
+def test_breaker_opens_after_threshold_outages(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record(_outage())
+    assert breaker.state == CircuitBreaker.CLOSED
+    
+    breaker.before_call()
+    breaker.record(_outage())
+    
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_breaker_ignores_client_errors_and_resets_on_success(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    breaker.record(_outage())
+    breaker.record(errors.APIError(429, {'error': {'code': 429, 'message': 'busy', 'status': 'RESOURCE_EXHAUSTED'}}))
+    breaker.record(_outage())
+    
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_half_open_lets_one_probe_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record(_outage())
+    
+    clock.now += 30
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    
+    breaker.record()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+
+def test_breaker_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+    for _ in range(5):
+        breaker.record(_outage())
+    clock.now += 31
+    breaker.before_call()
+    
+    breaker.record(_outage())
+    
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 29
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_rate_limiter_waits_once_the_bucket_is_empty(clock):
+    limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=1000)
+    
+    assert limiter.reserve(10) == 0
+    assert limiter.reserve(10) == 0
+    assert limiter.reserve(10) == pytest.approx(30)
+    assert limiter.reserve(10) == pytest.approx(60)
+
+
+def test_rate_limiter_refills_over_time(clock):
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600)
+    assert limiter.reserve(600) == 0
+    assert limiter.reserve(300) == pytest.approx(30)
+    
+    clock.now += 45
+    assert limiter.reserve(0) == pytest.approx(0)
+    assert limiter.reserve(300) == pytest.approx(15)
+
+
+def test_rate_limiter_caps_refill_at_a_full_bucket(clock):
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600)
+    clock.now += 3600
+    
+    assert limiter.reserve(600) == 0
+    assert limiter.reserve(60) == pytest.approx(6)
+
+
+def test_rate_limiter_caps_a_request_larger_than_the_budget(clock):
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600)
+    
+    assert limiter.reserve(10_000) == 0
+    assert limiter.reserve(600) == pytest.approx(60)
@@ -0,0 +1,39 @@
+"""
+Tests for src/llm_cache.py
+"""
+
+from src.llm_cache import SemanticCache
+
+TEMPLATE = "Agenda: pipeline review, onboarding status, open support escalations. "
+
+
+def test_exact_match_ignores_case_and_whitespace():
+    cache = SemanticCache()
+    cache.put("sales", "Adi will send   pricing", "response")
+    
+    assert cache.get_exact("sales", "adi will send pricing") == "response"
+    assert cache.get_exact("internal", "adi will send pricing") is None
+
+
+def test_near_identical_text_of_same_length_matches():
+    cache = SemanticCache()
+    cache.put("sales", TEMPLATE + "Adi will send pricing to Acme.", "response", embedding=[1.0, 0.0, 0.0])
+    
+    assert cache.get_similar("sales", TEMPLATE + "Adi will send pricing to Acme!", [0.999, 0.01, 0.0]) == "response"
+
+
+def test_meeting_sharing_a_template_does_not_match():
+    cache = SemanticCache()
+    cache.put("sales", TEMPLATE + "Adi will send pricing to Acme.", "response", embedding=[1.0, 0.0, 0.0])
+    other = TEMPLATE + "Janelle owns the go-live checklist and will book training for next Tuesday."
+    
+    # Embeddings dominated by the shared template come out nearly identical
+    assert cache.get_similar("sales", other, [0.999, 0.01, 0.0]) is None
+
+
+def test_similar_but_below_threshold_does_not_match():
+    cache = SemanticCache()
+    text = TEMPLATE + "Adi will send pricing to Acme."
+    cache.put("sales", text, "response", embedding=[1.0, 0.0, 0.0])
+    
+    assert cache.get_similar("sales", text, [0.97, 0.24, 0.0]) is None
@@ -0,0 +1,60 @@
+"""
+Tests for src/pdf_processor.py
+"""
+
+import threading
+from contextlib import nullcontext
+
+import fitz
+import pytest
+
+from src import pdf_processor
+from src.pdf_processor import PDFProcessor
+
+
+def _pdf_bytes(page_texts) -> bytes:
+    doc = fitz.open()
+    for text in page_texts:
+        doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_each_extractor_reads_every_page():
+    data = _pdf_bytes(["Adi will send pricing", "Janelle schedules training"])
+    processor = PDFProcessor()
+    
+    for method in ("pymupdf", "pdfplumber", "pypdf2"):
+        text, method_used = processor.extract_text(data, method=method)
+        assert "send pricing" in text and "schedules training" in text
+        assert method_used == method
+
+
+def test_extraction_stops_at_slow_page_on_one_thread(monkeypatch):
+    monkeypatch.setattr(pdf_processor, "PAGE_TIMEOUT_SECONDS", 0.2)
+    release = threading.Event()
+    threads = set()
+    
+    def extract_page(page):
+        threads.add(threading.get_ident())
+        if page == "slow":
+            release.wait(5)
+        return page
+    
+    processor = PDFProcessor()
+    text = processor._extract_pages(lambda: nullcontext(["one", "two", "slow", "four"]), extract_page)
+    release.set()
+    
+    assert text == "one\ntwo"
+    assert processor.skipped_pages == 2
+    assert len(threads) == 1
+    assert processor._method_label("pdfplumber") == "pdfplumber (stopped at a slow page; 2 page(s) unread)"
+
+
+def test_worker_errors_are_raised():
+    def extract_page(page):
+        raise ValueError("bad page")
+    
+    with pytest.raises(ValueError):
+        PDFProcessor()._extract_pages(lambda: nullcontext(["one"]), extract_page)
@@ -0,0 +1,27 @@
+"""
+Tests for src/sync_runner.py
+"""
+
+import asyncio
+
+import pytest
+
+from src.sync_runner import run_sync
+
+
+async def _answer():
+    return 42
+
+
+def test_runs_coroutine_without_event_loop():
+    assert run_sync(_answer(), "answer", "answer_async") == 42
+
+
+def test_refuses_to_run_inside_event_loop():
+    async def caller():
+        coro = _answer()
+        with pytest.raises(RuntimeError, match=r"await answer_async\(\)"):
+            run_sync(coro, "answer", "answer_async")
+        assert coro.cr_frame is None  # closed, so no "never awaited" warning
+    
+    asyncio.run(caller())